@@ -14,19 +14,90 @@ Task 1. Рекурсивне сортування файлів за розшир
    python3 sort_files.py
    → SRC  = ~/Downloads/test_src  (створить демо-файли, якщо теки немає)
      DEST = ./dist (поруч зі скриптом)
+
+Інкрементальність: у DEST ведеться маніфест (.sort_manifest.jsonl) —
+для кожного файлу: шлях у SRC, розмір, mtime та куди його скопійовано.
+Повторний запуск обробляє лише нові/змінені файли, а перерваний —
+продовжує з місця зупинки без дублікатів __copyN.
+   python3 sort_files.py SRC [DEST] --no-manifest   # вимкнути маніфест
+
+Дедуплікація (--dedup link|skip): однакові за вмістом файли копіюються один
+раз, решта стають жорсткими посиланнями на першу копію (link) або
+пропускаються (skip). Кандидати відбираються за розміром, далі — хеш
+першого й останнього блоків, і лише для збігів — повний потоковий хеш.
+Хешування йде у пулі потоків (--workers) паралельно з копіюванням.
+
+Режим перенесення (--mode):
+   copy     – копія (os.copy_file_range у ядрі; інакше shutil.copy2) — за замовчуванням
+   move     – os.rename (на іншій ФС — копія + видалення)
+   hardlink – os.link (на іншій ФС або без підтримки — копія)
+   reflink  – клон блоків через ioctl FICLONE (btrfs/XFS/…; інакше — copy)
+
+Конфлікти імен (__copyN) розв'язуються через NameIndex: вміст кожної
+теки DEST/<ext> читається один раз (os.scandir), далі вільне ім'я
+видається з пам'яті за O(1) без перебору stat-викликів.
+
+Архівний режим (--archive tar|zip, --compression none|gz|bz2|xz, --level N):
+замість окремого файлу на кожен вхідний файл кожна тека-кошик пишеться
+потоком в один архів DEST/<ext>.tar[.gz] / DEST/<ext>.zip (окремий потік-
+записувач на кошик). Поруч — індекс <архів>.idx.json зі зміщеннями членів,
+тож extract_member() дістає один файл без сканування архіву. Індекс пишеться
+лише для форматів з довільним доступом: zip (кожен член стиснений окремо) і
+tar без стиснення; у .tar.gz/.bz2/.xz дійти до члена можна лише розпакувавши
+все перед ним.
+Маніфест в архівному режимі не ведеться (архіви перебудовуються щоразу).
 """
 
 from __future__ import annotations
 import argparse
+import bz2
+import hashlib
+import json
+import os
+import queue
 import shutil
+import struct
+import tarfile
+import zipfile
+import zlib
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from collections import Counter
+from collections import Counter, defaultdict
 import sys
+import threading
+
+try:  # лише Unix; без fcntl reflink зводиться до звичайної копії
+    import fcntl
+except ImportError:
+    fcntl = None
 
 # Шляхи для авто-режиму
 AUTO_SRC  = Path("~/Downloads/test_src").expanduser()
 AUTO_DEST = Path(__file__).parent / "dist"
 
+# Маніфест у корені DEST
+MANIFEST_NAME = ".sort_manifest.jsonl"
+
+# Дедуплікація: розмір блоку для часткового хешу та буфер потокового читання
+HASH_BLOCK = 64 * 1024
+HASH_CHUNK = 1024 * 1024
+
+# Режими перенесення файлів та ioctl для клонування (linux/fs.h: _IOW(0x94, 9, int))
+MODES = ("copy", "move", "hardlink", "reflink")
+FICLONE = 0x40049409
+
+# Архівний режим: стиснення tar-потоку та відповідні методи zip
+ARCHIVE_FORMATS = ("tar", "zip")
+COMPRESSIONS = ("none", "gz", "bz2", "xz")
+ZIP_METHODS = {
+    "none": zipfile.ZIP_STORED,
+    "gz": zipfile.ZIP_DEFLATED,
+    "bz2": zipfile.ZIP_BZIP2,
+    "xz": zipfile.ZIP_LZMA,
+}
+INDEX_SUFFIX = ".idx.json"
+
 
 def is_subpath(child: Path, parent: Path) -> bool:
     """True, якщо child знаходиться всередині parent (з урахуванням resolve())."""
@@ -37,10 +108,296 @@ def is_subpath(child: Path, parent: Path) -> bool:
         return False
 
 
-def safe_copy(src_file: Path, dst_dir: Path) -> None:
-    """Копіює файл у підпапку, уникаючи перезапису (file__copyN.ext)."""
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    target = dst_dir / src_file.name
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    dest: str
+    done: bool = True
+    moved: bool = False  # src перенесено (--mode move): у dest лежить саме він, а не копія
+
+
+class Manifest:
+    """
+    Журнал уже відсортованих файлів у DEST (append-only JSON Lines).
+
+    Кожен рядок — {"src", "size", "mtime_ns", "dest", "done"[, "moved"]} (dest — відносно
+    кореня DEST); останній запис для src перемагає. Перед копіюванням пишемо запис з done=false, після —
+    з done=true: якщо запуск перервано посередині, наступний перезапише той
+    самий dest замість створення нового __copyN. Dest, на який посилаються
+    кілька src (дублікати з --dedup skip), на місці не перезаписується.
+    Під час завантаження і в close() журнал ущільнюється до одного рядка на файл.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.root = path.parent
+        self.entries: dict[str, ManifestEntry] = {}
+        self.refs: Counter = Counter()  # dest → скільки src на нього посилаються
+        self.skipped = 0
+        self._lines = 0
+        self._fh = None
+
+    @classmethod
+    def load(cls, dest_root: Path) -> "Manifest":
+        m = cls(dest_root / MANIFEST_NAME)
+        if m.path.exists():
+            with m.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                        m.entries[rec["src"]] = ManifestEntry(
+                            rec["size"], rec["mtime_ns"], rec["dest"], rec["done"],
+                            rec.get("moved", False),
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue  # обірваний останній рядок після аварійного завершення
+                    m._lines += 1
+            m.refs.update(e.dest for e in m.entries.values())
+            if m._lines > len(m.entries):
+                m.compact()
+        return m
+
+    def lookup(self, key: str) -> Path | None:
+        """Куди файл було (або мало бути) скопійовано попереднім запуском."""
+        e = self.entries.get(key)
+        return self.root / e.dest if e is not None else None
+
+    def target_for(self, key: str) -> Path | None:
+        """Куди записати нову версію src на місці старої. None — якщо запису немає,
+        якщо на той самий dest посилається ще інший src (дублікат у --dedup skip)
+        або якщо src уже перенесено туди (--mode move): тоді за цим шляхом у SRC
+        лежить інший файл, а dest — єдина копія попереднього, і затирати її не можна."""
+        e = self.entries.get(key)
+        if e is None or self.refs[e.dest] > 1:
+            return None
+        target = self.root / e.dest
+        if e.moved and target.exists():
+            return None
+        return target
+
+    def is_current(self, key: str, st: os.stat_result) -> bool:
+        """True, якщо файл уже скопійовано і він не змінився з того часу."""
+        e = self.entries.get(key)
+        return (
+            e is not None
+            and e.done
+            and e.size == st.st_size
+            and e.mtime_ns == st.st_mtime_ns
+            and (self.root / e.dest).exists()
+        )
+
+    def record(self, key: str, st: os.stat_result, dest: Path, moved: bool = False) -> None:
+        """Одразу завершений запис (файл нікуди не копіюється, напр. дублікат)."""
+        rel = os.path.relpath(dest, self.root)
+        self._append(key, ManifestEntry(st.st_size, st.st_mtime_ns, rel, True, moved))
+
+    def begin(self, key: str, st: os.stat_result, dest: Path, moved: bool = False) -> None:
+        rel = os.path.relpath(dest, self.root)
+        self._append(key, ManifestEntry(st.st_size, st.st_mtime_ns, rel, False, moved))
+
+    def commit(self, key: str) -> None:
+        e = self.entries[key]
+        self._append(key, ManifestEntry(e.size, e.mtime_ns, e.dest, True, e.moved))
+
+    def _append(self, key: str, entry: ManifestEntry) -> None:
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = self.path.open("a", encoding="utf-8")
+        prev = self.entries.get(key)
+        if prev is not None:
+            self.refs[prev.dest] -= 1
+        self.refs[entry.dest] += 1
+        self.entries[key] = entry
+        self._fh.write(_manifest_line(key, entry))
+        self._fh.flush()  # запис має пережити падіння процесу
+        self._lines += 1
+
+    def compact(self) -> None:
+        """Переписує журнал атомарно: по одному рядку на кожен src."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for key, entry in self.entries.items():
+                f.write(_manifest_line(key, entry))
+        os.replace(tmp, self.path)
+        self._lines = len(self.entries)
+
+    def destinations(self) -> list[Path]:
+        return [self.root / e.dest for e in self.entries.values()]
+
+    def close(self) -> None:
+        if self._fh is not None or self._lines > len(self.entries):
+            self.compact()
+
+
+def _manifest_line(key: str, e: ManifestEntry) -> str:
+    rec = {"src": key, "size": e.size, "mtime_ns": e.mtime_ns, "dest": e.dest, "done": e.done}
+    if e.moved:
+        rec["moved"] = True
+    return json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def _partial_digest(path: Path, size: int) -> bytes:
+    """Хеш першого та останнього блоків. Для файлів <= 2 блоків це хеш усього вмісту."""
+    h = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as f:
+        h.update(f.read(HASH_BLOCK))
+        if size > HASH_BLOCK:
+            f.seek(max(HASH_BLOCK, size - HASH_BLOCK))
+            h.update(f.read(HASH_BLOCK))
+    return h.digest()
+
+
+def _full_digest(path: Path) -> bytes:
+    """Потоковий хеш усього файлу (пам'ять — один буфер HASH_CHUNK)."""
+    h = hashlib.blake2b(digest_size=32)
+    with path.open("rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            h.update(chunk)
+    return h.digest()
+
+
+def collect_files(src: Path) -> list[Path]:
+    """Рекурсивно збирає звичайні файли SRC (симлінки пропускає, як і process_dir)."""
+    files: list[Path] = []
+    try:
+        entries = list(src.iterdir())
+    except OSError as e:
+        print(f"[err] OS error: {src} ({e})", flush=True)
+        return files
+    for entry in entries:
+        try:
+            if entry.is_symlink():
+                continue
+            if entry.is_dir():
+                files.extend(collect_files(entry))  # рекурсія
+            elif entry.is_file():
+                files.append(entry)
+        except OSError:
+            continue
+    return files
+
+
+class _SizeGroup:
+    """Файли одного розміру-кандидата: часткові хеші та план повних хешів.
+    plan завершується, щойно готові всі часткові хеші групи: key → хеш вмісту,
+    Future повного хешу (для збігів) або None (унікальний вміст / помилка читання)."""
+
+    def __init__(self, size: int, paths: dict[str, Path]) -> None:
+        self.size = size
+        self.paths = paths
+        self.partials: dict[str, Future] = {}
+        self.remaining = len(paths)
+        self.plan: Future = Future()
+
+
+class Deduper:
+    """
+    Пошук однакових за вмістом файлів серед SRC:
+    1) групи за розміром (файли з унікальним розміром не читаються взагалі);
+    2) усередині групи — хеш першого й останнього блоків (у пулі потоків,
+       стартує одразу і йде паралельно з копіюванням);
+    3) щойно часткові хеші групи готові, для збігів у той самий пул ставиться
+       повний потоковий хеш — теж паралельно з копіюванням.
+    process_dir чекає на результат лише тоді, коли дійшов до файлу з групи.
+    """
+
+    def __init__(self, files: list[Path], link: bool, workers: int | None = None) -> None:
+        self.link = link
+        self.duplicates = 0
+        self.saved_bytes = 0
+        self._placed: dict[bytes, Path] = {}
+        self._digest: dict[str, bytes | None] = {}
+        self._groups: dict[str, _SizeGroup] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+        by_size: dict[int, list[Path]] = defaultdict(list)
+        for f in files:
+            try:
+                size = f.stat().st_size
+            except OSError:
+                continue
+            if size > 0:  # порожні файли не дають економії
+                by_size[size].append(f)
+        for size, paths in by_size.items():
+            if len(paths) < 2:
+                continue
+            group = _SizeGroup(size, {str(p.absolute()): p for p in paths})
+            for k, p in group.paths.items():
+                self._groups[k] = group
+                group.partials[k] = self._pool.submit(_partial_digest, p, size)
+            for fut in group.partials.values():
+                fut.add_done_callback(lambda _f, g=group: self._on_partial(g))
+
+    def _on_partial(self, group: _SizeGroup) -> None:
+        """Колбек часткового хешу; останній у групі планує повні хеші для збігів."""
+        with self._lock:
+            group.remaining -= 1
+            if group.remaining:
+                return
+        ties: dict[bytes, list[str]] = defaultdict(list)
+        plan: dict[str, bytes | Future | None] = {}
+        for k, fut in group.partials.items():
+            if fut.cancelled() or fut.exception() is not None:
+                plan[k] = None
+            else:
+                ties[fut.result()].append(k)
+        for partial, ks in ties.items():
+            for k in ks:
+                if len(ks) == 1:
+                    plan[k] = None
+                elif group.size <= 2 * HASH_BLOCK:
+                    plan[k] = partial  # частковий хеш уже покрив увесь файл
+                else:
+                    try:
+                        plan[k] = self._pool.submit(_full_digest, group.paths[k])
+                    except RuntimeError:
+                        plan[k] = None  # пул уже зупинено (close)
+        group.plan.set_result(plan)
+
+    def digest(self, key: str) -> bytes | None:
+        """Хеш вмісту, якщо у файлу є потенційні дублікати; інакше None."""
+        group = self._groups.get(key)
+        if group is None:
+            return None
+        if key not in self._digest:
+            self._resolve(group)
+        return self._digest[key]
+
+    def _resolve(self, group: _SizeGroup) -> None:
+        for k, d in group.plan.result().items():
+            if isinstance(d, Future):
+                try:
+                    d = d.result()
+                except (OSError, CancelledError):
+                    d = None
+            self._digest[k] = d
+
+    def original_of(self, key: str) -> Path | None:
+        """Куди вже покладено файл з таким самим вмістом (або None)."""
+        d = self.digest(key)
+        return self._placed.get(d) if d is not None else None
+
+    def remember(self, key: str, dest: Path) -> None:
+        d = self.digest(key)
+        if d is not None:
+            self._placed.setdefault(d, dest)
+
+    def count(self, size: int) -> None:
+        self.duplicates += 1
+        self.saved_bytes += size
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+def free_target(dst_dir: Path, name: str) -> Path:
+    """Повертає вільне ім'я у dst_dir, уникаючи перезапису (file__copyN.ext)."""
+    target = dst_dir / name
     if target.exists():
         stem, suffix = target.stem, target.suffix
         i = 1
@@ -50,12 +407,209 @@ def safe_copy(src_file: Path, dst_dir: Path) -> None:
                 target = candidate
                 break
             i += 1
-    shutil.copy2(src_file, target)
-    print(f"[copy] {src_file} -> {target}", flush=True)
+    return target
+
+
+class NameIndex:
+    """
+    Індекс зайнятих імен у теках призначення (DEST/<ext>).
+
+    Кожна тека сканується один раз через os.scandir; далі reserve() видає
+    вільне ім'я з пам'яті: для кожного базового імені зберігається наступний
+    номер __copyN, тож k однакових імен коштують O(k) замість O(k²) stat-ів.
+    Захищений замком — безпечний для паралельного копіювання.
+    """
+
+    def __init__(self, scan: bool = True) -> None:
+        self._scan = scan  # False — кошики лише в пам'яті (імена членів архіву)
+        self._taken: dict[Path, set[str]] = {}
+        self._next: dict[tuple[Path, str], int] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, dst_dir: Path) -> set[str]:
+        taken = self._taken.get(dst_dir)
+        if taken is None:
+            taken = set()
+            if self._scan:
+                dst_dir.mkdir(parents=True, exist_ok=True)
+                with os.scandir(dst_dir) as it:
+                    taken = {e.name for e in it}
+            self._taken[dst_dir] = taken
+        return taken
+
+    def claim(self, target: Path) -> None:
+        """Позначає ім'я зайнятим (напр. dest із маніфесту, ще не створений на диску)."""
+        with self._lock:
+            self._bucket(target.parent).add(target.name)
+
+    def reserve(self, dst_dir: Path, name: str) -> Path:
+        """Повертає вільне ім'я у dst_dir (file__copyN.ext) і одразу його займає."""
+        with self._lock:
+            taken = self._bucket(dst_dir)
+            if name not in taken:
+                taken.add(name)
+                return dst_dir / name
+            p = Path(name)
+            stem, suffix = p.stem, p.suffix
+            i = self._next.get((dst_dir, name), 1)
+            while (candidate := f"{stem}__copy{i}{suffix}") in taken:
+                i += 1  # імена, що вже лежали на диску, пропускаємо один раз
+            self._next[(dst_dir, name)] = i + 1
+            taken.add(candidate)
+            return dst_dir / candidate
+
+
+def _copy_range(src_file: Path, target: Path) -> None:
+    """Копія через os.copy_file_range (дані не проходять через user space;
+    на btrfs/XFS/NFS ядро може зробити reflink або server-side copy)."""
+    if not hasattr(os, "copy_file_range"):
+        shutil.copy2(src_file, target)
+        return
+    try:
+        with src_file.open("rb") as fsrc, target.open("wb") as fdst:
+            left = os.fstat(fsrc.fileno()).st_size
+            while left > 0:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), left)
+                if n == 0:
+                    break
+                left -= n
+    except OSError:
+        # EXDEV на старих ядрах, EINVAL/ENOSYS на окремих ФС — звичайна копія
+        shutil.copy2(src_file, target)
+        return
+    shutil.copystat(src_file, target)
+
+
+def _reflink(src_file: Path, target: Path) -> bool:
+    """Клон файлу (copy-on-write) через ioctl FICLONE. True, якщо ФС це вміє."""
+    if fcntl is None:
+        return False
+    try:
+        with src_file.open("rb") as fsrc, target.open("wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+    shutil.copystat(src_file, target)
+    return True
+
+
+def transfer(src_file: Path, target: Path, mode: str = "copy") -> str:
+    """Переносить src_file у target обраним способом; якщо ФС не вміє
+    дешевшу операцію — відкочується до копії. Повертає фактичну дію."""
+    if mode == "move":
+        try:
+            os.rename(src_file, target)
+            return "move"
+        except OSError:
+            shutil.move(src_file, target)  # інша ФС: копія + видалення
+            return "move"
+    if mode == "hardlink":
+        try:
+            os.link(src_file, target)
+            return "hardlink"
+        except OSError:
+            pass
+    elif mode == "reflink" and _reflink(src_file, target):
+        return "reflink"
+    _copy_range(src_file, target)
+    return "copy"
+
+
+def safe_copy(
+    src_file: Path, dst_dir: Path, target: Path | None = None, mode: str = "copy"
+) -> Path:
+    """Копіює файл у підпапку, уникаючи перезапису (file__copyN.ext).
+    Якщо target задано (відомий з маніфесту) — копіює саме туди.
+    mode — copy / move / hardlink / reflink (див. transfer)."""
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    if target is None:
+        target = free_target(dst_dir, src_file.name)
+    elif target.exists():
+        target.unlink()  # не писати поверх inode, який може бути жорстким посиланням
+    op = transfer(src_file, target, mode)
+    print(f"[{op}] {src_file} -> {target}", flush=True)
+    return target
+
+
+def safe_link(
+    original: Path, src_file: Path, dst_dir: Path, target: Path, mode: str = "copy"
+) -> bool:
+    """Створює target як жорстке посилання на original (уже у DEST).
+    Якщо ФС не підтримує посилань — переносить src_file у режимі mode.
+    True, якщо вийшло посилання."""
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    if target.exists():
+        target.unlink()
+    try:
+        os.link(original, target)
+    except OSError:
+        safe_copy(src_file, dst_dir, target, mode)
+        return False
+    print(f"[link] {src_file} -> {target} (== {original})", flush=True)
+    if mode == "move":
+        src_file.unlink()
+    return True
 
 
-def process_dir(src: Path, dest_root: Path) -> Counter:
-    """Рекурсивно обходить SRC і копіює файли до DEST/<ext>/..."""
+def sort_file(
+    src_file: Path,
+    dst_dir: Path,
+    manifest: Manifest | None = None,
+    dedup: Deduper | None = None,
+    mode: str = "copy",
+    names: NameIndex | None = None,
+) -> bool:
+    """Кладе один файл у dst_dir з урахуванням маніфесту, дедуплікації та режиму
+    перенесення (у режимі move дублікат у SRC видаляється). Повертає False, якщо файл пропущено (не змінився або є дублікатом у режимі skip)."""
+    key = str(src_file.absolute())
+    st = src_file.stat()
+    if manifest is not None and manifest.is_current(key, st):
+        manifest.skipped += 1
+        if dedup is not None:
+            dedup.remember(key, manifest.lookup(key))
+        return False
+
+    original = dedup.original_of(key) if dedup is not None else None
+    if original is not None and not dedup.link:
+        dedup.count(st.st_size)
+        print(f"[dup] {src_file} == {original}", flush=True)
+        if manifest is not None:
+            manifest.record(key, st, original, moved=mode == "move")
+        if mode == "move":
+            src_file.unlink()
+        return False
+
+    # змінений або недокопійований файл перезаписуємо на тому ж місці
+    # (крім уже перенесених у --mode move — див. Manifest.target_for)
+    target = manifest.target_for(key) if manifest is not None else None
+    if target is None and names is not None:
+        target = names.reserve(dst_dir, src_file.name)
+    elif target is None:
+        target = free_target(dst_dir, src_file.name)
+    if manifest is not None:
+        manifest.begin(key, st, target, moved=mode == "move")
+    if original is not None:
+        if safe_link(original, src_file, dst_dir, target, mode):
+            dedup.count(st.st_size)
+    else:
+        safe_copy(src_file, dst_dir, target, mode)
+        if dedup is not None:
+            dedup.remember(key, target)
+    if manifest is not None:
+        manifest.commit(key)
+    return True
+
+
+def process_dir(
+    src: Path,
+    dest_root: Path,
+    manifest: Manifest | None = None,
+    dedup: Deduper | None = None,
+    mode: str = "copy",
+    names: NameIndex | None = None,
+) -> Counter:
+    """Рекурсивно обходить SRC і переносить файли до DEST/<ext>/... (див. --mode)"""
     stats = Counter()
     for entry in src.iterdir():
         try:
@@ -63,11 +617,11 @@ def process_dir(src: Path, dest_root: Path) -> Counter:
                 print(f"[skip] symlink: {entry}", flush=True)
                 continue
             if entry.is_dir():
-                stats.update(process_dir(entry, dest_root))  # рекурсія
+                stats.update(process_dir(entry, dest_root, manifest, dedup, mode, names))  # рекурсія
             elif entry.is_file():
                 ext = entry.suffix.lower().lstrip(".") or "no_ext"
-                safe_copy(entry, dest_root / ext)
-                stats[ext] += 1
+                if sort_file(entry, dest_root / ext, manifest, dedup, mode, names):
+                    stats[ext] += 1
             else:
                 print(f"[skip] невідомий тип: {entry}", flush=True)
         except PermissionError as e:
@@ -79,6 +633,204 @@ def process_dir(src: Path, dest_root: Path) -> Counter:
     return stats
 
 
+def archive_path(dest_root: Path, ext: str, fmt: str, compression: str) -> Path:
+    if fmt == "zip":
+        return dest_root / f"{ext}.zip"
+    return dest_root / (f"{ext}.tar" if compression == "none" else f"{ext}.tar.{compression}")
+
+
+class _BucketWriter(threading.Thread):
+    """Потік, що послідовно дописує файли одного кошика в його архів
+    і наприкінці зберігає індекс зміщень членів (якщо формат дозволяє seek)."""
+
+    def __init__(self, path: Path, fmt: str, compression: str, level: int | None, maxsize: int) -> None:
+        super().__init__(name=f"archive:{path.name}", daemon=True)
+        self.path = path
+        self.fmt = fmt
+        self.compression = compression
+        self.level = level
+        self.queue: queue.Queue[tuple[Path, str] | None] = queue.Queue(maxsize=maxsize)
+        self.members: dict[str, list[int]] = {}
+        self.written = 0
+
+    def _open(self):
+        if self.fmt == "zip":
+            # strict_timestamps=False: mtime до 1980 року zip не вміщує — обрізається до 1980-01-01
+            return zipfile.ZipFile(
+                self.path, "w", ZIP_METHODS[self.compression], compresslevel=self.level,
+                strict_timestamps=False,
+            )
+        if self.compression == "none":
+            return tarfile.open(self.path, "w")
+        if self.compression == "xz":
+            return tarfile.open(self.path, "w:xz", preset=self.level)
+        kw = {} if self.level is None else {"compresslevel": self.level}
+        return tarfile.open(self.path, f"w:{self.compression}", **kw)
+
+    def _add(self, arc, src_file: Path, name: str) -> None:
+        if self.fmt == "zip":
+            arc.write(src_file, name)
+            info = arc.infolist()[-1]
+            self.members[name] = [info.header_offset, info.file_size, info.compress_size, info.compress_type]
+            return
+        ti = arc.gettarinfo(src_file, name)
+        with src_file.open("rb") as f:
+            arc.addfile(ti, f)
+        # після addfile arc.offset стоїть за вирівняними (512 Б) даними члена
+        data_offset = arc.offset - -(-ti.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+        self.members[name] = [data_offset, ti.size]
+
+    @property
+    def indexed(self) -> bool:
+        return self.fmt == "zip" or self.compression == "none"
+
+    def run(self) -> None:
+        try:
+            arc = self._open()
+        except Exception as e:
+            print(f"[err] {self.path} ({e})", flush=True)
+            arc = None
+        try:
+            # черга вичищається до кінця за будь-яких помилок — інакше продюсер
+            # назавжди заблокується на put() у повну чергу
+            while (item := self.queue.get()) is not None:
+                if arc is None:
+                    continue
+                src_file, name = item
+                try:
+                    self._add(arc, src_file, name)
+                    self.written += 1
+                    print(f"[{self.fmt}] {src_file} -> {self.path}:{name}", flush=True)
+                except OSError as e:
+                    print(f"[err] OS error: {src_file} ({e})", flush=True)
+                except Exception as e:
+                    print(f"[err] Unexpected: {src_file} ({e})", flush=True)
+        finally:
+            if arc is not None:
+                self._finish(arc)
+
+    def _finish(self, arc) -> None:
+        """Закриває архів (zip дописує центральний каталог) і зберігає індекс."""
+        try:
+            arc.close()
+        except Exception as e:
+            print(f"[err] {self.path} ({e})", flush=True)
+            return
+        if not self.indexed:
+            return
+        index = {"format": self.fmt, "compression": self.compression, "members": self.members}
+        Path(str(self.path) + INDEX_SUFFIX).write_text(
+            json.dumps(index, ensure_ascii=False, separators=(",", ":")), encoding="utf-8"
+        )
+
+
+class BucketArchiver:
+    """
+    Архівний режим: кожен кошик DEST/<ext> стає одним архівом, який пише
+    власний потік-записувач (черга обмежена — пам'ять стала). Імена членів
+    унікалізуються так само, як у теках (file__copyN.ext).
+    """
+
+    def __init__(
+        self,
+        dest_root: Path,
+        fmt: str = "tar",
+        compression: str = "none",
+        level: int | None = None,
+        maxsize: int = 256,
+    ) -> None:
+        self.dest_root = dest_root
+        self.fmt = fmt
+        self.compression = compression
+        self.level = level
+        self.maxsize = maxsize
+        self.names = NameIndex(scan=False)
+        self._writers: dict[str, _BucketWriter] = {}
+
+    def add(self, src_file: Path, ext: str) -> Path:
+        """Ставить файл у чергу свого кошика; повертає шлях <архів>/<член>."""
+        w = self._writers.get(ext)
+        if w is None:
+            self.dest_root.mkdir(parents=True, exist_ok=True)
+            path = archive_path(self.dest_root, ext, self.fmt, self.compression)
+            w = _BucketWriter(path, self.fmt, self.compression, self.level, self.maxsize)
+            w.start()
+            self._writers[ext] = w
+        name = self.names.reserve(Path(ext), src_file.name).name
+        while True:
+            try:
+                w.queue.put((src_file, name), timeout=1.0)
+                break
+            except queue.Full:
+                if not w.is_alive():  # записувач аварійно завершився — не чекаємо вічно
+                    raise OSError(f"записувач {w.path} зупинився") from None
+        return w.path / name
+
+    def close(self) -> Counter:
+        """Дочікується всіх записувачів; повертає кількість записаних файлів по кошиках."""
+        for w in self._writers.values():
+            w.queue.put(None)
+        stats = Counter()
+        for ext, w in self._writers.items():
+            w.join()
+            if w.written:
+                stats[ext] = w.written
+        return stats
+
+
+def archive_dir(src: Path, archiver: BucketArchiver, dedup: Deduper | None = None) -> None:
+    """Рекурсивно обходить SRC і передає файли у записувачі архівів (DEST/<ext>.*)."""
+    for entry in collect_files(src):
+        ext = entry.suffix.lower().lstrip(".") or "no_ext"
+        try:
+            key = str(entry.absolute())
+            original = dedup.original_of(key) if dedup is not None else None
+            if original is not None:
+                dedup.count(entry.stat().st_size)
+                print(f"[dup] {entry} == {original}", flush=True)
+                continue
+            member = archiver.add(entry, ext)
+            if dedup is not None:
+                dedup.remember(key, member)
+        except OSError as e:
+            print(f"[err] OS error: {entry} ({e})", flush=True)
+
+
+def extract_member(archive: Path, name: str) -> bytes:
+    """Дістає один член архіву за індексом <архів>.idx.json — без сканування архіву.
+    Індекс є лише для zip і нестисненого tar (див. _BucketWriter.indexed)."""
+    index_path = Path(str(archive) + INDEX_SUFFIX)
+    if not index_path.exists():
+        raise ValueError(
+            f"{archive}: немає індексу {INDEX_SUFFIX} — стиснений tar не має довільного "
+            "доступу (потрібне розпакування всього перед членом); використайте --archive zip"
+        )
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    entry = index["members"][name]
+    if index["format"] == "tar":
+        offset, size = entry
+        with open(archive, "rb") as f:
+            f.seek(offset)
+            return f.read(size)
+
+    header_offset, size, csize, method = entry
+    with open(archive, "rb") as f:
+        f.seek(header_offset)
+        header = f.read(zipfile.sizeFileHeader)
+        name_len, extra_len = struct.unpack("<HH", header[26:30])
+        f.seek(name_len + extra_len, os.SEEK_CUR)
+        raw = f.read(csize)
+    if method == zipfile.ZIP_STORED:
+        return raw
+    if method == zipfile.ZIP_DEFLATED:
+        return zlib.decompress(raw, -15)
+    if method == zipfile.ZIP_BZIP2:
+        return bz2.decompress(raw)
+    # LZMA у zip має власний заголовок властивостей — довіряємо zipfile
+    with zipfile.ZipFile(archive) as zf:
+        return zf.read(name)
+
+
 def ensure_demo_src(src: Path) -> Path:
     """Створює демо-набір файлів у SRC, якщо теки не існує."""
     if not src.exists():
@@ -92,13 +844,13 @@ def ensure_demo_src(src: Path) -> Path:
     return src
 
 
-def parse_args_or_none() -> tuple[Path | None, Path | None]:
+def parse_args_or_none() -> argparse.Namespace | None:
     """
-    Повертає (src, dest), якщо передані CLI-аргументи.
-    Якщо скрипт запущено без аргументів — (None, None) → авто-режим.
+    Повертає розібрані CLI-аргументи.
+    Якщо скрипт запущено без аргументів — None → авто-режим.
     """
     if len(sys.argv) == 1:
-        return None, None
+        return None
     p = argparse.ArgumentParser(description="Recursive file sorter by extension")
     p.add_argument("src", type=Path, help="Шлях до вихідної директорії")
     p.add_argument(
@@ -108,18 +860,62 @@ def parse_args_or_none() -> tuple[Path | None, Path | None]:
         default=Path("dist"),
         help="Шлях до директорії призначення (default=./dist)",
     )
-    a = p.parse_args()
-    return a.src, a.dest
+    p.add_argument(
+        "--no-manifest",
+        action="store_true",
+        help=f"Не вести маніфест {MANIFEST_NAME} (копіювати все щоразу)",
+    )
+    p.add_argument(
+        "--dedup",
+        choices=("link", "skip"),
+        help="Однакові за вмістом файли: жорстке посилання на першу копію або пропуск",
+    )
+    p.add_argument(
+        "--mode",
+        choices=MODES,
+        default="copy",
+        help="Спосіб перенесення: copy (default), move, hardlink, reflink",
+    )
+    p.add_argument(
+        "--archive",
+        choices=ARCHIVE_FORMATS,
+        help="Писати кожен кошик DEST/<ext> в один архів (tar або zip) з індексом зміщень",
+    )
+    p.add_argument(
+        "--compression",
+        choices=COMPRESSIONS,
+        default="none",
+        help="Стиснення архіву: none (default), gz, bz2, xz",
+    )
+    p.add_argument(
+        "--level",
+        type=int,
+        default=None,
+        help="Рівень стиснення (gz/bz2: 1-9, xz: 0-9)",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Кількість потоків для хешування у --dedup (default: як у ThreadPoolExecutor)",
+    )
+    return p.parse_args()
 
 
 def main() -> None:
-    src, dest = parse_args_or_none()
+    args = parse_args_or_none()
 
-    if src is None and dest is None:
+    if args is None:
         # Авто-режим (зручно для швидкого запуску)
         src, dest = ensure_demo_src(AUTO_SRC), AUTO_DEST
+        use_manifest, dedup_mode, workers, mode = True, None, None, "copy"
+        archive_fmt = None
         print("[mode] auto", flush=True)
     else:
+        src, dest = args.src, args.dest
+        use_manifest, dedup_mode, workers = not args.no_manifest, args.dedup, args.workers
+        mode = args.mode
+        archive_fmt, compression, level = args.archive, args.compression, args.level
         print("[mode] cli", flush=True)
 
     if not src.is_dir():
@@ -131,21 +927,61 @@ def main() -> None:
         print("❌ Шляхи src та dest перетинаються. Обери іншу директорію призначення.", flush=True)
         return
 
+    if archive_fmt and mode != "copy":
+        print("❌ Архівний режим підтримує лише --mode copy.", flush=True)
+        return
+
     dest.mkdir(parents=True, exist_ok=True)
     print(f"[src]  {src.resolve()}", flush=True)
     print(f"[dest] {dest.resolve()}", flush=True)
-    print("[run] Починаю рекурсивне копіювання...\n", flush=True)
+    print(f"[run] Починаю рекурсивне перенесення (mode={mode})...\n", flush=True)
 
-    stats = process_dir(src, dest)
+    manifest = Manifest.load(dest) if use_manifest and not archive_fmt else None
+    dedup = None
+    if dedup_mode:
+        # в архіві жорстких посилань немає — дублікати просто не записуються
+        link = dedup_mode == "link" and not archive_fmt
+        dedup = Deduper(collect_files(src), link=link, workers=workers)
+    try:
+        if archive_fmt:
+            archiver = BucketArchiver(dest, archive_fmt, compression, level)
+            try:
+                archive_dir(src, archiver, dedup)
+            finally:
+                stats = archiver.close()
+        else:
+            names = NameIndex()
+            if manifest is not None:
+                # імена з маніфесту (навіть ще не докопійовані) не віддаємо новим файлам
+                for target in manifest.destinations():
+                    names.claim(target)
+            stats = process_dir(src, dest, manifest, dedup, mode, names)
+    finally:
+        if manifest is not None:
+            manifest.close()
+        if dedup is not None:
+            dedup.close()
 
     print("\n=== Підсумок ===", flush=True)
     total = sum(stats.values())
     if total == 0:
-        print("⚠️ Файлів не знайдено", flush=True)
+        if manifest is not None and manifest.skipped:
+            print("⚠️ Нових або змінених файлів не знайдено", flush=True)
+        else:
+            print("⚠️ Файлів не знайдено", flush=True)
     else:
         for ext, cnt in sorted(stats.items()):
             print(f"{ext:>8}: {cnt}", flush=True)
         print(f"Σ Разом: {total}", flush=True)
+    if manifest is not None and manifest.skipped:
+        print(f"[manifest] без змін, пропущено: {manifest.skipped}", flush=True)
+    if dedup is not None:
+        action = "посилань" if dedup.link else "пропущено"
+        print(
+            f"[dedup] дублікатів ({action}): {dedup.duplicates}, "
+            f"заощаджено: {dedup.saved_bytes} байт",
+            flush=True,
+        )
     print(f"\n[done] Перевір папку: {dest.resolve()}", flush=True)
 
 
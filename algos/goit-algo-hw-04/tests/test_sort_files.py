@@ -0,0 +1,280 @@
+# tests/test_sort_files.py
+import json
+import os
+import sys
+import tarfile
+import threading
+import zipfile
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import sort_files  # noqa: E402
+from sort_files import MANIFEST_NAME, Manifest  # noqa: E402
+
+
+def run(monkeypatch, src, dest, *flags):
+    """Запускає sort_files у CLI-режимі з заданими аргументами."""
+    monkeypatch.setattr(sys, "argv", ["sort_files.py", str(src), str(dest), *flags])
+    sort_files.main()
+
+
+def names(path):
+    return sorted(p.name for p in path.iterdir())
+
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.txt").write_text("alpha", encoding="utf-8")
+    (src / "sub" / "a.txt").write_text("beta", encoding="utf-8")
+    (src / "b.py").write_text("print(1)", encoding="utf-8")
+    return src, tmp_path / "dest"
+
+
+# ------------------------------ маніфест (user-026) ------------------------------ #
+
+def test_rerun_skips_unchanged_files(monkeypatch, tree):
+    src, dest = tree
+    run(monkeypatch, src, dest)
+    assert names(dest / "txt") == ["a.txt", "a__copy1.txt"]
+    run(monkeypatch, src, dest)
+    assert names(dest / "txt") == ["a.txt", "a__copy1.txt"]  # без нових __copyN
+    manifest = Manifest.load(dest)
+    assert len(manifest.entries) == 3
+    assert all(e.done for e in manifest.entries.values())
+
+
+def test_changed_file_is_rewritten_in_place(monkeypatch, tree):
+    src, dest = tree
+    run(monkeypatch, src, dest)
+    target = Manifest.load(dest).lookup(str((src / "a.txt").absolute()))
+    (src / "a.txt").write_text("alpha v2", encoding="utf-8")
+    os.utime(src / "a.txt", ns=(1, 1))
+    run(monkeypatch, src, dest)
+    assert target.read_text(encoding="utf-8") == "alpha v2"
+    assert names(dest / "txt") == ["a.txt", "a__copy1.txt"]
+
+
+def test_interrupted_run_resumes_at_recorded_dest(monkeypatch, tree):
+    src, dest = tree
+    key = str((src / "b.py").absolute())
+    manifest = Manifest.load(dest)
+    # запис begin без commit — так виглядає маніфест після падіння посеред копіювання
+    manifest.begin(key, (src / "b.py").stat(), dest / "py" / "b__copy7.py")
+    manifest._fh.close()
+    run(monkeypatch, src, dest)
+    assert names(dest / "py") == ["b__copy7.py"]
+    assert Manifest.load(dest).entries[key].done
+
+
+def test_manifest_tolerates_torn_last_line_and_compacts(tmp_path):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    line = {"src": "/x", "size": 1, "mtime_ns": 2, "dest": "txt/x", "done": False}
+    done = dict(line, done=True)
+    (dest / MANIFEST_NAME).write_text(
+        json.dumps(line) + "\n" + json.dumps(done) + "\n" + '{"src": "/y", "si',
+        encoding="utf-8",
+    )
+    manifest = Manifest.load(dest)
+    assert list(manifest.entries) == ["/x"] and manifest.entries["/x"].done
+    assert len((dest / MANIFEST_NAME).read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_no_manifest_copies_everything_again(monkeypatch, tree):
+    src, dest = tree
+    run(monkeypatch, src, dest, "--no-manifest")
+    run(monkeypatch, src, dest, "--no-manifest")
+    assert not (dest / MANIFEST_NAME).exists()
+    assert len(names(dest / "txt")) == 4
+
+
+# ---------------------------- дедуплікація (user-027) ---------------------------- #
+
+def make_big(path, middle):
+    # однакові перший і останній блоки, різна середина — частковий хеш збігається
+    block = b"x" * sort_files.HASH_BLOCK
+    path.write_bytes(block + middle + block)
+
+
+def test_dedup_link_makes_hardlinks_only_for_equal_content(monkeypatch, tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    make_big(src / "a.bin", b"1" * 100)
+    make_big(src / "b.bin", b"1" * 100)
+    make_big(src / "c.bin", b"2" * 100)
+    run(monkeypatch, src, dest, "--dedup", "link")
+    ino = {p.name: p.stat().st_ino for p in (dest / "bin").iterdir()}
+    assert ino["a.bin"] == ino["b.bin"] != ino["c.bin"]
+
+
+def test_full_digests_are_scheduled_before_resolve(tmp_path):
+    for name, middle in (("a", b"1"), ("b", b"1"), ("c", b"2"), ("d", b"3" * 10)):
+        make_big(tmp_path / name, middle)
+    files = sorted(tmp_path.iterdir())
+    dedup = sort_files.Deduper(files, link=True, workers=2)
+    try:
+        group = dedup._groups[str(files[0].absolute())]
+        plan = group.plan.result(timeout=10)  # без жодного виклику digest()
+        # a, b, c мають однаковий частковий хеш — повні хеші вже в пулі
+        assert all(isinstance(plan[str(p.absolute())], sort_files.Future) for p in files[:3])
+        digests = [dedup.digest(str(p.absolute())) for p in files]
+        assert digests[0] == digests[1] != digests[2]
+        assert digests[3] is None  # унікальний розмір — не читається взагалі
+    finally:
+        dedup.close()
+
+
+def test_dedup_skip_keeps_duplicate_content_after_original_changes(monkeypatch, tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    (src / "a.txt").write_text("same", encoding="utf-8")
+    (src / "b.txt").write_text("same", encoding="utf-8")
+    run(monkeypatch, src, dest, "--dedup", "skip")
+    assert len(names(dest / "txt")) == 1
+    (src / "a.txt").write_text("new!", encoding="utf-8")
+    os.utime(src / "a.txt", ns=(1, 1))
+    run(monkeypatch, src, dest, "--dedup", "skip")
+    contents = sorted(p.read_text(encoding="utf-8") for p in (dest / "txt").iterdir())
+    assert contents == ["new!", "same"]  # вміст b.txt досі є в DEST
+    manifest = Manifest.load(dest)
+    b_dest = manifest.lookup(str((src / "b.txt").absolute()))
+    assert b_dest.read_text(encoding="utf-8") == "same"
+
+
+# ----------------------------- режими --mode (user-028) ----------------------------- #
+
+@pytest.mark.parametrize("mode", sort_files.MODES)
+def test_modes_place_same_content(monkeypatch, tree, mode):
+    src, dest = tree
+    inode = (src / "b.py").stat().st_ino
+    run(monkeypatch, src, dest, "--mode", mode)
+    assert (dest / "py" / "b.py").read_text(encoding="utf-8") == "print(1)"
+    assert sorted(p.read_text(encoding="utf-8") for p in (dest / "txt").iterdir()) == ["alpha", "beta"]
+    if mode == "move":
+        assert not (src / "b.py").exists()
+    else:
+        assert (src / "b.py").exists()
+    if mode == "hardlink":
+        assert (dest / "py" / "b.py").stat().st_ino == inode
+
+
+def test_move_does_not_overwrite_previously_moved_file(monkeypatch, tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    (src / "report.txt").write_text("first", encoding="utf-8")
+    run(monkeypatch, src, dest, "--mode", "move")
+    (src / "report.txt").write_text("second", encoding="utf-8")
+    run(monkeypatch, src, dest, "--mode", "move")
+    assert (dest / "txt" / "report.txt").read_text(encoding="utf-8") == "first"
+    assert (dest / "txt" / "report__copy1.txt").read_text(encoding="utf-8") == "second"
+
+
+def test_copy_still_rewrites_changed_source_in_place(monkeypatch, tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    (src / "report.txt").write_text("first", encoding="utf-8")
+    run(monkeypatch, src, dest, "--mode", "hardlink")
+    (src / "report.txt").unlink()  # нова версія — новий inode, старе посилання в DEST лишається
+    (src / "report.txt").write_text("second", encoding="utf-8")
+    run(monkeypatch, src, dest, "--mode", "copy")
+    assert names(dest / "txt") == ["report.txt"]
+    assert (dest / "txt" / "report.txt").read_text(encoding="utf-8") == "second"
+
+
+# ------------------------------ NameIndex (user-029) ------------------------------ #
+
+def test_name_index_skips_names_already_on_disk(tmp_path):
+    for name in ("README", "README__copy1", "README__copy3"):
+        (tmp_path / name).touch()
+    index = sort_files.NameIndex()
+    got = [index.reserve(tmp_path, "README").name for _ in range(4)]
+    assert got == ["README__copy2", "README__copy4", "README__copy5", "README__copy6"]
+    assert index.reserve(tmp_path, "new.txt").name == "new.txt"
+    assert index.reserve(tmp_path, "new.txt").name == "new__copy1.txt"
+
+
+def test_name_index_claim_and_agreement_with_free_target(tmp_path):
+    (tmp_path / "b.txt").touch()  # тека сканується один раз — при першому зверненні
+    index = sort_files.NameIndex()
+    index.claim(tmp_path / "a.txt")  # ім'я з маніфесту, на диску його ще немає
+    assert index.reserve(tmp_path, "a.txt").name == "a__copy1.txt"
+    assert index.reserve(tmp_path, "b.txt") == sort_files.free_target(tmp_path, "b.txt")
+
+
+def test_name_index_without_scan_stays_in_memory(tmp_path):
+    index = sort_files.NameIndex(scan=False)
+    assert [index.reserve(tmp_path / "txt", "x.txt").name for _ in range(3)] == [
+        "x.txt", "x__copy1.txt", "x__copy2.txt"
+    ]
+    assert not (tmp_path / "txt").exists()
+
+
+# ----------------------------- архівний режим (user-030) ----------------------------- #
+
+@pytest.mark.parametrize("fmt,compression", [("tar", "none"), ("zip", "none"), ("zip", "gz"), ("zip", "bz2"), ("zip", "xz")])
+def test_extract_member_matches_source(tmp_path, fmt, compression):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    (src / "sub").mkdir(parents=True)
+    payloads = {"a.txt": b"alpha" * 1000, "sub/a.txt": os.urandom(3000), "b.txt": b""}
+    for rel, data in payloads.items():
+        (src / rel).write_bytes(data)
+    archiver = sort_files.BucketArchiver(dest, fmt, compression, maxsize=1)
+    sort_files.archive_dir(src, archiver)
+    assert archiver.close() == {"txt": 3}
+    archive = sort_files.archive_path(dest, "txt", fmt, compression)
+    index = json.loads((dest / (archive.name + sort_files.INDEX_SUFFIX)).read_text(encoding="utf-8"))
+    got = sorted(sort_files.extract_member(archive, name) for name in index["members"])
+    assert got == sorted(payloads.values())
+
+
+def test_zip_archive_survives_pre_1980_mtimes(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    for i in range(50):
+        f = src / f"f{i}.txt"
+        f.write_text(str(i), encoding="utf-8")
+        os.utime(f, (0, 0))  # 1970 — zip такого часу не вміщує
+    archiver = sort_files.BucketArchiver(dest, "zip", maxsize=2)
+    done = []
+    worker = threading.Thread(
+        target=lambda: (sort_files.archive_dir(src, archiver), done.append(archiver.close())), daemon=True
+    )
+    worker.start()
+    worker.join(timeout=30)
+    assert done == [{"txt": 50}], "архівування зависло або втратило файли"
+    with zipfile.ZipFile(dest / "txt.zip") as zf:  # центральний каталог дописано
+        assert len(zf.namelist()) == 50
+    assert sort_files.extract_member(dest / "txt.zip", "f7.txt") == b"7"
+
+
+def test_writer_keeps_draining_after_member_error(tmp_path):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "ok.txt").write_text("ok", encoding="utf-8")
+    archiver = sort_files.BucketArchiver(tmp_path / "dest", "tar", maxsize=1)
+    for _ in range(5):
+        archiver.add(src / "missing.txt", "txt")  # OSError у записувачі, черга не зупиняється
+    archiver.add(src / "ok.txt", "txt")
+    assert archiver.close() == {"txt": 1}
+    assert sort_files.extract_member(tmp_path / "dest" / "txt.tar", "ok.txt") == b"ok"
+
+
+def test_compressed_tar_has_no_index(tmp_path):
+    src, dest = tmp_path / "src", tmp_path / "dest"
+    src.mkdir()
+    (src / "a.txt").write_text("alpha", encoding="utf-8")
+    archiver = sort_files.BucketArchiver(dest, "tar", "gz")
+    sort_files.archive_dir(src, archiver)
+    archiver.close()
+    with tarfile.open(dest / "txt.tar.gz") as tf:
+        assert tf.extractfile("a.txt").read() == b"alpha"
+    assert not (dest / ("txt.tar.gz" + sort_files.INDEX_SUFFIX)).exists()
+    with pytest.raises(ValueError):
+        sort_files.extract_member(dest / "txt.tar.gz", "a.txt")
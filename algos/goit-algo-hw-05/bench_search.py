@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Бенчмарк пошуку підрядка: KMP / Boyer–Moore–Horspool / Rabin–Karp
+Бенчмарк пошуку підрядка: KMP / Boyer–Moore–Horspool / Rabin–Karp / Boyer–Moore / Two-Way
 
 Джерела текстів:
 - або локальні файли (CLI: --file двічі, або авто-режим з ./data/стаття 1.txt і ./data/стаття 2.txt),
@@ -20,25 +20,114 @@
 2) З файлами:
    python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --repeats 5
 
+3) Багато шаблонів (K слів із тексту): Aho–Corasick проти K проходів *_finditer
+   кожного з одношаблонних алгоритмів (усі входження з обох боків):
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --multi 1000
+
+4) Усі входження (найчастіше слово тексту): генератори *_finditer проти
+   повторних викликів *_search на зрізах text[pos:]:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --all-matches
+
+5) Скомпільовані шаблони (compile_pattern): окремо час препроцесингу
+   (LPS / таблиця зсувів / хеш шаблону) і час сканування:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --compiled
+
+6) Пошук у bytes через mmap (лише для --file / data/): без read_text і декодування:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --mmap
+
+7) Суфіксний індекс (suffix_index.py): побудова SA+LCP один раз, запити O(m log n),
+   і точка беззбитковості — після скількох запитів індекс окупається проти сканування:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --index
+
+8) Адверсарні тексти з низькою ентропією ("aaaa…b", N символів):
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --adversarial 200000
+
+9) Векторний Rabin–Karp на numpy (CodepointText): кодування тексту один раз,
+   хеші всіх вікон — префіксними сумами; плюс K шаблонів однієї довжини разом:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --numpy
+
+10) Паралельний пошук (parallel_search) на 1, 2, 4 … N процесах: текст-рядок
+   і файл через mmap; ефективність масштабування = T1 / (k · Tk):
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --parallel 8 --parallel-mb 64
+
+11) Офлайн і відтворювано: тексти з --url кешуються в .corpus_cache/ (повторний
+   запуск і --offline мережі не торкаються); --synthetic — синтетичний корпус
+   замість статей (розмір алфавіту, довжина, повторюваність, seed):
+   python3 bench_search.py --synthetic --syn-n 500000 --syn-alphabet 4 --syn-repeat 0.5 --seed 1
+
+12) Сітка параметрів на синтетичному корпусі: довжина шаблону × алфавіт ×
+   позиція першого входження (start/middle/end/absent), з базовою лінією str.find;
+   --json — охайна таблиця (один рядок = один замір) для відстеження регресій:
+   python3 bench_search.py --synthetic --sweep --sweep-m 4,16,64 --sweep-alphabet 2,4,26 --json sweep.json
+
+13) Наближений пошук Bitap (Wu–Manber) з k помилками — усі збіги, час на символ
+   тексту для різних k і довжин шаблону, відстані Геммінга і Левенштейна:
+   python3 bench_search.py --file "data/стаття 1.txt" --file "data/стаття 2.txt" --bitap --bitap-k 0,1,2,4 --bitap-m 8,32,128
+
+14) Колекція документів (ngram_index.py): триграмний інвертований індекс над
+   каталогом, запит = перетин постингів + перевірка кандидатів; порівняння з
+   переглядом усіх файлів. Якщо каталогу немає — генерується синтетичний:
+   python3 bench_search.py --synthetic --corpus-dir corpus --corpus-docs 2000 --corpus-queries 50
+
 Алгоритми та логіка вимірювань: timeit, мінімум із N повторів.
 """
 
 from __future__ import annotations
 import argparse
 import csv
+import hashlib
+import json
+import os
+import platform
+import sys
+import random
 import re
+import tempfile
 import timeit
+from collections import Counter
 from pathlib import Path
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, Iterator, List, Tuple
 from urllib import request, parse, error
 
-from search_algorithms import kmp_search, bmh_search, rabin_karp_search
+from search_algorithms import (
+    kmp_search, bmh_search, rabin_karp_search, bm_search, two_way_search, AhoCorasick,
+    kmp_finditer, bmh_finditer, rabin_karp_finditer, bm_finditer, two_way_finditer,
+    COMPILED, compile_pattern, mmap_search, parallel_search,
+    bitap_finditer, BITAP_DISTANCES,
+    CodepointText, np,
+)
+from suffix_index import SuffixIndex
+from ngram_index import NgramIndex, read_doc
 
 
 ALGOS: Dict[str, Callable[[str, str], int]] = {
     "KMP": kmp_search,
     "Boyer–Moore–Horspool": bmh_search,
     "Rabin–Karp": rabin_karp_search,
+    "Boyer–Moore": bm_search,
+    "Two-Way": two_way_search,
+}
+
+FINDITERS: Dict[str, Callable[..., Iterator[int]]] = {
+    "KMP": kmp_finditer,
+    "Boyer–Moore–Horspool": bmh_finditer,
+    "Rabin–Karp": rabin_karp_finditer,
+    "Boyer–Moore": bm_finditer,
+    "Two-Way": two_way_finditer,
+}
+
+# назва в ALGOS -> ключ у search_algorithms.COMPILED
+ALGO_KEYS: Dict[str, str] = {
+    "KMP": "kmp",
+    "Boyer–Moore–Horspool": "bmh",
+    "Rabin–Karp": "rabin_karp",
+    "Boyer–Moore": "bm",
+    "Two-Way": "two_way",
+}
+
+# str.find — базова лінія (C-реалізація); у переможців і середніх не враховується
+BASELINES: Dict[str, Callable[[str, str], int]] = {
+    "str.find": str.find,
 }
 
 # -------------------- Завантаження тексту з URL (Drive view → direct) -------------------- #
@@ -78,6 +167,105 @@ def fetch_text_from_url(url: str) -> str:
             continue
     return raw.decode("utf-8", errors="replace")
 
+CACHE_DIR = Path(__file__).resolve().parent / ".corpus_cache"
+
+def fetch_text_cached(url: str, cache_dir: Path = CACHE_DIR, offline: bool = False) -> str:
+    """fetch_text_from_url із локальним кешем: ключ — хеш прямого URL.
+    offline=True — лише з кешу (FileNotFoundError, якщо тексту там немає)."""
+    direct = _drive_direct_url(url)
+    path = cache_dir / (hashlib.sha1(direct.encode("utf-8")).hexdigest()[:16] + ".txt")
+    if path.exists():
+        return path.read_text(encoding="utf-8")
+    if offline:
+        raise FileNotFoundError(f"немає в кеші {cache_dir}: {url}")
+    text = fetch_text_from_url(url)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+    return text
+
+# ---------------------------- Синтетичний корпус ---------------------------- #
+
+SYN_ALPHABET = "абвгґдеєжзиіїйклмнопрстуфхцчшщьюяabcdefghijklmnopqrstuvwxyz0123456789 "
+SYN_BLOCK = 32
+
+def syn_alphabet(size: int) -> str:
+    if size <= len(SYN_ALPHABET):
+        return SYN_ALPHABET[:max(1, size)]
+    return SYN_ALPHABET + "".join(chr(0x4E00 + i) for i in range(size - len(SYN_ALPHABET)))
+
+def synthetic_text(n: int, alphabet: int = 26, repetitiveness: float = 0.0, seed: int = 0) -> str:
+    """Текст довжини n над першими `alphabet` символами SYN_ALPHABET.
+
+    Блоками по SYN_BLOCK: з імовірністю repetitiveness блок копіюється з уже
+    згенерованої частини (як у LZ77), інакше — рівномірно випадкові символи.
+    Той самий seed дає той самий текст."""
+    rnd = random.Random(seed)
+    chars = syn_alphabet(alphabet)
+    buf: List[str] = []
+    while len(buf) < n:
+        b = min(SYN_BLOCK, n - len(buf))
+        if len(buf) >= b and rnd.random() < repetitiveness:
+            i = rnd.randrange(len(buf) - b + 1)
+            buf.extend(buf[i:i + b])
+        else:
+            buf.extend(rnd.choices(chars, k=b))
+    return "".join(buf)
+
+SWEEP_POSITIONS = (("start", 0.0), ("middle", 0.5), ("end", 1.0), ("absent", None))
+
+def sweep_case(text: str, m: int, where: float | None, alphabet: int, rnd: random.Random) -> Tuple[str, str] | None:
+    """(text, pattern) з першим входженням шаблону близько частки `where` тексту.
+
+    Шаблон — випадковий рядок над тим самим алфавітом; вставляється на місце
+    тексту. Для малих алфавітів і коротких шаблонів він може природно зустрітися
+    раніше — фактичне місце видно в колонці hit_at. absent: None, якщо за 50 спроб
+    не вдалося підібрати відсутній шаблон."""
+    chars = syn_alphabet(alphabet)
+    if where is None:
+        for _ in range(50):
+            pat = "".join(rnd.choices(chars, k=m))
+            if pat not in text:
+                return text, pat
+        return None
+    pat = "".join(rnd.choices(chars, k=m))
+    at = min(len(text) - m, int(where * len(text)))
+    return text[:at] + pat + text[at + m:], pat
+
+def bench_sweep(
+    n: int,
+    alphabets: List[int],
+    lengths: List[int],
+    repetitiveness: float,
+    seed: int,
+    repeats: int,
+) -> List[dict]:
+    """Сітка: алфавіт × довжина шаблону × позиція входження; усі ALGOS + str.find."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    rnd = random.Random(seed)
+    for a in alphabets:
+        text = synthetic_text(n, a, repetitiveness, seed)
+        for m in lengths:
+            for pos, where in SWEEP_POSITIONS:
+                case = sweep_case(text, m, where, a, rnd)
+                if case is None:
+                    print(f"[info] sweep: alphabet={a}, m={m}: відсутній шаблон не знайдено — пропускаю")
+                    continue
+                txt, pat = case
+                hit = txt.find(pat)
+                hit_at = round(hit / len(txt), 4) if hit >= 0 else None
+                for name, fn in {**ALGOS, **BASELINES}.items():
+                    t = bench_once(fn, txt, pat, repeats=repeats)
+                    rows.append({
+                        "file": f"synthetic Σ={a}", "pattern_type": f"{pos} m={m}", "pattern": pat, "algo": name, key: t,
+                        "position": pos, "n": n, "alphabet": a, "repetitiveness": repetitiveness, "m": m, "hit_at": hit_at,
+                        "ns_per_char": round(t * 1e9 / n, 3),
+                    })
+                    print(f"[run] Σ={a:3d} | m={m:4d} | {pos:6s} | {name:21s} -> {t:.6f} s")
+    return rows
+
 # -------------------------------- Утиліти -------------------------------- #
 
 def read_text(p: Path, encoding: str = "utf-8") -> str:
@@ -102,10 +290,356 @@ def bench_once(fn: Callable[[str, str], int], text: str, pattern: str, repeats:
     timer = timeit.Timer(lambda: fn(text, pattern))
     return min(timer.repeat(repeat=repeats, number=1))
 
+def bench_call(fn: Callable[[], object], repeats: int) -> float:
+    return min(timeit.Timer(fn).repeat(repeat=repeats, number=1))
+
+def sample_words(text: str, k: int, seed: int = 0) -> List[str]:
+    """K різних слів (довжина >= 3) з тексту — набір ключових слів для multi-сценарію."""
+    words = sorted({w for w in re.findall(r"\w{3,}", text)})
+    rnd = random.Random(seed)
+    return rnd.sample(words, min(k, len(words)))
+
+def multi_by_finditer(finditer: Callable[..., Iterator[int]], text: str, patterns: List[str]) -> List[Tuple[str, int]]:
+    """Усі (шаблон, зміщення) — як у AhoCorasick.findall, але K окремими проходами."""
+    return [(p, i) for p in patterns for i in finditer(text, p)]
+
+def bench_multi(label: str, text: str, k: int, repeats: int) -> List[dict]:
+    """Один прохід Aho–Corasick (побудова + сканування) проти K проходів кожного алгоритму.
+    Обидві сторони знаходять УСІ входження всіх шаблонів; множини збігів звіряються."""
+    patterns = sample_words(text, k)
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    build = bench_call(lambda: AhoCorasick(patterns), repeats)
+    ac = AhoCorasick(patterns)
+    scan = bench_call(lambda: ac.findall(text), repeats)
+    expected = set(ac.findall(text))
+    timings = [("Aho–Corasick", build + scan)]
+    for name, finditer in FINDITERS.items():
+        got = set(multi_by_finditer(finditer, text, patterns))
+        assert got == expected, f"{name}: збіги відрізняються від Aho–Corasick"
+        t = bench_call(lambda: multi_by_finditer(finditer, text, patterns), repeats)
+        timings.append((f"{name} ×{len(patterns)}", t))
+    for name, t in timings:
+        rows.append({
+            "file": label,
+            "pattern_type": "multi",
+            "pattern": f"{len(patterns)} keywords",
+            "algo": name,
+            key: t,
+        })
+        print(f"[run] {label:8s} | multi   | {name:21s} -> {t:.6f} s")
+    print(f"[info] {label}: Aho–Corasick build {build:.6f} s + scan {scan:.6f} s")
+    return rows
+
+def most_common_word(text: str) -> str:
+    words = Counter(re.findall(r"\w{3,}", text))
+    return words.most_common(1)[0][0] if words else auto_present(text, 3)
+
+def all_by_reslicing(fn: Callable[[str, str], int], text: str, pattern: str) -> List[int]:
+    """Усі входження через повторний пошук першого збігу на зрізі text[pos:] (квадратично)."""
+    found: List[int] = []
+    pos = 0
+    while True:
+        i = fn(text[pos:], pattern)
+        if i < 0:
+            return found
+        found.append(pos + i)
+        pos += i + 1
+
+def bench_all_matches(label: str, text: str, repeats: int) -> List[dict]:
+    """Усі входження частого слова: лінивий *_finditer проти повторних *_search на зрізах."""
+    pattern = most_common_word(text)
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    for name, fn in ALGOS.items():
+        finditer = FINDITERS.get(name)
+        variants = [(f"{name} (re-slice)", lambda: all_by_reslicing(fn, text, pattern))]
+        if finditer is not None:
+            variants.insert(0, (f"{name} finditer", lambda: sum(1 for _ in finditer(text, pattern))))
+        for algo, call in variants:
+            t = bench_call(call, repeats)
+            rows.append({
+                "file": label,
+                "pattern_type": "all",
+                "pattern": pattern,
+                "algo": algo,
+                key: t,
+            })
+            print(f"[run] {label:8s} | all     | {algo:21s} -> {t:.6f} s")
+    hits = sum(1 for _ in kmp_finditer(text, pattern))
+    print(f"[info] {label}: '{pattern}' — {hits} входжень")
+    return rows
+
+def bench_compiled(cases: List[Tuple[str, str, str, str]], repeats: int) -> List[dict]:
+    """Для кожного кейсу: час компіляції шаблону (без кешу) і час самого сканування."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    for label, txt, pat, ptype in cases:
+        for name, algo in ALGO_KEYS.items():
+            cls = COMPILED[algo]
+            prep = bench_call(lambda: cls(pat), repeats)
+            cp = cls(pat)
+            scan = bench_call(lambda: cp.search(txt), repeats)
+            rows.append({
+                "file": label,
+                "pattern_type": ptype,
+                "pattern": pat,
+                "algo": f"{name} (compiled)",
+                key: prep + scan,
+                "prep_s": prep,
+                "scan_s": scan,
+            })
+            share = prep / (prep + scan) * 100 if prep + scan else 0.0
+            print(f"[run] {label:8s} | {ptype:7s} | {name:21s} -> prep {prep:.6f} s | scan {scan:.6f} s | prep {share:4.1f}%")
+    return rows
+
+def bench_mmap(cases: List[Tuple[str, Path, str, str]], repeats: int) -> List[dict]:
+    """Пошук UTF-8 байтів шаблону прямо у файлі через mmap (включно з відкриттям файлу)
+    проти read_text (читання + декодування) — для порівняння з рядковими прогонами."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    for label, path, pat, ptype in cases:
+        pat_b = pat.encode("utf-8")
+        decode = bench_call(lambda: read_text(path), repeats)
+        print(f"[info] {label}: read_text (читання + декодування) {decode:.6f} s")
+        for name, algo in ALGO_KEYS.items():
+            t = bench_call(lambda: mmap_search(path, pat_b, algo), repeats)
+            rows.append({
+                "file": label,
+                "pattern_type": ptype,
+                "pattern": pat,
+                "algo": f"{name} (mmap bytes)",
+                key: t,
+                "read_text_s": decode,
+            })
+            print(f"[run] {label:8s} | {ptype:7s} | {name + ' (mmap)':21s} -> {t:.6f} s")
+    return rows
+
+def bench_index(label: str, text: str, patterns: List[Tuple[str, str]], base_rows: List[dict], repeats: int) -> List[dict]:
+    """Побудова SuffixIndex + час запитів; break-even = build / (scan - query) запитів."""
+    key = f"time_s_min_of_{repeats}"
+    build = bench_call(lambda: SuffixIndex(text), 1)  # побудова дорога — один прогін
+    index = SuffixIndex(text)
+    rows: List[dict] = [{
+        "file": label, "pattern_type": "build", "pattern": "", "algo": "Suffix array", key: build,
+    }]
+    print(f"[run] {label:8s} | build   | {'Suffix array':21s} -> {build:.6f} s")
+    query_times = []
+    for pat, ptype in patterns:
+        t = bench_call(lambda: index.search(pat), repeats)
+        query_times.append(t)
+        rows.append({"file": label, "pattern_type": ptype, "pattern": pat, "algo": "Suffix array", key: t})
+        print(f"[run] {label:8s} | {ptype:7s} | {'Suffix array':21s} -> {t:.6f} s")
+    query = sum(query_times) / len(query_times)
+
+    scans: Dict[str, List[float]] = {}
+    for r in base_rows:
+        if r["file"] == label:
+            scans.setdefault(r["algo"], []).append(r[key])
+    for algo, ts in scans.items():
+        scan = sum(ts) / len(ts)
+        if scan > query:
+            print(f"[break-even] {label}: vs {algo:21s} -> {build / (scan - query):,.0f} запитів")
+        else:
+            print(f"[break-even] {label}: vs {algo:21s} -> індекс не окупається")
+    return rows
+
+def bench_adversarial(n: int, m: int, repeats: int) -> List[dict]:
+    """Текст "a"*n + "b": шаблони з довгим спільним суфіксом/префіксом, на яких
+    Horspool порівнює майже все вікно при кожному зсуві на 1."""
+    text = "a" * n + "b"
+    cases = [
+        ("a^(m-1)b", "a" * (m - 1) + "b"),  # є лише в кінці тексту
+        ("ba^(m-1)", "b" + "a" * (m - 1)),  # відсутній; суфікс a^(m-1) збігається всюди
+    ]
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    label = f"a^{n}b"
+    for ptype, pat in cases:
+        for name, fn in ALGOS.items():
+            t = bench_once(fn, text, pat, repeats=repeats)
+            rows.append({"file": label, "pattern_type": ptype, "pattern": pat, "algo": name, key: t})
+            print(f"[run] {label:8s} | {ptype:9s} | {name:21s} -> {t:.6f} s")
+    return rows
+
+def bench_numpy(cases: List[Tuple[str, str, str, str]], k: int, m: int, repeats: int) -> List[dict]:
+    """Чистий Rabin–Karp проти numpy: із кодуванням тексту і на вже закодованому;
+    і K шаблонів довжини m: find_many проти Aho–Corasick."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    encoded: Dict[str, CodepointText] = {}
+    for label, txt, pat, ptype in cases:
+        if label not in encoded:
+            encoded[label] = CodepointText(txt)
+        ct = encoded[label]
+        timings = [
+            ("Rabin–Karp (pure)", bench_call(lambda: list(rabin_karp_finditer(txt, pat)), repeats)),
+            ("Rabin–Karp (numpy)", bench_call(lambda: CodepointText(txt).findall(pat), repeats)),
+            ("Rabin–Karp (numpy, pre-encoded)", bench_call(lambda: ct.findall(pat), repeats)),
+        ]
+        for name, t in timings:
+            rows.append({"file": label, "pattern_type": ptype, "pattern": pat, "algo": name, key: t})
+            print(f"[run] {label:8s} | {ptype:7s} | {name:31s} -> {t:.6f} s")
+
+    for label, ct in encoded.items():
+        txt = ct.text
+        rnd = random.Random(0)
+        starts = [rnd.randrange(max(1, len(txt) - m)) for _ in range(k)]
+        patterns = list(dict.fromkeys(txt[i:i + m] for i in starts))
+        ac = AhoCorasick(patterns)
+        timings = [
+            ("Aho–Corasick", bench_call(lambda: ac.findall(txt), repeats)),
+            ("numpy find_many", bench_call(lambda: ct.find_many(patterns), repeats)),
+        ]
+        for name, t in timings:
+            rows.append({"file": label, "pattern_type": f"multi_m{m}", "pattern": f"{len(patterns)} patterns", "algo": name, key: t})
+            print(f"[run] {label:8s} | {len(patterns)}×m={m} | {name:31s} -> {t:.6f} s")
+    return rows
+
+def bench_parallel(text: str, patterns: List[Tuple[str, str]], max_workers: int, algo: str, repeats: int) -> List[dict]:
+    """parallel_search на 1, 2, 4 … max_workers процесах: для рядка (шматки пиклються)
+    і для файлу (кожен процес відкриває його через mmap). Ефективність = T1 / (k · Tk)."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    counts = [1]
+    while counts[-1] * 2 < max_workers:
+        counts.append(counts[-1] * 2)
+    if max_workers > 1:
+        counts.append(max_workers)
+    label = f"{len(text) / 2**20:.0f}M chars"
+    data = text.encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "corpus.txt"
+        path.write_bytes(data)
+        for source, src, pat_of in (
+            ("str", text, lambda p: p),
+            ("mmap", path, lambda p: p.encode("utf-8")),
+        ):
+            for pat, ptype in patterns:
+                pat = pat_of(pat)
+                t1 = None
+                for k in counts:
+                    t = bench_call(lambda: parallel_search(src, pat, algo, k), repeats)
+                    t1 = t1 or t
+                    eff = t1 / (k * t)
+                    rows.append({
+                        "file": label, "pattern_type": ptype, "pattern": pat if isinstance(pat, str) else pat.decode("utf-8"),
+                        "algo": f"parallel {algo} ({source})", "workers": k, key: t, "efficiency": round(eff, 3),
+                    })
+                    print(f"[run] {label:8s} | {ptype:7s} | {source:4s} × {k:2d} -> {t:.6f} s  (speedup {t1 / t:.2f}, eff {eff:.2f})")
+    return rows
+
+def write_csv(rows: List[dict], path: Path) -> None:
+    fieldnames: List[str] = []
+    for r in rows:  # сценарії можуть мати різні колонки — беремо об'єднання
+        fieldnames.extend(k for k in r if k not in fieldnames)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
+        w.writerows(rows)
+
+def mutate(pattern: str, k: int, rnd: random.Random) -> str:
+    """k замін у випадкових позиціях (символами з самого шаблону)."""
+    chars = list(pattern)
+    for i in rnd.sample(range(len(chars)), min(k, len(chars))):
+        chars[i] = rnd.choice([c for c in set(pattern) if c != chars[i]] or ["#"])
+    return "".join(chars)
+
+def bench_bitap(label: str, text: str, ks: List[int], lengths: List[int], repeats: int) -> List[dict]:
+    """Усі збіги bitap_finditer: шаблон довжини m з середини тексту з k замінами."""
+    key = f"time_s_min_of_{repeats}"
+    rows: List[dict] = []
+    rnd = random.Random(0)
+    n = len(text)
+    for m in lengths:
+        if m > n:
+            continue
+        orig = text[n // 2:n // 2 + m]
+        for k in ks:
+            pat = mutate(orig, k, rnd)
+            for dist in BITAP_DISTANCES:
+                t = bench_call(lambda: sum(1 for _ in bitap_finditer(text, pat, k, dist)), repeats)
+                hits = sum(1 for _ in bitap_finditer(text, pat, k, dist))
+                rows.append({
+                    "file": label, "pattern_type": f"bitap m={m} k={k}", "pattern": pat,
+                    "algo": f"Bitap ({dist})", key: t, "m": m, "k": k, "matches": hits,
+                    "ns_per_char": round(t * 1e9 / n, 3),
+                })
+                print(f"[run] {label:8s} | m={m:4d} k={k} | {dist:11s} -> {t:.6f} s  "
+                      f"({t * 1e9 / n:.1f} ns/char, {hits} збігів)")
+    return rows
+
+def make_corpus(root: Path, docs: int, n: int, seed: int) -> None:
+    """Синтетична колекція: docs файлів по ~n символів (фіксований seed)."""
+    root.mkdir(parents=True, exist_ok=True)
+    rnd = random.Random(seed)
+    for i in range(docs):
+        text = synthetic_text(rnd.randrange(n // 2, n * 3 // 2 + 1), 33, 0.2, seed=seed * 1_000_003 + i)
+        (root / f"doc{i:05d}.txt").write_text(text, encoding="utf-8")
+
+def bench_corpus(root: Path, queries: int, seed: int, repeats: int) -> List[dict]:
+    """Побудова триграмного індексу; для кожного запиту — індекс проти перегляду всіх файлів."""
+    key = f"time_s_min_of_{repeats}"
+    label = f"{root.name}/"
+    paths = sorted(root.rglob("*.txt"))
+    build = bench_call(lambda: NgramIndex().add_dir(root), 1)
+    index = NgramIndex()
+    index.add_dir(root)
+    rows: List[dict] = [{
+        "file": label, "pattern_type": "build", "pattern": "", "algo": "Trigram index", key: build,
+        "docs": len(paths), "grams": len(index.postings), "postings_bytes": index.nbytes(),
+    }]
+    print(f"[info] {label}: {len(paths)} документів, {len(index.postings)} триграм, "
+          f"постинги {index.nbytes() / 1024:.0f} KiB, побудова {build:.3f} s")
+
+    rnd = random.Random(seed)
+    pats: List[Tuple[str, str]] = []
+    for _ in range(queries):
+        text = read_doc(rnd.choice(paths))
+        m = rnd.choice((4, 8, 16))
+        if len(text) > m:
+            i = rnd.randrange(len(text) - m)
+            pats.append((text[i:i + m], "present"))
+    pats.append((ensure_absent("".join(read_doc(p) for p in paths[:5]), "космічний єдиноріг 4242"), "absent"))
+
+    def scan_all(pat: str) -> int:
+        cp = compile_pattern(pat, "bmh")
+        return sum(1 for p in paths if next(cp.finditer(read_doc(p)), -1) >= 0)
+
+    idx_total = scan_total = 0.0
+    for pat, ptype in pats:
+        t_idx = bench_call(lambda: index.search(pat), repeats)
+        t_scan = bench_call(lambda: scan_all(pat), repeats)
+        idx_total += t_idx
+        scan_total += t_scan
+        cand = len(index.candidates(pat))
+        for name, t in (("Trigram index", t_idx), ("Scan all files (BMH)", t_scan)):
+            rows.append({"file": label, "pattern_type": ptype, "pattern": pat, "algo": name, key: t,
+                         "docs": len(paths), "candidates": cand})
+    print(f"[info] {len(pats)} запитів: індекс {idx_total:.4f} s, перегляд усіх файлів {scan_total:.4f} s "
+          f"(×{scan_total / max(idx_total, 1e-12):.1f})")
+    return rows
+
+def run_meta(args: argparse.Namespace | None = None) -> dict:
+    """Умови прогону — щоб результати різних запусків можна було зіставляти."""
+    meta = {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+    if args is not None:
+        meta["args"] = {k: v for k, v in vars(args).items() if k not in ("csv", "json")}
+    return meta
+
+def write_json(rows: List[dict], path: Path, meta: dict | None = None) -> None:
+    with path.open("w", encoding="utf-8") as f:
+        json.dump({"meta": meta or {}, "rows": rows}, f, ensure_ascii=False, indent=1, default=str)
+
 # ----------------------------------- CLI ------------------------------------ #
 
 def parse_args() -> argparse.Namespace:
-    ap = argparse.ArgumentParser(description="Substring search benchmark (KMP/BMH/RK) — files or URLs")
+    ap = argparse.ArgumentParser(description="Substring search benchmark (KMP/BMH/RK/BM/Two-Way) — files or URLs")
     ap.add_argument("--file", action="append", help="Шлях до текстового файлу (вкажи ДВІЧІ для двох статей)", default=[])
     ap.add_argument("--url",  action="append", help="URL до тексту (вкажи ДВІЧІ). Підтримує Drive 'view'.", default=[])
     ap.add_argument("--present1", type=str, help="Існуючий підрядок у статті 1")
@@ -114,11 +648,42 @@ def parse_args() -> argparse.Namespace:
     ap.add_argument("--absent2",  type=str, help="Вигаданий (відсутній) підрядок у статті 2")
     ap.add_argument("--repeats",  type=int, default=5, help="Кількість повторів у timeit (беремо мінімум)")
     ap.add_argument("--csv",      type=str, default="search_benchmark_results.csv", help="Куди зберегти CSV")
+    ap.add_argument("--json", type=str, help="Також зберегти JSON: {meta, rows} — для відстеження регресій")
+    ap.add_argument("--cache-dir", type=Path, default=CACHE_DIR, help="Кеш текстів, завантажених з --url")
+    ap.add_argument("--offline", action="store_true", help="Не ходити в мережу: --url лише з кешу")
+    ap.add_argument("--synthetic", action="store_true", help="Замість статей — два синтетичні тексти")
+    ap.add_argument("--syn-n", type=int, default=200_000, help="Довжина синтетичного тексту")
+    ap.add_argument("--syn-alphabet", type=int, default=26, help="Розмір алфавіту синтетичного тексту")
+    ap.add_argument("--syn-repeat", type=float, default=0.0, help="Повторюваність 0..1 (частка скопійованих блоків)")
+    ap.add_argument("--seed", type=int, default=0, help="Seed для синтетичного корпусу і сітки")
+    ap.add_argument("--sweep", action="store_true", help="Сітка: довжина шаблону × алфавіт × позиція входження")
+    ap.add_argument("--sweep-m", type=str, default="4,16,64,256", help="Довжини шаблонів для --sweep, через кому")
+    ap.add_argument("--sweep-alphabet", type=str, default="2,4,26,64", help="Розміри алфавіту для --sweep, через кому")
+    ap.add_argument("--corpus-dir", type=Path, help="Каталог документів для триграмного індексу (немає — згенерувати)")
+    ap.add_argument("--corpus-docs", type=int, default=1000, help="Скільки документів генерувати для --corpus-dir")
+    ap.add_argument("--corpus-queries", type=int, default=50, help="Скільки запитів для --corpus-dir")
+    ap.add_argument("--bitap", action="store_true", help="Наближений пошук Bitap: час на символ для різних k і m")
+    ap.add_argument("--bitap-k", type=str, default="0,1,2,4", help="Кількості помилок для --bitap, через кому")
+    ap.add_argument("--bitap-m", type=str, default="8,32,128", help="Довжини шаблонів для --bitap, через кому")
+    ap.add_argument("--parallel", type=int, default=0, help="Масштабування parallel_search до N процесів (0 — вимкнено)")
+    ap.add_argument("--parallel-mb", type=int, default=32, help="Розмір тексту для --parallel (статті повторюються), МБ")
+    ap.add_argument("--parallel-algo", choices=sorted(COMPILED), default="bmh", help="Алгоритм для --parallel")
+    ap.add_argument("--numpy", action="store_true", help="Векторний Rabin–Karp (numpy) проти чистого Python")
+    ap.add_argument("--numpy-k", type=int, default=100, help="Кількість шаблонів однієї довжини для --numpy")
+    ap.add_argument("--numpy-m", type=int, default=8, help="Довжина цих шаблонів")
+    ap.add_argument("--adversarial", type=int, default=0, help="Довжина адверсарного тексту a…ab (0 — вимкнено)")
+    ap.add_argument("--adv-m", type=int, default=32, help="Довжина шаблону для --adversarial")
+    ap.add_argument("--index", action="store_true", help="Суфіксний масив + LCP: побудова, запити, точка беззбитковості")
+    ap.add_argument("--mmap", action="store_true", help="Пошук bytes у файлі через mmap (лише для файлових джерел)")
+    ap.add_argument("--compiled", action="store_true", help="Розділити час на препроцесинг шаблону і сканування")
+    ap.add_argument("--all-matches", action="store_true", help="Сценарій усіх входжень: finditer проти повторних пошуків")
+    ap.add_argument("--multi",    type=int, default=0, help="K ключових слів: Aho–Corasick проти K проходів (0 — вимкнено)")
     return ap.parse_args()
 
 def main() -> None:
     args = parse_args()
     texts: List[str] = []
+    src_paths: List[Path] = []  # файлові джерела (для --mmap)
 
     # 1) URL
     if args.url:
@@ -127,7 +692,9 @@ def main() -> None:
         sources = [("URL#1", args.url[0]), ("URL#2", args.url[1])]
         for label, u in sources:
             try:
-                txt = fetch_text_from_url(u)
+                txt = fetch_text_cached(u, args.cache_dir, args.offline)
+            except FileNotFoundError as e:
+                raise SystemExit(f"--offline: {label} {e}")
             except error.HTTPError as e:
                 raise SystemExit(f"HTTP {e.code} при завантаженні {label}: {u}")
             except error.URLError as e:
@@ -144,15 +711,26 @@ def main() -> None:
             if not p.exists():
                 raise SystemExit(f"Файл не знайдено: {p}")
             texts.append(read_text(p))
+        src_paths = paths
         print(f"[info] джерела: FILE [{paths[0]}] | FILE [{paths[1]}]")
 
-    # 3) AUTO (data/…)
+    # 3) SYNTHETIC
+    elif args.synthetic:
+        texts = [
+            synthetic_text(args.syn_n, args.syn_alphabet, args.syn_repeat, args.seed),
+            synthetic_text(args.syn_n, args.syn_alphabet, args.syn_repeat, args.seed + 1),
+        ]
+        print(f"[info] джерела: SYNTHETIC n={args.syn_n}, alphabet={args.syn_alphabet}, "
+              f"repeat={args.syn_repeat}, seed={args.seed}")
+
+    # 4) AUTO (data/…)
     else:
         cand1 = Path("data") / "стаття 1.txt"
         cand2 = Path("data") / "стаття 2.txt"
         if not (cand1.exists() and cand2.exists()):
             raise SystemExit("Авто-режим: поклади 'стаття 1.txt' і 'стаття 2.txt' у ./data, або використай --file / --url.")
         texts = [read_text(cand1), read_text(cand2)]
+        src_paths = [cand1, cand2]
         print(f"[info] джерела: FILE [{cand1}] | FILE [{cand2}]")
 
     text1, text2 = texts
@@ -194,31 +772,92 @@ def main() -> None:
             })
             print(f"[run] {label:8s} | {ptype:7s} | {name:21s} -> {t:.6f} s")
 
+    base_rows = list(rows)  # present/absent — для підсумків нижче
+    for label, txt, pat in cases:
+        ptype = case_types[(label, pat)]
+        for name, fn in BASELINES.items():
+            t = bench_once(fn, txt, pat, repeats=repeats)
+            rows.append({"file": label, "pattern_type": ptype, "pattern": pat, "algo": name, f"time_s_min_of_{repeats}": t})
+            print(f"[run] {label:8s} | {ptype:7s} | {name:21s} -> {t:.6f} s  (baseline)")
+    if args.sweep:
+        print("\n=== Sweep: alphabet × m × hit position (synthetic) ===")
+        rows += bench_sweep(
+            args.syn_n,
+            [int(x) for x in args.sweep_alphabet.split(",") if x.strip()],
+            [int(x) for x in args.sweep_m.split(",") if x.strip()],
+            args.syn_repeat, args.seed, repeats,
+        )
+    if args.corpus_dir:
+        print("\n=== Trigram index over a document collection ===")
+        if not args.corpus_dir.exists():
+            print(f"[info] {args.corpus_dir} немає — генерую {args.corpus_docs} синтетичних документів")
+            make_corpus(args.corpus_dir, args.corpus_docs, 5_000, args.seed)
+        rows += bench_corpus(args.corpus_dir, args.corpus_queries, args.seed, repeats)
+    if args.bitap:
+        print("\n=== Bitap (k errors) ===")
+        ks = [int(x) for x in args.bitap_k.split(",") if x.strip()]
+        ms = [int(x) for x in args.bitap_m.split(",") if x.strip()]
+        rows += bench_bitap("стаття 1", text1, ks, ms, repeats)
+        rows += bench_bitap("стаття 2", text2, ks, ms, repeats)
+    if args.parallel > 0:
+        print(f"\n=== Parallel search (cpu_count={os.cpu_count()}) ===")
+        base = text1 + "\n" + text2 + "\n"
+        big = base * max(1, args.parallel_mb * 2**20 // max(1, len(base.encode("utf-8"))))
+        rows += bench_parallel(big, [(present1, "present"), (absent1, "absent")], args.parallel, args.parallel_algo, repeats)
+    if args.numpy:
+        if np is None:
+            print("[warn] --numpy: numpy не встановлено (pip install numpy) — пропускаю")
+        else:
+            print("\n=== NumPy rolling hash ===")
+            np_cases = [(label, txt, pat, case_types[(label, pat)]) for label, txt, pat in cases]
+            rows += bench_numpy(np_cases, args.numpy_k, max(1, args.numpy_m), repeats)
+    if args.adversarial > 0:
+        print("\n=== Adversarial text ===")
+        rows += bench_adversarial(args.adversarial, max(2, args.adv_m), repeats)
+    if args.index:
+        print("\n=== Suffix array index ===")
+        rows += bench_index("стаття 1", text1, [(present1, "present"), (absent1, "absent")], base_rows, repeats)
+        rows += bench_index("стаття 2", text2, [(present2, "present"), (absent2, "absent")], base_rows, repeats)
+    if args.mmap:
+        if not src_paths:
+            print("[warn] --mmap потребує файлових джерел (--file або data/) — пропускаю")
+        else:
+            print("\n=== mmap bytes search ===")
+            by_label = {"стаття 1": src_paths[0], "стаття 2": src_paths[1]}
+            rows += bench_mmap([(label, by_label[label], pat, case_types[(label, pat)]) for label, _, pat in cases], repeats)
+    if args.compiled:
+        print("\n=== Compiled patterns: preprocessing vs scan ===")
+        rows += bench_compiled([(label, txt, pat, case_types[(label, pat)]) for label, txt, pat in cases], repeats)
+    if args.all_matches:
+        rows += bench_all_matches("стаття 1", text1, repeats)
+        rows += bench_all_matches("стаття 2", text2, repeats)
+    if args.multi > 0:
+        rows += bench_multi("стаття 1", text1, args.multi, repeats)
+        rows += bench_multi("стаття 2", text2, args.multi, repeats)
+
     # CSV
     csv_path = Path(args.csv)
-    with csv_path.open("w", newline="", encoding="utf-8") as f:
-        fieldnames = list(rows[0].keys())
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        w.writerows(rows)
+    write_csv(rows, csv_path)
+    if args.json:
+        write_json(rows, Path(args.json), run_meta(args))
 
     # Winners per (file, pattern_type)
     by_key = {}
-    key_field = fieldnames[-1]
+    key_field = f"time_s_min_of_{repeats}"
     for r in rows:
+        if r["algo"] in BASELINES:
+            continue
         key = (r["file"], r["pattern_type"])
         if key not in by_key or r[key_field] < by_key[key][key_field]:
             by_key[key] = r
 
     print("\n=== Winners by file/pattern ===")
-    for k, r in by_key.items:
-        pass
     for k, r in by_key.items():
         print(f"{k[0]} | {k[1]} -> {r['algo']} ({r[key_field]:.6f} s)")
 
     # Fastest per file (avg of present+absent)
     per_file = {}
-    for r in rows:
+    for r in base_rows:
         k = (r["file"], r["algo"])
         per_file.setdefault(k, []).append(r[key_field])
     per_file_mean = {}
@@ -233,7 +872,7 @@ def main() -> None:
 
     # Global means
     sums, cnts = {}, {}
-    for r in rows:
+    for r in base_rows:
         algo = r["algo"]
         sums[algo] = sums.get(algo, 0.0) + r[key_field]
         cnts[algo] = cnts.get(algo, 0) + 1
@@ -244,6 +883,8 @@ def main() -> None:
         print(f"{a:21s} : {v:.6f} s")
 
     print(f"\nSaved CSV -> {csv_path.resolve()}")
+    if args.json:
+        print(f"Saved JSON -> {Path(args.json).resolve()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -8,6 +8,10 @@
 
 Запуск:  python3 main.py
 (нічого вказувати не треба; якщо захочеш ручний режим — запускай bench_search.py з аргументами)
+
+Тексти кешуються в .corpus_cache/ — повторні запуски працюють без мережі.
+Якщо мережі немає і кешу ще теж — береться синтетичний корпус (seed фіксований).
+Крім CSV пишеться results.json (умови прогону + рядки) для відстеження регресій.
 """
 
 from __future__ import annotations
@@ -16,11 +20,15 @@ import csv
 
 # Імпортуємо реалізації та утиліти з bench_search.py (який уже в репо)
 from bench_search import (
-    fetch_text_from_url,
+    fetch_text_cached,
+    synthetic_text,
+    run_meta,
+    write_json,
     auto_present,
     ensure_absent,
     bench_once,
-    ALGOS,  # {"KMP": ..., "Boyer–Moore–Horspool": ..., "Rabin–Karp": ...}
+    BASELINES,  # {"str.find": ...} — базова лінія, у переможцях не враховується
+    ALGOS,  # {"KMP": ..., "Boyer–Moore–Horspool": ..., "Rabin–Karp": ..., "Boyer–Moore": ..., "Two-Way": ...}
 )
 
 # ==== Налаштування за замовчуванням (можеш змінити за потреби) ====
@@ -29,12 +37,19 @@ URL_ARTICLE_2 = "https://drive.google.com/file/d/18BfXyQcmuinEI_8KDSnQm4bLx6yIFS
 
 REPEATS = 5                    # скільки разів міряти timeit (беремо мінімум)
 CSV_PATH = Path("results.csv") # куди зберігати підсумкову таблицю
+JSON_PATH = Path("results.json")
+SYNTHETIC_N = 200_000          # запасний варіант без мережі: довжина синтетичного тексту
 
 
 def run_benchmark_from_urls() -> None:
-    print("[info] Завантажую тексти з URL (Google Drive)...")
-    text1 = fetch_text_from_url(URL_ARTICLE_1)
-    text2 = fetch_text_from_url(URL_ARTICLE_2)
+    print("[info] Завантажую тексти з URL (Google Drive, кеш .corpus_cache/)...")
+    try:
+        text1 = fetch_text_cached(URL_ARTICLE_1)
+        text2 = fetch_text_cached(URL_ARTICLE_2)
+    except OSError as e:
+        print(f"[warn] немає мережі і кешу ({e}) — синтетичний корпус")
+        text1 = synthetic_text(SYNTHETIC_N, 33, 0.2, seed=1)
+        text2 = synthetic_text(SYNTHETIC_N, 33, 0.2, seed=2)
 
     # Підбираємо підрядки: present (існуючий) і absent (вигаданий)
     present1 = auto_present(text1, 24)
@@ -55,7 +70,7 @@ def run_benchmark_from_urls() -> None:
 
     # Запускаємо всі алгоритми на кожному кейсі
     for label, txt, pat, ptype in cases:
-        for name, fn in ALGOS.items():
+        for name, fn in {**ALGOS, **BASELINES}.items():
             t = bench_once(fn, txt, pat, repeats=REPEATS)
             rows.append({
                 "file": label,
@@ -75,7 +90,10 @@ def run_benchmark_from_urls() -> None:
         w.writeheader()
         w.writerows(rows)
 
-    # Переможці per (file, pattern_type)
+    write_json(rows, JSON_PATH, run_meta())
+
+    # Переможці per (file, pattern_type); str.find — лише для порівняння
+    rows = [r for r in rows if r["algo"] not in BASELINES]
     by_key = {}
     for r in rows:
         k = (r["file"], r["pattern_type"])
@@ -115,6 +133,7 @@ def run_benchmark_from_urls() -> None:
         print(f"{a:21s} : {v:.6f} s")
 
     print(f"\nSaved CSV -> {CSV_PATH.resolve()}")
+    print(f"Saved JSON -> {JSON_PATH.resolve()}")
 
 
 if __name__ == "__main__":
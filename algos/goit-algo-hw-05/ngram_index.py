@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Інвертований n-грамний (за замовчуванням триграмний) індекс над каталогом документів:
+- для кожної n-грами — список id документів, що її містять: id зростають,
+  тож зберігаються різниці між сусідніми, закодовані varint (LEB128) у
+  bytearray — 1 байт на малу різницю замість 4 байтів на id у array('I');
+- запит: перетин списків для всіх n-грам шаблону → документи-кандидати,
+  які перевіряються звичайним пошуком (compile_pattern з search_algorithms);
+- інкрементне додавання: add_dir індексує лише нові й змінені файли
+  (змінений файл отримує новий id, старий позначається видаленим), а файли,
+  яких більше немає на диску, позначаються видаленими.
+
+Шаблони, коротші за n, не мають n-грам — тоді кандидати всі документи.
+"""
+
+from __future__ import annotations
+import json
+import struct
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from search_algorithms import compile_pattern
+
+_MAGIC = b"NGIX2\0"
+_HEADER = struct.Struct("<6sI")  # magic, довжина JSON-метаданих
+_GRAM = struct.Struct("<HI")     # довжина n-грами в байтах, довжина постингів у байтах
+
+
+def read_doc(path: Path) -> str:
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def ngrams(text: str, n: int = 3) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def put_varint(buf: bytearray, value: int) -> None:
+    """Дописує невід'ємне ціле у форматі LEB128: по 7 біт, старший біт — «є продовження»."""
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def iter_varints(buf) -> Iterator[int]:
+    value = shift = 0
+    for b in buf:
+        value |= (b & 0x7F) << shift
+        if b & 0x80:
+            shift += 7
+        else:
+            yield value
+            value = shift = 0
+
+
+class NgramIndex:
+    """n-грама → varint-дельти id документів; документи читаються з диска лише при перевірці."""
+
+    def __init__(self, n: int = 3) -> None:
+        if n < 1:
+            raise ValueError("n має бути >= 1")
+        self.n = n
+        self.docs: List[str] = []                   # id → шлях
+        self.stamps: List[Tuple[int, int]] = []     # id → (mtime_ns, size) на момент індексації
+        self.deleted: Set[int] = set()
+        self.by_path: Dict[str, int] = {}           # шлях → актуальний id
+        self.postings: Dict[str, bytearray] = {}
+        self._last: Dict[str, int] = {}             # n-грама → останній доданий id (для дельти)
+
+    def __len__(self) -> int:
+        return len(self.docs) - len(self.deleted)
+
+    # ------------------------------ побудова ------------------------------ #
+
+    def add(self, path) -> int:
+        """Додає документ з диска; повторне додавання того самого шляху замінює стару версію.
+        Текст не зберігається — при перевірці кандидатів файл читається знову, тож
+        шлях має існувати (інакше OSError)."""
+        p = Path(path)
+        key = str(p)
+        st = p.stat()
+        text = read_doc(p)
+        old = self.by_path.get(key)
+        if old is not None:
+            self.deleted.add(old)
+        doc_id = len(self.docs)
+        self.docs.append(key)
+        self.stamps.append((st.st_mtime_ns, st.st_size))
+        self.by_path[key] = doc_id
+        for g in ngrams(text, self.n):
+            plist = self.postings.get(g)
+            if plist is None:
+                plist = self.postings[g] = bytearray()
+            put_varint(plist, doc_id - self._last.get(g, 0))
+            self._last[g] = doc_id
+        return doc_id
+
+    def remove(self, path) -> bool:
+        """Позначає документ видаленим (постинги не чіпаються — id просто відфільтровується)."""
+        doc_id = self.by_path.pop(str(Path(path)), None)
+        if doc_id is None:
+            return False
+        self.deleted.add(doc_id)
+        return True
+
+    def is_current(self, path: Path) -> bool:
+        doc_id = self.by_path.get(str(path))
+        if doc_id is None:
+            return False
+        st = path.stat()
+        return self.stamps[doc_id] == (st.st_mtime_ns, st.st_size)
+
+    def add_dir(self, root, pattern: str = "*.txt") -> int:
+        """Індексує файли каталогу (рекурсивно), яких ще немає в індексі або які змінились,
+        і видаляє з індексу зниклі з диска. Повертає кількість змін."""
+        changed = 0
+        for p in sorted(Path(root).rglob(pattern)):
+            if p.is_file() and not self.is_current(p):
+                self.add(p)
+                changed += 1
+        for key in [k for k in self.by_path if not Path(k).is_file()]:
+            changed += self.remove(key)
+        return changed
+
+    # ------------------------------- запити ------------------------------- #
+
+    def _decode(self, gram: str) -> Iterator[int]:
+        return accumulate(iter_varints(self.postings.get(gram, b"")))
+
+    def nbytes(self) -> int:
+        """Пам'ять під постинги (без ключів-n-грам і накладних витрат dict)."""
+        return sum(len(p) for p in self.postings.values())
+
+    def candidates(self, pattern: str) -> List[int]:
+        """Id документів, що містять усі n-грами шаблону (без видалених)."""
+        grams = ngrams(pattern, self.n)
+        if not grams:
+            return [i for i in range(len(self.docs)) if i not in self.deleted]
+        # починаємо з найрідшої n-грами (довжина в байтах ~ кількість id) — перетин не більший за неї
+        ordered = sorted(grams, key=lambda g: len(self.postings.get(g, ())))
+        result = set(self._decode(ordered[0]))
+        for g in ordered[1:]:
+            if not result:
+                break
+            result.intersection_update(self._decode(g))
+        result -= self.deleted
+        return sorted(result)
+
+    def finditer(self, pattern: str, algo: str = "bmh") -> Iterator[Tuple[str, List[int]]]:
+        """(шлях, усі зміщення) для кожного документа, де шаблон справді є.
+        Документ, який вже не прочитати (видалено після індексації), позначається видаленим."""
+        cp = compile_pattern(pattern, algo)
+        for doc_id in self.candidates(pattern):
+            path = self.docs[doc_id]
+            try:
+                text = read_doc(Path(path))
+            except OSError:
+                if self.by_path.get(path) == doc_id:
+                    self.remove(path)
+                continue
+            hits = list(cp.finditer(text))
+            if hits:
+                yield path, hits
+
+    def search(self, pattern: str, algo: str = "bmh") -> Dict[str, List[int]]:
+        return dict(self.finditer(pattern, algo))
+
+    # ------------------------------ зберігання ----------------------------- #
+
+    def save(self, path) -> None:
+        meta = {"n": self.n, "docs": self.docs, "stamps": self.stamps, "deleted": sorted(self.deleted)}
+        raw = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(raw)))
+            f.write(raw)
+            for g, plist in self.postings.items():
+                gb = g.encode("utf-8", "surrogatepass")
+                f.write(_GRAM.pack(len(gb), len(plist)))
+                f.write(gb)
+                f.write(plist)
+
+    @classmethod
+    def load(cls, path) -> "NgramIndex":
+        with open(path, "rb") as f:
+            magic, size = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path}: не файл n-грамного індексу")
+            meta = json.loads(f.read(size).decode("utf-8"))
+            index = cls(meta["n"])
+            index.docs = meta["docs"]
+            index.stamps = [tuple(s) for s in meta["stamps"]]
+            index.deleted = set(meta["deleted"])
+            # пізніші id перекривають старі; видалені документи в by_path не потрапляють
+            index.by_path = {p: i for i, p in enumerate(index.docs) if i not in index.deleted}
+            while True:
+                head = f.read(_GRAM.size)
+                if not head:
+                    break
+                glen, size = _GRAM.unpack(head)
+                g = f.read(glen).decode("utf-8", "surrogatepass")
+                plist = bytearray(f.read(size))
+                if len(plist) != size:
+                    raise EOFError(f"{path}: обірваний файл індексу")
+                index.postings[g] = plist
+                index._last[g] = sum(iter_varints(plist))
+        return index
+
+    @classmethod
+    def load_or_build(cls, path, root, pattern: str = "*.txt", n: int = 3) -> "NgramIndex":
+        """Завантажує індекс (якщо є), доіндексовує нові/змінені файли root і зберігає."""
+        p = Path(path)
+        index = None
+        if p.exists():
+            try:
+                index = cls.load(p)
+            except (ValueError, EOFError, struct.error, KeyError, json.JSONDecodeError):
+                index = None
+        if index is None or index.n != n:
+            index = cls(n)
+        if index.add_dir(root, pattern) or not p.exists():
+            index.save(p)
+        return index
+
+
+def build_index(paths: Iterable, n: int = 3) -> NgramIndex:
+    index = NgramIndex(n)
+    for p in paths:
+        index.add(p)
+    return index
@@ -5,13 +5,53 @@
 - KMP (Кнут—Морріс—Пратт)
 - Boyer–Moore–Horspool (спрощений Бойера—Мура)
 - Rabin–Karp (ролінг-хеш)
+- Boyer–Moore (поганий символ + добрий суфікс, правило Галіла — лінійний гірший випадок)
+- Two-Way (Крошмор—Перрен: критична факторизація, O(1) додаткової пам'яті)
+- Aho–Corasick (багато шаблонів за один прохід)
+- Bitap / Wu–Manber (наближений пошук з k помилками: Геммінг або Левенштейн)
+
+*_search повертає перший індекс або -1; *_finditer — лінивий генератор
+усіх входжень (overlapping=True — з перекриттями, False — як str.count).
+bitap_finditer видає пари (end, errors): кінець збігу (не включно) і мінімальну
+кількість помилок для цього кінця.
+
+compile_pattern(pattern, algo) — попередньо оброблений шаблон (LPS, таблиця
+зсувів, хеш шаблону) для багаторазового пошуку; останні скомпільовані
+шаблони кешуються (LRU).
+
+Усі *_finditer/*_search і скомпільовані шаблони працюють і з bytes;
+mmap_finditer/mmap_search шукають bytes-шаблон у файлі через mmap
+перекривними вікнами — стала пам'ять і без декодування тексту.
+
+parallel_search(text_or_path, pattern, algo, workers) — усі входження,
+знайдені пулом процесів по шматках, що перекриваються на m-1 символ; файл
+(pathlib.Path) кожен процес відкриває сам через mmap, тож текст не пиклиться.
+
+stream_matcher(pattern, algo) — потоковий пошук: matcher.feed(chunk)
+повертає абсолютні зміщення збігів, між шматками зберігається лише O(m)
+стану (сокети, пайпи, sys.stdin без буферизації всього входу).
+
+CodepointText (потрібен numpy) — текст один раз кодується в масив кодів
+uint32, хеші всіх вікон рахуються векторно з префіксних сум; кандидати
+перевіряються пакетно, кілька шаблонів однієї довжини — через множину хешів.
 """
 
 from __future__ import annotations
+import mmap
+import os
+from abc import ABC, abstractmethod
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Tuple
 
-def kmp_search(text: str, pattern: str) -> int:
-    if pattern == "":
-        return 0
+try:
+    import numpy as np
+except Exception:
+    np = None  # numpy_* функції працюватимуть і без numpy (через чистий Rabin–Karp)
+
+def _kmp_lps(pattern: str) -> List[int]:
     lps = [0] * len(pattern)
     j = 0
     for i in range(1, len(pattern)):
@@ -20,61 +60,888 @@ def kmp_search(text: str, pattern: str) -> int:
         if pattern[i] == pattern[j]:
             j += 1
             lps[i] = j
+    return lps
+
+
+def _empty_finditer(text: str) -> Iterator[int]:
+    # порожній шаблон «збігається» у кожній позиції, як re.finditer("")
+    return iter(range(len(text) + 1))
+
+
+def kmp_finditer(text: str, pattern: str, overlapping: bool = True) -> Iterator[int]:
+    # Усі входження; після збігу продовжуємо з j = lps[m-1] (перекриття) або j = 0
+    if not pattern:
+        return _empty_finditer(text)
+    return _kmp_iter(text, pattern, _kmp_lps(pattern), overlapping)
+
+
+def _kmp_iter(text: str, pattern: str, lps: List[int], overlapping: bool) -> Iterator[int]:
+    m = len(pattern)
     j = 0
     for i, ch in enumerate(text):
         while j > 0 and ch != pattern[j]:
             j = lps[j - 1]
         if ch == pattern[j]:
             j += 1
-            if j == len(pattern):
-                return i - j + 1
-    return -1
+            if j == m:
+                yield i - m + 1
+                j = lps[j - 1] if overlapping else 0
 
 
-def bmh_search(text: str, pattern: str) -> int:
-    m = len(pattern)
-    n = len(text)
-    if m == 0:
-        return 0
-    if m > n:
-        return -1
+def kmp_search(text: str, pattern: str) -> int:
+    return next(kmp_finditer(text, pattern), -1)
 
-    default = m
+
+def _bmh_skip(pattern: str) -> dict:
+    m = len(pattern)
     skip = {}
     for i in range(m - 1):
         skip[pattern[i]] = m - 1 - i
+    return skip
+
 
+def bmh_finditer(text: str, pattern: str, overlapping: bool = True) -> Iterator[int]:
+    # Зсув Хорспула за останнім символом вікна безпечний і після збігу,
+    # тож для перекриттів таблиця skip просто працює далі
+    if not pattern:
+        return _empty_finditer(text)
+    return _bmh_iter(text, pattern, _bmh_skip(pattern), overlapping)
+
+
+def _bmh_iter(text: str, pattern: str, skip: dict, overlapping: bool) -> Iterator[int]:
+    m = len(pattern)
+    n = len(text)
+    last = pattern[m - 1]
     i = 0
     while i <= n - m:
-        if text[i + m - 1] == pattern[m - 1]:
-            if text[i:i + m] == pattern:
-                return i
-            i += default
-        else:
-            i += skip.get(text[i + m - 1], default)
-    return -1
+        ch = text[i + m - 1]
+        if ch == last and text[i:i + m] == pattern:
+            yield i
+            if not overlapping:
+                i += m
+                continue
+        i += skip.get(ch, m)
 
 
-def rabin_karp_search(text: str, pattern: str, base: int = 256, mod: int = 10**9 + 7) -> int:
+def bmh_search(text: str, pattern: str) -> int:
+    return next(bmh_finditer(text, pattern), -1)
+
+
+def rabin_karp_finditer(
+    text: str, pattern: str, overlapping: bool = True, base: int = 256, mod: int = 10**9 + 7
+) -> Iterator[int]:
+    # Хеш вікна котиться без перезапуску; у неперекривному режимі
+    # збіги до кінця попереднього входження просто ігноруються
+    if not pattern:
+        return _empty_finditer(text)
+    high = pow(base, len(pattern) - 1, mod)
+    return _rk_iter(text, pattern, _rk_hash(pattern, base, mod), high, overlapping, base, mod)
+
+
+def _codes(seq) -> Iterator[int]:
+    # коди символів: для str — ord(), для bytes елементи вже цілі
+    return map(ord, seq) if isinstance(seq, str) else iter(seq)
+
+
+def _rk_hash(pattern, base: int, mod: int) -> int:
+    h = 0
+    for c in _codes(pattern):
+        h = (h * base + c) % mod
+    return h
+
+
+def _rk_iter(
+    text: str, pattern: str, ph: int, high: int, overlapping: bool, base: int, mod: int
+) -> Iterator[int]:
     m = len(pattern)
     n = len(text)
-    if m == 0:
-        return 0
     if m > n:
-        return -1
-
-    high = pow(base, m - 1, mod)
-    ph = 0
+        return
+    outgoing = _codes(text)  # символ, що виходить з вікна
+    incoming = _codes(text)  # символ, що входить у вікно
     th = 0
-    for i in range(m):
-        ph = (ph * base + ord(pattern[i])) % mod
-        th = (th * base + ord(text[i])) % mod
+    for _ in range(m):
+        th = (th * base + next(incoming)) % mod
 
+    step = 1 if overlapping else m
+    nxt = 0  # найменший дозволений початок наступного збігу
     for i in range(n - m + 1):
-        if ph == th and text[i:i + m] == pattern:
-            return i
+        if ph == th and i >= nxt and text[i:i + m] == pattern:
+            yield i
+            nxt = i + step
         if i < n - m:
-            th = ((th - ord(text[i]) * high) * base + ord(text[i + m])) % mod
+            th = ((th - next(outgoing) * high) * base + next(incoming)) % mod
             if th < 0:
                 th += mod
-    return -1
\ No newline at end of file
+
+
+def rabin_karp_search(text: str, pattern: str, base: int = 256, mod: int = 10**9 + 7) -> int:
+    return next(rabin_karp_finditer(text, pattern, base=base, mod=mod), -1)
+
+
+def _bm_last(pattern) -> dict:
+    # поганий символ: остання позиція кожного символу в шаблоні
+    return {ch: i for i, ch in enumerate(pattern)}
+
+
+def _bm_good_suffix(pattern) -> List[int]:
+    # сильне правило доброго суфікса: shift[j + 1] — зсув при розбіжності в позиції j,
+    # shift[0] — період шаблону (зсув після повного збігу)
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+    i, j = m, m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+
+def bm_finditer(text: str, pattern: str, overlapping: bool = True) -> Iterator[int]:
+    if not pattern:
+        return _empty_finditer(text)
+    return _bm_iter(text, pattern, _bm_last(pattern), _bm_good_suffix(pattern), overlapping)
+
+
+def _bm_iter(text: str, pattern: str, last: dict, shift: List[int], overlapping: bool) -> Iterator[int]:
+    m = len(pattern)
+    n = len(text)
+    period = shift[0]
+    s = 0
+    k = 0  # правило Галіла: pattern[:k] уже збігся при поточному вирівнюванні
+    while s <= n - m:
+        j = m - 1
+        while j >= k and pattern[j] == text[s + j]:
+            j -= 1
+        if j < k:
+            yield s
+            if overlapping:
+                s += period
+                k = m - period
+            else:
+                s += m
+                k = 0
+        else:
+            k = 0
+            s += max(shift[j + 1], j - last.get(text[s + j], -1))
+
+
+def bm_search(text: str, pattern: str) -> int:
+    return next(bm_finditer(text, pattern), -1)
+
+
+def _maximal_suffix(pattern, reverse: bool) -> Tuple[int, int]:
+    # (позиція перед максимальним суфіксом, його період) для порядку < або > (reverse)
+    m = len(pattern)
+    ms, j, k, p = -1, 0, 1, 1
+    while j + k < m:
+        a = pattern[j + k]
+        b = pattern[ms + k]
+        if (a > b) if reverse else (a < b):
+            j += k
+            k = 1
+            p = j - ms
+        elif a == b:
+            if k != p:
+                k += 1
+            else:
+                j += p
+                k = 1
+        else:
+            ms = j
+            j = ms + 1
+            k = p = 1
+    return ms, p
+
+
+def two_way_finditer(text: str, pattern: str, overlapping: bool = True) -> Iterator[int]:
+    if not pattern:
+        return _empty_finditer(text)
+    return _two_way_iter(text, pattern, _two_way_factor(pattern), overlapping)
+
+
+def _two_way_factor(pattern) -> Tuple[int, int, bool]:
+    # критична факторизація pattern = u·v: ell — останній індекс u, per — зсув,
+    # periodic — чи u є суфіксом v[:per] (тоді періодом шаблону є per)
+    i, p = _maximal_suffix(pattern, False)
+    j, q = _maximal_suffix(pattern, True)
+    ell, per = (i, p) if i > j else (j, q)
+    if pattern[:ell + 1] == pattern[per:per + ell + 1]:
+        return ell, per, True
+    m = len(pattern)
+    return ell, max(ell + 1, m - ell - 1) + 1, False
+
+
+def _two_way_iter(text: str, pattern: str, factor: Tuple[int, int, bool], overlapping: bool) -> Iterator[int]:
+    ell, per, periodic = factor
+    m = len(pattern)
+    n = len(text)
+    s = 0
+    memory = -1  # лише для періодичного шаблону: pattern[:memory+1] уже перевірено
+    while s <= n - m:
+        i = max(ell, memory) + 1
+        while i < m and pattern[i] == text[s + i]:  # права частина — зліва направо
+            i += 1
+        if i < m:
+            s += i - ell
+            memory = -1
+            continue
+        i = ell
+        while i > memory and pattern[i] == text[s + i]:  # ліва частина — справа наліво
+            i -= 1
+        if i <= memory:
+            yield s
+            if not overlapping:
+                s += m
+                memory = -1
+                continue
+        s += per
+        memory = m - per - 1 if periodic else -1
+
+
+def two_way_search(text: str, pattern: str) -> int:
+    return next(two_way_finditer(text, pattern), -1)
+
+
+BITAP_DISTANCES = ("hamming", "levenshtein")
+
+
+def _bitap_masks(pattern) -> dict:
+    # біт i маски символу c піднятий, якщо pattern[i] == c
+    masks: dict = {}
+    for i, c in enumerate(pattern):
+        masks[c] = masks.get(c, 0) | (1 << i)
+    return masks
+
+
+def bitap_finditer(text: str, pattern: str, k: int = 0, distance: str = "hamming") -> Iterator[Tuple[int, int]]:
+    # Shift-And з k+1 бітовими векторами (Python int довільної довжини, тож m не обмежене
+    # машинним словом): біт i вектора R[d] — pattern[:i+1] збігається з кінцем прочитаного
+    # тексту з <= d помилками. Збіг — піднятий біт m-1.
+    if distance not in BITAP_DISTANCES:
+        raise ValueError(f"Невідома відстань: {distance!r} (доступні: {', '.join(BITAP_DISTANCES)})")
+    if k < 0:
+        raise ValueError("k має бути >= 0")
+    m = len(pattern)
+    if m == 0:
+        return ((i, 0) for i in range(len(text) + 1))
+    return _bitap_iter(text, _bitap_masks(pattern), m, k, distance == "levenshtein")
+
+
+def _bitap_iter(text: str, masks: dict, m: int, k: int, edits: bool) -> Iterator[Tuple[int, int]]:
+    full = (1 << m) - 1
+    hi = 1 << (m - 1)
+    # Левенштейн: перші d символів шаблону можна «видалити» ще до початку тексту
+    rows = [(1 << d) - 1 if edits else 0 for d in range(k + 1)]
+    get = masks.get
+    for i, c in enumerate(text):
+        mask = get(c, 0)
+        prev_old = rows[0]
+        cur = ((prev_old << 1) | 1) & mask
+        rows[0] = cur
+        found = 0 if cur & hi else -1
+        for d in range(1, k + 1):
+            old = rows[d]
+            new = (((old << 1) | 1) & mask) | ((prev_old << 1) | 1)  # збіг | заміна
+            if edits:
+                new |= prev_old | ((cur << 1) | 1)  # вставка в тексті | пропуск символу шаблону
+            cur = new & full
+            rows[d] = cur
+            prev_old = old
+            if found < 0 and cur & hi:
+                found = d
+        if found >= 0:
+            yield i + 1, found
+
+
+def _bitap_start(text: str, pattern: str, end: int, k: int) -> int:
+    # Лівий край збігу Левенштейна, що закінчується в end: DP по розвернутих рядках,
+    # беремо найдовший фрагмент text[s:end] з відстанню <= k
+    m = len(pattern)
+    col = list(range(m + 1))  # відстань pattern[m-j:] до порожнього фрагмента
+    best = end if m <= k else -1
+    for l in range(1, min(end, m + k) + 1):
+        c = text[end - l]
+        nxt = [0] * (m + 1)
+        nxt[0] = l
+        for j in range(1, m + 1):
+            cost = 0 if pattern[m - j] == c else 1
+            nxt[j] = min(col[j - 1] + cost, col[j] + 1, nxt[j - 1] + 1)
+        col = nxt
+        if col[m] <= k:
+            best = end - l
+    return best
+
+
+def bitap_search(text: str, pattern: str, k: int = 0, distance: str = "hamming") -> int:
+    """Початок першого (за кінцем) збігу з <= k помилками або -1."""
+    first = next(bitap_finditer(text, pattern, k, distance), None)
+    if first is None:
+        return -1
+    end = first[0]
+    if distance == "hamming":
+        return end - len(pattern)
+    return _bitap_start(text, pattern, end, k)
+
+
+class CompiledPattern(ABC):
+    # Базовий клас: препроцесинг у конструкторі, далі лише сканування (finditer — у нащадках)
+    __slots__ = ("pattern",)
+    algo = ""
+
+    def __init__(self, pattern: str) -> None:
+        self.pattern = pattern
+
+    @abstractmethod
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        ...
+
+    def search(self, text: str) -> int:
+        return next(self.finditer(text), -1)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.pattern!r})"
+
+
+class KMPPattern(CompiledPattern):
+    __slots__ = ("lps",)
+    algo = "kmp"
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__(pattern)
+        self.lps = _kmp_lps(pattern)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        if not self.pattern:
+            return _empty_finditer(text)
+        return _kmp_iter(text, self.pattern, self.lps, overlapping)
+
+
+class BMHPattern(CompiledPattern):
+    __slots__ = ("skip",)
+    algo = "bmh"
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__(pattern)
+        self.skip = _bmh_skip(pattern)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        if not self.pattern:
+            return _empty_finditer(text)
+        return _bmh_iter(text, self.pattern, self.skip, overlapping)
+
+
+class RabinKarpPattern(CompiledPattern):
+    __slots__ = ("base", "mod", "high", "ph")
+    algo = "rabin_karp"
+
+    def __init__(self, pattern: str, base: int = 256, mod: int = 10**9 + 7) -> None:
+        super().__init__(pattern)
+        self.base = base
+        self.mod = mod
+        self.high = pow(base, max(len(pattern) - 1, 0), mod)
+        self.ph = _rk_hash(pattern, base, mod)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        if not self.pattern:
+            return _empty_finditer(text)
+        return _rk_iter(text, self.pattern, self.ph, self.high, overlapping, self.base, self.mod)
+
+
+class BMPattern(CompiledPattern):
+    __slots__ = ("last", "shift")
+    algo = "bm"
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__(pattern)
+        self.last = _bm_last(pattern)
+        self.shift = _bm_good_suffix(pattern)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        if not self.pattern:
+            return _empty_finditer(text)
+        return _bm_iter(text, self.pattern, self.last, self.shift, overlapping)
+
+
+class TwoWayPattern(CompiledPattern):
+    __slots__ = ("factor",)
+    algo = "two_way"
+
+    def __init__(self, pattern: str) -> None:
+        super().__init__(pattern)
+        self.factor = _two_way_factor(pattern) if pattern else (-1, 1, True)
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[int]:
+        if not self.pattern:
+            return _empty_finditer(text)
+        return _two_way_iter(text, self.pattern, self.factor, overlapping)
+
+
+COMPILED = {
+    "kmp": KMPPattern,
+    "bmh": BMHPattern,
+    "rabin_karp": RabinKarpPattern,
+    "bm": BMPattern,
+    "two_way": TwoWayPattern,
+}
+
+COMPILE_CACHE_SIZE = 512
+
+
+@lru_cache(maxsize=COMPILE_CACHE_SIZE)
+def compile_pattern(pattern: str, algo: str = "kmp") -> CompiledPattern:
+    # Повторна компіляція того самого (pattern, algo) береться з LRU-кешу
+    try:
+        cls = COMPILED[algo]
+    except KeyError:
+        raise ValueError(f"Невідомий алгоритм: {algo!r} (доступні: {', '.join(COMPILED)})") from None
+    return cls(pattern)
+
+
+MMAP_CHUNK = 16 * 1024 * 1024
+
+
+def mmap_finditer(
+    path,
+    pattern: bytes,
+    algo: str = "kmp",
+    overlapping: bool = True,
+    chunk_size: int = MMAP_CHUNK,
+) -> Iterator[int]:
+    # Файл відображається у пам'ять і скануються вікна [start, start + chunk + m - 1):
+    # збіг, що перетинає межу chunk, повністю потрапляє у вікно, де він починається,
+    # а збіги з початком поза chunk відкидаються — їх знайде наступне вікно.
+    cp = compile_pattern(bytes(pattern), algo)
+    m = len(pattern)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if m == 0:
+            yield from range(size + 1)
+            return
+        if m > size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            nxt = 0  # для неперекривного режиму: найменший дозволений початок
+            for start in range(0, size - m + 1, chunk_size):
+                window = mm[start:min(size, start + chunk_size + m - 1)]
+                for i in cp.finditer(window):
+                    if i >= chunk_size:
+                        break
+                    pos = start + i
+                    if pos < nxt:
+                        continue
+                    yield pos
+                    if not overlapping:
+                        nxt = pos + m
+
+
+def mmap_search(path, pattern: bytes, algo: str = "kmp") -> int:
+    return next(mmap_finditer(path, pattern, algo), -1)
+
+
+PARALLEL_MIN_CHUNK = 1 << 20
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+
+def _parallel_chunk(task) -> List[int]:
+    # Виконується в процесі пулу: вікно [start, end + m - 1), збіги з початком у [start, end)
+    source, start, end, pattern, algo = task
+    cp = compile_pattern(pattern, algo)
+    m = len(pattern)
+    if isinstance(source, os.PathLike):
+        with open(source, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            window = mm[start:end + m - 1]
+    else:
+        window = source
+    limit = end - start
+    out = []
+    for i in cp.finditer(window):
+        if i >= limit:
+            break
+        out.append(start + i)
+    return out
+
+
+def parallel_search(
+    text_or_path,
+    pattern,
+    algo: str = "kmp",
+    workers: int | None = None,
+    overlapping: bool = True,
+) -> List[int]:
+    """Усі входження pattern у зростаючому порядку, пошук на пулі процесів.
+
+    text_or_path — str/bytes або pathlib.Path (тоді pattern — bytes, а
+    зміщення — байтові). workers=1 — без пулу, у поточному процесі.
+    """
+    is_path = isinstance(text_or_path, os.PathLike)
+    if is_path:
+        pattern = pattern.encode("utf-8") if isinstance(pattern, str) else bytes(pattern)
+        n = os.path.getsize(text_or_path)
+    else:
+        n = len(text_or_path)
+    m = len(pattern)
+    if m == 0:
+        return list(range(n + 1))
+    if m > n:
+        return []
+    compile_pattern(pattern, algo)  # невідомий algo — ValueError ще до запуску пулу
+
+    workers = workers or os.cpu_count() or 1
+    chunk = max(-(-n // (workers * PARALLEL_CHUNKS_PER_WORKER)), PARALLEL_MIN_CHUNK, m)
+    tasks = []
+    for start in range(0, n - m + 1, chunk):
+        end = min(start + chunk, n - m + 1)
+        source = text_or_path if is_path else text_or_path[start:end + m - 1]
+        tasks.append((source, start, end, pattern, algo))
+
+    if workers == 1 or len(tasks) == 1:
+        parts = map(_parallel_chunk, tasks)
+        hits = [i for part in parts for i in part]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            # map зберігає порядок задач, а задачі впорядковані за зміщенням
+            hits = [i for part in pool.map(_parallel_chunk, tasks) for i in part]
+
+    if overlapping:
+        return hits
+    # жадібний відбір зліва направо = неперекривний прохід одним потоком
+    out: List[int] = []
+    nxt = 0
+    for i in hits:
+        if i >= nxt:
+            out.append(i)
+            nxt = i + m
+    return out
+
+
+class KMPStreamMatcher:
+    # KMP онлайн: між шматками зберігаються лише поточна довжина збігу j і позиція
+    __slots__ = ("pattern", "lps", "overlapping", "_j", "_pos")
+
+    def __init__(self, pattern, overlapping: bool = True) -> None:
+        if not pattern:
+            raise ValueError("Порожній шаблон для потокового пошуку")
+        self.pattern = pattern
+        self.lps = compile_pattern(pattern, "kmp").lps
+        self.overlapping = overlapping
+        self._j = 0
+        self._pos = 0
+
+    def feed(self, chunk) -> List[int]:
+        pattern, lps, m = self.pattern, self.lps, len(self.pattern)
+        base = self._pos - m + 1
+        j = self._j
+        found: List[int] = []
+        for i, ch in enumerate(chunk):
+            while j > 0 and ch != pattern[j]:
+                j = lps[j - 1]
+            if ch == pattern[j]:
+                j += 1
+                if j == m:
+                    found.append(base + i)
+                    j = lps[j - 1] if self.overlapping else 0
+        self._j = j
+        self._pos += len(chunk)
+        return found
+
+
+class RabinKarpStreamMatcher:
+    # Ролінг-хеш онлайн: зберігається хвіст з останніх m-1 символів;
+    # новий шматок сканується разом із хвостом, тож збіги на межі не губляться
+    __slots__ = ("pattern", "overlapping", "base", "mod", "_ph", "_high", "_tail", "_pos", "_next")
+
+    def __init__(self, pattern, overlapping: bool = True, base: int = 256, mod: int = 10**9 + 7) -> None:
+        if not pattern:
+            raise ValueError("Порожній шаблон для потокового пошуку")
+        self.pattern = pattern
+        self.overlapping = overlapping
+        self.base = base
+        self.mod = mod
+        self._ph = _rk_hash(pattern, base, mod)
+        self._high = pow(base, len(pattern) - 1, mod)
+        self._tail = pattern[:0]  # порожній str або bytes
+        self._pos = 0
+        self._next = 0
+
+    def feed(self, chunk) -> List[int]:
+        m = len(self.pattern)
+        buf = self._tail + chunk
+        start = self._pos - len(self._tail)
+        found: List[int] = []
+        for i in _rk_iter(buf, self.pattern, self._ph, self._high, True, self.base, self.mod):
+            p = start + i
+            if p >= self._next:
+                found.append(p)
+                if not self.overlapping:
+                    self._next = p + m
+        self._tail = buf[max(0, len(buf) - (m - 1)):]
+        self._pos += len(chunk)
+        return found
+
+
+STREAM_MATCHERS = {
+    "kmp": KMPStreamMatcher,
+    "rabin_karp": RabinKarpStreamMatcher,
+}
+
+
+def stream_matcher(pattern, algo: str = "kmp", overlapping: bool = True):
+    try:
+        cls = STREAM_MATCHERS[algo]
+    except KeyError:
+        raise ValueError(f"Невідомий потоковий алгоритм: {algo!r} (доступні: {', '.join(STREAM_MATCHERS)})") from None
+    return cls(pattern, overlapping)
+
+
+def _short_reads(stream, chunk_size: int) -> Iterator:
+    # read(n) буферизованого потоку (pipe, socket.makefile(), sys.stdin.buffer) чекає,
+    # доки назбирається n байтів або настане EOF; read1(n) віддає те, що вже надійшло.
+    # Текстовий потік (TextIOWrapper) читається лише через власний read(n): обхід через
+    # .buffer загубив би вже забуферизований текст і переклад кінців рядків (\r\n -> \n);
+    # для коротких читань передавайте бінарний потік (sys.stdin.buffer).
+    read1 = getattr(stream, "read1", None)
+    if read1 is not None:
+        while chunk := read1(chunk_size):
+            yield chunk
+        return
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+def stream_finditer(stream, pattern, algo: str = "kmp", overlapping: bool = True, chunk_size: int = 64 * 1024) -> Iterator[int]:
+    # stream — будь-який об'єкт з read(n): файл, sys.stdin / sys.stdin.buffer, socket.makefile();
+    # дані подаються в matcher одразу, як надходять (короткі читання), а не по chunk_size
+    matcher = stream_matcher(pattern, algo, overlapping)
+    for chunk in _short_reads(stream, chunk_size):
+        yield from matcher.feed(chunk)
+
+
+# Поліноміальний хеш за модулем 2^64 (переповнення uint64 у numpy — і є mod);
+# основа непарна, тож має обернений елемент і хеш вікна можна нормалізувати
+NP_HASH_BASE = 0x100000001B3
+_MASK64 = (1 << 64) - 1
+NP_VERIFY_BLOCK = 1 << 16
+
+
+def _np_powers(base: int, n: int):
+    # base^0 .. base^n (mod 2^64)
+    pows = np.empty(n + 1, dtype=np.uint64)
+    pows[0] = 1
+    if n:
+        pows[1:] = np.cumprod(np.full(n, base, dtype=np.uint64), dtype=np.uint64)
+    return pows
+
+
+def _np_codes(seq):
+    # коди символів як uint32: для str — через UTF-32 (без циклу в Python)
+    if isinstance(seq, str):
+        return np.frombuffer(seq.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+    return np.frombuffer(bytes(seq), dtype=np.uint8).astype(np.uint32)
+
+
+def _poly_hash64(pattern) -> int:
+    h = 0
+    for c in _codes(pattern):
+        h = (h * NP_HASH_BASE + c) & _MASK64
+    return h
+
+
+class CodepointText:
+    """
+    Текст як масив кодів uint32 із префіксними хешами (numpy).
+
+    prefix[k] = Σ_{j<k} c_j · B^(n-1-j), тож для вікна [i, i+m):
+    prefix[i+m] - prefix[i] = B^(n-m-i) · hash(i); множення на B^-(n-m-i)
+    дає нормалізований хеш — для всіх i одним векторним виразом.
+    Пам'ять — кілька масивів по 8 байт на символ.
+    """
+
+    __slots__ = ("text", "codes", "_prefix", "_inv")
+
+    def __init__(self, text) -> None:
+        if np is None:
+            raise RuntimeError("Для CodepointText потрібен numpy: pip install numpy")
+        codes = _np_codes(text)
+        n = len(codes)
+        pows = _np_powers(NP_HASH_BASE, n)
+        prefix = np.zeros(n + 1, dtype=np.uint64)
+        if n:
+            np.cumsum(codes.astype(np.uint64) * pows[n - 1::-1][:n], dtype=np.uint64, out=prefix[1:])
+        self.text = text
+        self.codes = codes
+        self._prefix = prefix
+        self._inv = _np_powers(pow(NP_HASH_BASE, -1, 1 << 64), n)
+
+    def window_hashes(self, m: int):
+        """Хеші всіх вікон довжини m (масив довжини n-m+1)."""
+        n = len(self.codes)
+        if m > n:
+            return np.empty(0, dtype=np.uint64)
+        p = self._prefix
+        return (p[m:] - p[:n - m + 1]) * self._inv[n - m::-1]
+
+    def _verify(self, starts, pattern_codes):
+        # кандидати перевіряються блоками: вікна block × m через fancy-indexing
+        m = len(pattern_codes)
+        if len(starts) == 0:
+            return starts
+        offsets = np.arange(m)
+        step = max(1, NP_VERIFY_BLOCK // m)
+        keep = []
+        for b in range(0, len(starts), step):
+            block = starts[b:b + step]
+            windows = self.codes[block[:, None] + offsets]
+            keep.append(block[(windows == pattern_codes).all(axis=1)])
+        return np.concatenate(keep)
+
+    def findall(self, pattern) -> List[int]:
+        """Усі входження (з перекриттями): векторні хеші + пакетна перевірка кандидатів."""
+        m = len(pattern)
+        if m == 0:
+            return list(range(len(self.codes) + 1))
+        pc = _np_codes(pattern)
+        starts = np.flatnonzero(self.window_hashes(m) == np.uint64(_poly_hash64(pattern)))
+        return self._verify(starts, pc).tolist()
+
+    def find_many(self, patterns: Iterable) -> List[Tuple[str, int]]:
+        """Усі входження багатьох шаблонів: для кожної довжини — один прохід по хешах
+        вікон і пошук у множині хешів шаблонів (np.isin); кандидати групуються за
+        хешем (сортування + searchsorted) і перевіряються пакетно через _verify."""
+        by_len: Dict[int, Dict[int, List]] = {}
+        for p in dict.fromkeys(patterns):
+            if p:
+                by_len.setdefault(len(p), {}).setdefault(_poly_hash64(p), []).append(p)
+        found: List[Tuple[str, int]] = []
+        for m, table in by_len.items():
+            hashes = self.window_hashes(m)
+            keys = np.fromiter(table, dtype=np.uint64, count=len(table))
+            starts = np.flatnonzero(np.isin(hashes, keys))
+            if len(starts) == 0:
+                continue
+            # стабільне сортування за хешем: кандидати кожного шаблону — суцільний
+            # відрізок, усередині якого зміщення лишаються зростаючими
+            order = np.argsort(hashes[starts], kind="stable")
+            starts, cand = starts[order], hashes[starts][order]
+            bounds = np.searchsorted(cand, keys, side="left"), np.searchsorted(cand, keys, side="right")
+            for (h, pats), lo, hi in zip(table.items(), *bounds):
+                for p in pats:
+                    found.extend((p, i) for i in self._verify(starts[lo:hi], _np_codes(p)).tolist())
+        found.sort(key=lambda x: x[1])
+        return found
+
+
+def numpy_rabin_karp_findall(text, pattern) -> List[int]:
+    if np is None:
+        return list(rabin_karp_finditer(text, pattern))
+    return CodepointText(text).findall(pattern)
+
+
+def numpy_rabin_karp_search(text, pattern) -> int:
+    found = numpy_rabin_karp_findall(text, pattern)
+    return found[0] if found else -1
+
+
+class AhoCorasick:
+    """
+    Автомат Ахо—Корасік для пошуку багатьох шаблонів за один прохід.
+
+    Будується один раз: алфавіт шаблонів стискається до щільних номерів
+    класів (0 — «символ поза шаблонами»), goto — повна таблиця переходів
+    (DFA) у плоскому array('i'), fail — масив суфіксних посилань.
+    Стани в goto зберігаються вже помноженими на розмір алфавіту, тож
+    крок сканування — один пошук у dict класів і одне читання масиву.
+    Сканування — O(n + кількість збігів).
+    """
+
+    __slots__ = ("patterns", "_classes", "_sigma", "_goto", "_fail", "_out", "_lens")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        pats = list(dict.fromkeys(p for p in patterns if p))  # без порожніх і повторів
+        classes: dict = {}
+        for p in pats:
+            for ch in p:
+                if ch not in classes:
+                    classes[ch] = len(classes) + 1
+        sigma = len(classes) + 1
+        blank = array("i", [-1]) * sigma
+
+        # 1) бор (trie): goto[s*sigma + c] = наступний стан або -1
+        goto = array("i", blank)
+        out: List[Tuple[int, ...]] = [()]
+        for pid, p in enumerate(pats):
+            s = 0
+            for ch in p:
+                i = s * sigma + classes[ch]
+                if goto[i] == -1:
+                    goto[i] = len(out)
+                    goto.extend(blank)
+                    out.append(())
+                s = goto[i]
+            out[s] = (pid,)
+
+        # 2) BFS: fail-посилання, злиття виходів і добудова DFA
+        fail = array("i", [0]) * len(out)
+        queue: deque = deque()
+        for c in range(sigma):
+            t = goto[c]
+            if t == -1:
+                goto[c] = 0
+            else:
+                queue.append(t)
+        while queue:
+            s = queue.popleft()
+            f = fail[s]
+            if out[f]:
+                out[s] = out[s] + out[f]
+            base, fbase = s * sigma, f * sigma
+            for c in range(sigma):
+                t = goto[base + c]
+                if t == -1:
+                    goto[base + c] = goto[fbase + c]
+                else:
+                    fail[t] = goto[fbase + c]
+                    queue.append(t)
+
+        for i in range(len(goto)):  # стани -> зміщення рядка в таблиці
+            goto[i] *= sigma
+
+        self.patterns = pats
+        self._classes = classes
+        self._sigma = sigma
+        self._goto = goto
+        self._fail = fail
+        self._out = {s * sigma: o for s, o in enumerate(out) if o}
+        self._lens = [len(p) for p in pats]
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Усі входження (шаблон, зміщення початку), включно з перекриттями."""
+        goto, classes, out = self._goto, self._classes, self._out
+        pats, lens = self.patterns, self._lens
+        s = 0
+        for i, ch in enumerate(text):
+            s = goto[s + classes.get(ch, 0)]
+            if s in out:
+                for pid in out[s]:
+                    yield pats[pid], i - lens[pid] + 1
+
+    def findall(self, text: str) -> List[Tuple[str, int]]:
+        return list(self.finditer(text))
+
+
+def aho_corasick_search(text: str, patterns: Iterable[str]) -> List[Tuple[str, int]]:
+    return AhoCorasick(patterns).findall(text)
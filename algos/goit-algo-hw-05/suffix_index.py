@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Індекс для повторних запитів до фіксованого корпусу:
+- суфіксний масив (подвоєння префіксів Манбера—Маєрса з сортуванням
+  підрахунком — O(n log n), ранній вихід, коли всі ранги різні);
+- LCP-масив (алгоритм Касаї, O(n));
+- обидва — компактні array('i'), опційно зберігаються на диск.
+
+Пошук шаблону — два бінарні пошуки по SA: O(m log n), кількість входжень —
+різниця меж діапазону.
+"""
+
+from __future__ import annotations
+import hashlib
+import struct
+from array import array
+from pathlib import Path
+from typing import List, Tuple
+
+_MAGIC = b"SAIX1\0"
+_HEADER = struct.Struct("<6sQ32s")  # magic, n, blake2b(text)
+
+
+def build_suffix_array(text) -> array:
+    n = len(text)
+    if n == 0:
+        return array("i")
+    codes = list(map(ord, text)) if isinstance(text, str) else list(text)
+    alphabet = {c: r for r, c in enumerate(sorted(set(codes)))}
+    rank = [alphabet[c] for c in codes]
+    sa = sorted(range(n), key=rank.__getitem__)
+    classes = len(alphabet)
+    k = 1
+    while classes < n:
+        # другий ключ (rank[i+k]) уже впорядкований: спершу суфікси без пари,
+        # далі — у порядку sa, зсунуті на k; лишається стабільно відсортувати за rank[i]
+        order = list(range(n - k, n))
+        order.extend(i - k for i in sa if i >= k)
+        cnt = [0] * (classes + 1)
+        for r in rank:
+            cnt[r + 1] += 1
+        for r in range(classes):
+            cnt[r + 1] += cnt[r]
+        sa = [0] * n
+        for i in order:
+            r = rank[i]
+            sa[cnt[r]] = i
+            cnt[r] += 1
+
+        # пара (rank[i], rank[i+k]) як одне ціле; відсутній другий ранг — 0
+        second = rank[k:] + [-1] * k
+        new_rank = [0] * n
+        prev_key = -1
+        classes = 0
+        for i in sa:
+            key = rank[i] * (n + 1) + second[i] + 1
+            if key != prev_key:
+                classes += 1
+                prev_key = key
+            new_rank[i] = classes - 1
+        rank = new_rank
+        k *= 2
+    return array("i", sa)
+
+
+def build_lcp(text, sa: array) -> array:
+    # lcp[i] — довжина спільного префікса суфіксів sa[i-1] і sa[i] (lcp[0] = 0)
+    n = len(text)
+    lcp = array("i", [0]) * n
+    rank = array("i", [0]) * n
+    for i, p in enumerate(sa):
+        rank[p] = i
+    h = 0
+    for p in range(n):
+        r = rank[p]
+        if r == 0:
+            h = 0
+            continue
+        q = sa[r - 1]
+        while p + h < n and q + h < n and text[p + h] == text[q + h]:
+            h += 1
+        lcp[r] = h
+        if h:
+            h -= 1
+    return lcp
+
+
+def _text_digest(text) -> bytes:
+    data = text.encode("utf-8", "surrogatepass") if isinstance(text, str) else bytes(text)
+    return hashlib.blake2b(data, digest_size=32).digest()
+
+
+class SuffixIndex:
+    """Суфіксний масив + LCP над фіксованим текстом; запити O(m log n)."""
+
+    __slots__ = ("text", "sa", "lcp")
+
+    def __init__(self, text, sa: array | None = None, lcp: array | None = None) -> None:
+        self.text = text
+        self.sa = sa if sa is not None else build_suffix_array(text)
+        self.lcp = lcp if lcp is not None else build_lcp(text, self.sa)
+
+    def _range(self, pattern) -> Tuple[int, int]:
+        text, sa, m = self.text, self.sa, len(pattern)
+        lo, hi = 0, len(sa)
+        while lo < hi:  # перший суфікс, префікс якого >= pattern
+            mid = (lo + hi) // 2
+            if text[sa[mid]:sa[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        start, hi = lo, len(sa)
+        while lo < hi:  # перший суфікс, префікс якого > pattern
+            mid = (lo + hi) // 2
+            if text[sa[mid]:sa[mid] + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def count(self, pattern) -> int:
+        if not pattern:
+            return len(self.text) + 1
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def find_all(self, pattern) -> List[int]:
+        """Усі входження (з перекриттями) у зростаючому порядку."""
+        if not pattern:
+            return list(range(len(self.text) + 1))
+        lo, hi = self._range(pattern)
+        return sorted(self.sa[lo:hi])
+
+    def search(self, pattern) -> int:
+        """Перше входження або -1 — як *_search у search_algorithms."""
+        if not pattern:
+            return 0
+        lo, hi = self._range(pattern)
+        return min(self.sa[lo:hi]) if hi > lo else -1
+
+    def save(self, path) -> None:
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, len(self.sa), _text_digest(self.text)))
+            f.write(self.sa.tobytes())
+            f.write(self.lcp.tobytes())
+
+    @classmethod
+    def load(cls, path, text) -> "SuffixIndex":
+        """Читає SA/LCP з диска; текст передається окремо і звіряється з хешем."""
+        with open(path, "rb") as f:
+            magic, n, digest = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC:
+                raise ValueError(f"{path}: не файл суфіксного індексу")
+            if n != len(text) or digest != _text_digest(text):
+                raise ValueError(f"{path}: індекс побудовано для іншого тексту")
+            sa, lcp = array("i"), array("i")
+            sa.fromfile(f, n)
+            lcp.fromfile(f, n)
+        return cls(text, sa, lcp)
+
+    @classmethod
+    def load_or_build(cls, path, text) -> "SuffixIndex":
+        """Кеш на диску: завантажує індекс, якщо він є і відповідає тексту, інакше будує й зберігає."""
+        p = Path(path)
+        if p.exists():
+            try:
+                return cls.load(p, text)
+            except (ValueError, EOFError, struct.error):
+                pass
+        index = cls(text)
+        index.save(p)
+        return index
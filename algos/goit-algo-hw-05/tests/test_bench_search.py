@@ -0,0 +1,62 @@
+# tests/test_bench_search.py
+import json
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import bench_search  # noqa: E402
+
+
+# --------------------- офлайн-корпус і сітка параметрів (user-040) --------------------- #
+
+def test_synthetic_text_is_reproducible_and_uses_alphabet():
+    a = bench_search.synthetic_text(5000, 4, 0.5, seed=7)
+    assert a == bench_search.synthetic_text(5000, 4, 0.5, seed=7)
+    assert a != bench_search.synthetic_text(5000, 4, 0.5, seed=8)
+    assert len(a) == 5000 and set(a) <= set(bench_search.syn_alphabet(4))
+    wide = bench_search.synthetic_text(2000, 200, seed=1)
+    assert len(set(wide)) > len(bench_search.SYN_ALPHABET)  # алфавіт, ширший за базовий
+
+
+def test_sweep_case_places_pattern_and_finds_absent_one():
+    rnd = random.Random(40)
+    text = bench_search.synthetic_text(1000, 26, seed=2)
+    for _, where in bench_search.SWEEP_POSITIONS:
+        case = bench_search.sweep_case(text, 8, where, 26, rnd)
+        txt, pat = case
+        assert len(txt) == len(text) and len(pat) == 8
+        if where is None:
+            assert pat not in txt
+        else:
+            assert txt.find(pat) <= min(len(text) - 8, int(where * len(text)))
+    full = bench_search.syn_alphabet(2) * 50  # усі 1-символьні шаблони вже є в тексті
+    assert bench_search.sweep_case(full, 1, None, 2, rnd) is None
+
+
+def test_fetch_text_cached_never_touches_network_twice(monkeypatch, tmp_path):
+    calls = []
+    monkeypatch.setattr(bench_search, "fetch_text_from_url", lambda url: calls.append(url) or "корпус")
+    url = "https://drive.google.com/file/d/abc/view"
+    with pytest.raises(FileNotFoundError):
+        bench_search.fetch_text_cached(url, tmp_path, offline=True)
+    assert bench_search.fetch_text_cached(url, tmp_path) == "корпус"
+    assert bench_search.fetch_text_cached(url, tmp_path, offline=True) == "корпус"
+    assert calls == [url]
+
+
+def test_sweep_rows_and_json_report(tmp_path):
+    rows = bench_search.bench_sweep(400, [4], [3], 0.0, seed=3, repeats=1)
+    algos = set(bench_search.ALGOS) | set(bench_search.BASELINES)
+    assert {r["algo"] for r in rows} == algos
+    assert len(rows) <= len(algos) * len(bench_search.SWEEP_POSITIONS)
+    path = tmp_path / "out.json"
+    bench_search.write_json(rows, path, bench_search.run_meta())
+    report = json.loads(path.read_text(encoding="utf-8"))
+    assert report["rows"] == rows and report["meta"]["python"]
@@ -0,0 +1,101 @@
+# tests/test_ngram_index.py
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from ngram_index import NgramIndex, iter_varints, put_varint  # noqa: E402
+
+
+def write_docs(root, docs):
+    root.mkdir(parents=True, exist_ok=True)
+    for name, text in docs.items():
+        (root / name).write_text(text, encoding="utf-8")
+
+
+def brute(root, pattern):
+    out = {}
+    for p in sorted(root.rglob("*.txt")):
+        text = p.read_text(encoding="utf-8")
+        hits = [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+        if hits:
+            out[str(p)] = hits
+    return out
+
+
+# ----------------------------- n-грамний індекс (user-042) ----------------------------- #
+
+def test_varint_round_trip_and_size():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 2**32 - 1]
+    buf = bytearray()
+    for v in values:
+        put_varint(buf, v)
+    assert list(iter_varints(buf)) == values
+    small = bytearray()
+    for _ in range(1000):
+        put_varint(small, 1)  # щільні id: різниця 1 — один байт
+    assert len(small) == 1000
+
+
+def test_search_matches_brute_force(tmp_path):
+    rnd = random.Random(42)
+    root = tmp_path / "docs"
+    write_docs(root, {f"d{i}.txt": "".join(rnd.choice("abcд ") for _ in range(200)) for i in range(30)})
+    index = NgramIndex()
+    assert index.add_dir(root) == 30
+    for pattern in ("ab", "abc", "д a", "abcab", "zzz", "a"):
+        assert index.search(pattern) == brute(root, pattern)
+    dense = index.postings["abc"] if "abc" in index.postings else b""
+    assert len(dense) <= 30  # id зростають з кроком ~1 — по байту на документ
+
+
+def test_incremental_changes_and_deleted_files(tmp_path):
+    root = tmp_path / "docs"
+    write_docs(root, {"a.txt": "hello world", "b.txt": "hello there"})
+    path = tmp_path / "index.ngx"
+    index = NgramIndex.load_or_build(path, root)
+    assert sorted(index.search("hello")) == sorted(str(root / n) for n in ("a.txt", "b.txt"))
+
+    (root / "b.txt").unlink()
+    (root / "a.txt").write_text("goodbye world!", encoding="utf-8")
+    index = NgramIndex.load_or_build(path, root)
+    assert len(index) == 1
+    assert index.search("hello") == {}
+    assert index.search("world") == {str(root / "a.txt"): [8]}
+    assert NgramIndex.load(path).search("world") == {str(root / "a.txt"): [8]}
+
+    (root / "b.txt").write_text("hello again", encoding="utf-8")
+    assert NgramIndex.load_or_build(path, root).search("hello") == {str(root / "b.txt"): [0]}
+
+
+def test_finditer_skips_files_removed_after_indexing(tmp_path):
+    root = tmp_path / "docs"
+    write_docs(root, {"a.txt": "needle one", "b.txt": "needle two"})
+    index = NgramIndex()
+    index.add_dir(root)
+    (root / "a.txt").unlink()
+    assert index.search("needle") == {str(root / "b.txt"): [0]}
+    assert len(index) == 1
+
+
+def test_add_requires_file_on_disk(tmp_path):
+    index = NgramIndex()
+    with pytest.raises(FileNotFoundError):
+        index.add(tmp_path / "virtual.txt")
+    assert len(index) == 0 and not index.postings
+    write_docs(tmp_path, {"real.txt": "needle in here"})
+    index.add(tmp_path / "real.txt")
+    assert index.search("needle") == {str(tmp_path / "real.txt"): [0]}
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    bad = tmp_path / "bad.ngx"
+    bad.write_bytes(b"NOTIDX" + b"\0" * 10)
+    with pytest.raises(ValueError):
+        NgramIndex.load(bad)
@@ -0,0 +1,380 @@
+# tests/test_search_algorithms.py
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import search_algorithms as sa  # noqa: E402
+
+
+def naive_all(text, pattern):
+    """Еталон: усі входження з перекриттями."""
+    m = len(pattern)
+    return [i for i in range(len(text) - m + 1) if text[i:i + m] == pattern]
+
+
+def random_text(rnd, n, alphabet="ab"):
+    return "".join(rnd.choice(alphabet) for _ in range(n))
+
+
+# ----------------------------- Aho–Corasick (user-031) ----------------------------- #
+
+def test_aho_corasick_matches_naive_on_random_texts():
+    rnd = random.Random(31)
+    for _ in range(200):
+        text = random_text(rnd, rnd.randint(0, 60), "abc")
+        patterns = [random_text(rnd, rnd.randint(1, 4), "abc") for _ in range(rnd.randint(1, 6))]
+        expected = sorted((p, i) for p in set(patterns) for i in naive_all(text, p))
+        assert sorted(sa.aho_corasick_search(text, patterns)) == expected
+
+
+def test_aho_corasick_nested_patterns_and_foreign_symbols():
+    ac = sa.AhoCorasick(["he", "she", "his", "hers", "", "he"])
+    assert ac.patterns == ["he", "she", "his", "hers"]
+    assert sorted(ac.findall("ushers! їhe")) == [("he", 2), ("he", 9), ("hers", 2), ("she", 1)]
+    assert sa.AhoCorasick([]).findall("anything") == []
+
+
+def test_bench_multi_baseline_reports_every_occurrence():
+    import bench_search
+
+    text = "abracadabra abracadabra"
+    patterns = ["abra", "cad", "a"]
+    expected = set(sa.AhoCorasick(patterns).findall(text))
+    for finditer in bench_search.FINDITERS.values():
+        assert set(bench_search.multi_by_finditer(finditer, text, patterns)) == expected
+
+
+# ------------------------- генератори *_finditer (user-032) ------------------------- #
+
+FINDITERS = {
+    "kmp": sa.kmp_finditer,
+    "bmh": sa.bmh_finditer,
+    "rabin_karp": sa.rabin_karp_finditer,
+    "bm": sa.bm_finditer,
+    "two_way": sa.two_way_finditer,
+}
+SEARCHES = {
+    "kmp": sa.kmp_search,
+    "bmh": sa.bmh_search,
+    "rabin_karp": sa.rabin_karp_search,
+    "bm": sa.bm_search,
+    "two_way": sa.two_way_search,
+}
+
+
+def naive_non_overlapping(text, pattern):
+    out, nxt = [], 0
+    for i in naive_all(text, pattern):
+        if i >= nxt:
+            out.append(i)
+            nxt = i + len(pattern)
+    return out
+
+
+@pytest.mark.parametrize("algo", FINDITERS)
+def test_finditer_matches_naive(algo):
+    rnd = random.Random(32)
+    finditer = FINDITERS[algo]
+    for _ in range(300):
+        text = random_text(rnd, rnd.randint(0, 40), "ab")
+        pattern = random_text(rnd, rnd.randint(1, 5), "ab")
+        assert list(finditer(text, pattern)) == naive_all(text, pattern)
+        assert list(finditer(text, pattern, overlapping=False)) == naive_non_overlapping(text, pattern)
+        assert SEARCHES[algo](text, pattern) == text.find(pattern)
+
+
+@pytest.mark.parametrize("algo", FINDITERS)
+def test_finditer_is_lazy_and_handles_edge_cases(algo):
+    finditer = FINDITERS[algo]
+    assert list(finditer("abc", "")) == [0, 1, 2, 3]
+    assert list(finditer("ab", "abc")) == []
+    assert list(finditer(b"xxaxxa", b"xa")) == [1, 4]
+    it = finditer("a" * 10_000, "aa")
+    assert next(it) == 0 and next(it) == 1  # не будує список усіх збігів
+
+
+# ---------------------------- compile_pattern (user-033) ---------------------------- #
+
+def test_compile_pattern_is_cached_and_slotted():
+    cp = sa.compile_pattern("abab", "kmp")
+    assert sa.compile_pattern("abab", "kmp") is cp
+    assert sa.compile_pattern("abab", "bmh") is not cp
+    assert cp.lps == [0, 0, 1, 2]
+    with pytest.raises(AttributeError):
+        cp.extra = 1  # __slots__ — без __dict__ на кожен об'єкт
+    with pytest.raises(ValueError):
+        sa.compile_pattern("abab", "nope")
+    with pytest.raises(TypeError):
+        sa.CompiledPattern("abab")  # абстрактний базовий клас — без finditer
+
+
+
+@pytest.mark.parametrize("algo", sa.COMPILED)
+def test_compiled_pattern_agrees_with_functions(algo):
+    rnd = random.Random(33)
+    for _ in range(100):
+        pattern = random_text(rnd, rnd.randint(0, 4), "ab")
+        cp = sa.compile_pattern(pattern, algo)
+        assert cp.algo == algo
+        for _ in range(3):  # той самий об'єкт на різних текстах
+            text = random_text(rnd, rnd.randint(0, 30), "ab")
+            assert list(cp.finditer(text)) == list(FINDITERS[algo](text, pattern))
+            assert cp.search(text) == text.find(pattern)
+
+
+# ------------------------------ mmap-пошук (user-034) ------------------------------ #
+
+@pytest.mark.parametrize("algo", sa.COMPILED)
+def test_mmap_finditer_across_chunk_boundaries(tmp_path, algo):
+    rnd = random.Random(34)
+    data = random_text(rnd, 5000, "ab").encode()
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+    for pattern in (b"ab", b"abba", b"aaaaaa", b"b" * 9):
+        expected = naive_all(data, pattern)
+        for chunk in (1, 7, 64, 4096, 1 << 20):
+            assert list(sa.mmap_finditer(path, pattern, algo, chunk_size=chunk)) == expected
+            assert list(sa.mmap_finditer(path, pattern, algo, overlapping=False, chunk_size=chunk)) == (
+                naive_non_overlapping(data, pattern)
+            )
+        assert sa.mmap_search(path, pattern, algo) == data.find(pattern)
+
+
+def test_mmap_finditer_small_and_empty_files(tmp_path):
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert list(sa.mmap_finditer(empty, b"a")) == []
+    assert list(sa.mmap_finditer(empty, b"")) == [0]
+    short = tmp_path / "short"
+    short.write_bytes(b"ab")
+    assert sa.mmap_search(short, b"abc") == -1
+
+
+# ---------------------------- потоковий пошук (user-035) ---------------------------- #
+
+@pytest.mark.parametrize("algo", sa.STREAM_MATCHERS)
+def test_stream_matcher_across_arbitrary_chunks(algo):
+    rnd = random.Random(35)
+    for _ in range(100):
+        text = random_text(rnd, rnd.randint(0, 60), "ab")
+        pattern = random_text(rnd, rnd.randint(1, 4), "ab")
+        for overlapping, expected in ((True, naive_all(text, pattern)), (False, naive_non_overlapping(text, pattern))):
+            matcher = sa.stream_matcher(pattern, algo, overlapping)
+            found, pos = [], 0
+            while pos < len(text):
+                step = rnd.randint(1, 5)
+                found += matcher.feed(text[pos:pos + step])
+                pos += step
+            assert found == expected
+
+
+def pipe_matches(mode, pattern, first, rest):
+    """Пише first у pipe, чекає на перший збіг (не закриваючи pipe), потім дописує rest."""
+    import queue
+    import threading
+
+    rfd, wfd = os.pipe()
+    kw = {"encoding": "utf-8"} if "b" not in mode else {}
+    reader = open(rfd, mode, **kw)
+    hits = queue.Queue()
+
+    def consume():
+        for i in sa.stream_finditer(reader, pattern):
+            hits.put(i)
+        hits.put(None)
+
+    threading.Thread(target=consume, daemon=True).start()
+    try:
+        for part in first:
+            os.write(wfd, part)
+        early = hits.get(timeout=5)  # при read(64 KiB) тут було б очікування до EOF
+        os.write(wfd, rest)
+    finally:
+        os.close(wfd)
+    late = list(iter(lambda: hits.get(timeout=5), None))
+    reader.close()
+    return [early] + late
+
+
+def test_stream_finditer_reports_matches_before_eof_bytes():
+    assert pipe_matches("rb", b"ERROR", [b"ok\nERROR 1\n"], b"ok\nERROR 2\n") == [3, 14]
+
+
+def test_stream_finditer_text_stream_keeps_buffered_text_and_newlines():
+    import io
+
+    data = "header\r\nабв needle\r\nneedle\n".encode()
+    s = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+    assert s.readline() == "header\n"  # решта вже лежить у буфері обгортки
+    assert list(sa.stream_finditer(s, "needle", chunk_size=3)) == [4, 11]
+    s = io.TextIOWrapper(io.BytesIO(data), encoding="utf-8")
+    assert list(sa.stream_finditer(s, "needle")) == [11, 18]  # зміщення в тексті після \r\n -> \n
+
+
+def test_stream_finditer_plain_read_fallback():
+    import io
+
+    assert list(sa.stream_finditer(io.StringIO("abcabc"), "bc", chunk_size=2)) == [1, 4]
+
+
+# ------------------------ Boyer–Moore (Галіл) і Two-Way (user-037) ------------------------ #
+
+def smallest_period(p):
+    return next(q for q in range(1, len(p) + 1) if all(p[i] == p[i + q] for i in range(len(p) - q)))
+
+
+class CountingText(str):
+    """Рядок, що рахує звернення за індексом (= порівняння символів тексту)."""
+
+    reads = 0
+
+    def __getitem__(self, i):
+        CountingText.reads += 1
+        return str.__getitem__(self, i)
+
+
+def test_good_suffix_period_and_critical_factorization():
+    rnd = random.Random(37)
+    for _ in range(300):
+        p = random_text(rnd, rnd.randint(1, 12), "ab")
+        assert sa._bm_good_suffix(p)[0] == smallest_period(p)
+        ell, per, periodic = sa._two_way_factor(p)
+        assert -1 <= ell < len(p)
+        if periodic:
+            assert per == smallest_period(p)
+
+
+@pytest.mark.parametrize("algo", ["bm", "two_way"])
+@pytest.mark.parametrize("pattern,text", [
+    ("a" * 50, "a" * 4000),
+    ("ab" * 25, "ab" * 2000),
+    ("aab" * 10, "aab" * 1000 + "aa"),
+])
+def test_linear_comparisons_on_periodic_input(algo, pattern, text):
+    CountingText.reads = 0
+    found = list(FINDITERS[algo](CountingText(text), pattern))
+    assert found == naive_all(text, pattern)
+    # без правила Галіла / пам'яті Two-Way тут було б ~n·m порівнянь
+    assert CountingText.reads <= 3 * len(text)
+
+
+# ------------------------ векторний Rabin–Karp на numpy (user-038) ------------------------ #
+
+def test_codepoint_text_findall_and_window_hashes():
+    pytest.importorskip("numpy")
+    rnd = random.Random(38)
+    for alphabet in ("ab", "aб😀"):  # у т.ч. символи поза BMP (UTF-32 без сурогатів)
+        text = random_text(rnd, 400, alphabet)
+        ct = sa.CodepointText(text)
+        assert ct.window_hashes(3).tolist() == [sa._poly_hash64(text[i:i + 3]) for i in range(len(text) - 2)]
+        for _ in range(30):
+            pattern = random_text(rnd, rnd.randint(1, 6), alphabet)
+            assert ct.findall(pattern) == naive_all(text, pattern)
+        assert ct.findall("x" * 500) == []
+    data = bytes(rnd.getrandbits(1) for _ in range(300))
+    assert sa.CodepointText(data).findall(b"\x01\x00\x01") == naive_all(data, b"\x01\x00\x01")
+    assert sa.numpy_rabin_karp_search("hello", "ll") == 2
+
+
+def test_codepoint_text_find_many_matches_aho_corasick(monkeypatch):
+    pytest.importorskip("numpy")
+    rnd = random.Random(381)
+    text = random_text(rnd, 2000, "abc")
+    patterns = ["".join(rnd.choice("abc") for _ in range(rnd.randint(1, 5))) for _ in range(40)]
+    expected = sorted(sa.AhoCorasick(patterns).findall(text), key=lambda x: (x[1], x[0]))
+    # малий блок перевірки — кандидати кожного шаблону йдуть кількома пакетами
+    monkeypatch.setattr(sa, "NP_VERIFY_BLOCK", 16)
+    got = sa.CodepointText(text).find_many(patterns + ["", patterns[0]])
+    assert sorted(got, key=lambda x: (x[1], x[0])) == expected
+
+
+# --------------------------- паралельний пошук (user-039) --------------------------- #
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_parallel_search_matches_sequential(monkeypatch, tmp_path, workers):
+    monkeypatch.setattr(sa, "PARALLEL_MIN_CHUNK", 16)  # дрібні шматки — багато меж
+    rnd = random.Random(39)
+    text = random_text(rnd, 2000, "ab")
+    path = tmp_path / "text.txt"
+    path.write_text(text, encoding="utf-8")
+    for pattern in ("ab", "abba", "a" * 5, "b" * 40):
+        expected = naive_all(text, pattern)
+        assert sa.parallel_search(text, pattern, "bmh", workers=workers) == expected
+        assert sa.parallel_search(path, pattern, "kmp", workers=workers) == expected
+        assert sa.parallel_search(text, pattern, workers=workers, overlapping=False) == (
+            naive_non_overlapping(text, pattern)
+        )
+
+
+def test_parallel_search_edge_cases(tmp_path):
+    assert sa.parallel_search("abc", "") == [0, 1, 2, 3]
+    assert sa.parallel_search("ab", "abc") == []
+    with pytest.raises(ValueError):
+        sa.parallel_search("abc", "b", algo="nope")
+
+
+# --------------------------- Bitap з k помилками (user-041) --------------------------- #
+
+def edit_distance(a, b):
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i]
+        for j, cb in enumerate(b, 1):
+            cur.append(min(prev[j - 1] + (ca != cb), prev[j] + 1, cur[j - 1] + 1))
+        prev = cur
+    return prev[-1]
+
+
+def naive_approx(text, pattern, k, distance):
+    """(кінець, мінімум помилок) для кожного кінця збігу з <= k помилками."""
+    m, out = len(pattern), []
+    for end in range(1, len(text) + 1):
+        if distance == "hamming":
+            if end < m:
+                continue
+            d = sum(a != b for a, b in zip(text[end - m:end], pattern))
+        else:  # Селлерс: найкращий фрагмент text[s:end]
+            d = min(edit_distance(text[s:end], pattern) for s in range(end + 1))
+        if d <= k:
+            out.append((end, d))
+    return out
+
+
+@pytest.mark.parametrize("distance", sa.BITAP_DISTANCES)
+def test_bitap_matches_dynamic_programming(distance):
+    rnd = random.Random(41)
+    for _ in range(150):
+        text = random_text(rnd, rnd.randint(0, 18), "abc")
+        pattern = random_text(rnd, rnd.randint(1, 5), "abc")
+        k = rnd.randint(0, 2)
+        assert list(sa.bitap_finditer(text, pattern, k, distance)) == naive_approx(text, pattern, k, distance)
+
+
+def test_bitap_search_start_and_long_patterns():
+    rnd = random.Random(411)
+    for _ in range(100):
+        text = random_text(rnd, rnd.randint(1, 20), "ab")
+        pattern = random_text(rnd, rnd.randint(1, 5), "ab")
+        for k in range(3):
+            s = sa.bitap_search(text, pattern, k, "levenshtein")
+            first = next(sa.bitap_finditer(text, pattern, k, "levenshtein"), None)
+            if first is None:
+                assert s == -1
+            else:
+                assert edit_distance(text[s:first[0]], pattern) <= k
+    pattern = random_text(rnd, 200, "ab")  # ширше за машинне слово
+    text = "x" * 50 + pattern[:99] + "y" + pattern[100:] + "x" * 50
+    assert sa.bitap_search(text, pattern, 0) == -1
+    assert sa.bitap_search(text, pattern, 1) == 50
+    assert sa.bitap_search("abc", "abc", 0) == "abc".find("abc")
+    with pytest.raises(ValueError):
+        sa.bitap_search("abc", "a", -1)
+    with pytest.raises(ValueError):
+        sa.bitap_search("abc", "a", 1, "jaro")
@@ -0,0 +1,70 @@
+# tests/test_suffix_index.py
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from suffix_index import SuffixIndex, build_lcp, build_suffix_array  # noqa: E402
+
+
+def naive_sa(text):
+    return sorted(range(len(text)), key=lambda i: text[i:])
+
+
+def naive_lcp(text, sa):
+    out = [0] * len(sa)
+    for r in range(1, len(sa)):
+        a, b = text[sa[r - 1]:], text[sa[r]:]
+        h = 0
+        while h < min(len(a), len(b)) and a[h] == b[h]:
+            h += 1
+        out[r] = h
+    return out
+
+
+@pytest.mark.parametrize("alphabet", ["a", "ab", "acgt", "абвгґ"])
+def test_suffix_array_and_lcp_match_naive(alphabet):
+    rnd = random.Random(36)
+    for n in list(range(0, 12)) + [50, 200]:
+        text = "".join(rnd.choice(alphabet) for _ in range(n))
+        sa = build_suffix_array(text)
+        assert list(sa) == naive_sa(text)
+        assert list(build_lcp(text, sa)) == naive_lcp(text, list(sa))
+
+
+def test_bytes_text():
+    data = b"mississippi"
+    assert list(build_suffix_array(data)) == naive_sa(data)
+    assert SuffixIndex(data).find_all(b"issi") == [1, 4]
+
+
+def test_queries_match_scanning():
+    rnd = random.Random(361)
+    text = "".join(rnd.choice("ab") for _ in range(300))
+    index = SuffixIndex(text)
+    for _ in range(200):
+        pattern = "".join(rnd.choice("ab") for _ in range(rnd.randint(1, 8)))
+        expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
+        assert index.find_all(pattern) == expected
+        assert index.count(pattern) == len(expected)
+        assert index.search(pattern) == text.find(pattern)
+    assert index.count("") == len(text) + 1 and index.search("") == 0
+    assert index.search("c") == -1
+
+
+def test_save_load_and_stale_index(tmp_path):
+    path = tmp_path / "text.sa"
+    index = SuffixIndex.load_or_build(path, "banana")
+    loaded = SuffixIndex.load(path, "banana")
+    assert loaded.sa == index.sa and loaded.lcp == index.lcp
+    with pytest.raises(ValueError):
+        SuffixIndex.load(path, "bandana")  # індекс від іншого тексту не підхоплюється
+    rebuilt = SuffixIndex.load_or_build(path, "bandana")
+    assert rebuilt.find_all("an") == [1, 4]
+    assert SuffixIndex.load(path, "bandana").sa == rebuilt.sa
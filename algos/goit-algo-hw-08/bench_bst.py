@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#Бенчмарк дерев пошуку: звичайний BST (insert_bst) проти AVLTree.
+#Вставляємо N відсортованих і N випадкових ключів, міряємо час побудови
+#(мінімум із repeats) і висоту дерева.
+#--aggregates: sum / range_sum / rank / select на доповненому AVL проти повного обходу BST.
+#--bulk: bulk_load (O(n)) проти поелементних вставок; merge пакета проти insert по одному.
+#--pages: сторінки по P значень з довільного ключа — range_iter проти повного in-order списку.
+#--bplus N: B+ дерево у файлі (mmap): вставка, min/sum, діапазонні обходи, повторне відкриття.
+#--concurrent S: R потоків-читачів + 1 письменник протягом S секунд — PersistentTree (знімки без
+#  замків) проти AVLTree під спільним threading.Lock; рахуємо прочитання за секунду.
+#--engine N: BSTNode (dataclass) проти ArrayBST (колонки array) — пам'ять і пропускна здатність.
+#
+#  python3 bench_bst.py --n 1000 5000 --repeats 3 --csv bst_results.csv
+#  python3 bench_bst.py --n 100000 --aggregates
+#  python3 bench_bst.py --n 1000 --engine 10000000
+#  python3 bench_bst.py --n 100000 --bulk
+#  python3 bench_bst.py --n 1000000 --pages --page-size 100
+#  python3 bench_bst.py --n 1000 --bplus 1000000 --fanout 256
+#  python3 bench_bst.py --n 100000 --concurrent 3 --readers 4
+
+from __future__ import annotations
+import argparse
+import bisect
+import csv
+import os
+import random
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import bst_array
+from bplustree import BPlusTree
+from bst import (
+    AVLTree, PersistentTree, avl_search, build_bst, bulk_load, iter_inorder, range_sum, sum_values, tree_height,
+)
+
+
+#вставка відсортованих ключів у звичайний BST — O(n^2); більші n пропускаємо
+BST_SORTED_LIMIT = 20_000
+
+
+def bench_call(fn: Callable[[], object], repeats: int) -> float:
+    return min(timeit.Timer(fn).repeat(repeat=repeats, number=1))
+
+
+def key_sets(n: int, seed: int = 0) -> Dict[str, List[int]]:
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.Random(seed).shuffle(shuffled)
+    return {"sorted": keys, "random": shuffled}
+
+
+def bench_build(n: int, repeats: int) -> List[dict]:
+    rows: List[dict] = []
+    for order, keys in key_sets(n).items():
+        builders = {
+            "BST": (lambda: build_bst(keys), lambda t: tree_height(t)),
+            "AVL": (lambda: AVLTree(keys), lambda t: t.height()),
+        }
+        for name, (build, height) in builders.items():
+            if name == "BST" and order == "sorted" and n > BST_SORTED_LIMIT:
+                print(f"[skip] n={n:>8} | {order:6s} | {name:4s} -> O(n^2), n > {BST_SORTED_LIMIT}")
+                continue
+            t = bench_call(build, repeats)
+            h = height(build())
+            rows.append({"n": n, "keys": order, "tree": name, "build_s": t, "height": h})
+            print(f"[run] n={n:>8} | {order:6s} | {name:4s} -> {t:.6f} s, висота {h}")
+    return rows
+
+
+def _inorder(root) -> List[int]:
+    return list(iter_inorder(root))
+
+
+def bench_aggregates(n: int, queries: int, repeats: int) -> List[dict]:
+    #Запити по випадкових ключах: AVL відповідає за O(1)/O(log n), BST — повним обходом
+    keys = key_sets(n)["random"]
+    bst = build_bst(keys)
+    avl = AVLTree(keys)
+    rnd = random.Random(1)
+    ranges = [tuple(sorted((rnd.randrange(n), rnd.randrange(n)))) for _ in range(queries)]
+    ks = [rnd.randrange(n) for _ in range(queries)]
+    cases = {
+        "sum": (
+            lambda: [sum_values(bst) for _ in range(queries)],
+            lambda: [avl.sum() for _ in range(queries)],
+        ),
+        "range_sum": (
+            lambda: [sum(v for v in _inorder(bst) if lo <= v <= hi) for lo, hi in ranges],
+            lambda: [avl.range_sum(lo, hi) for lo, hi in ranges],
+        ),
+        "rank": (
+            lambda: [sum(1 for v in _inorder(bst) if v < x) for x in ks],
+            lambda: [avl.rank(x) for x in ks],
+        ),
+        "select": (
+            lambda: [_inorder(bst)[k] for k in ks],
+            lambda: [avl.select(k) for k in ks],
+        ),
+    }
+    rows: List[dict] = []
+    for op, (scan, aug) in cases.items():
+        assert scan() == aug()
+        for name, fn in (("BST scan", scan), ("AVL augmented", aug)):
+            t = bench_call(fn, repeats)
+            rows.append({"n": n, "keys": "random", "tree": name, "op": op, "queries": queries, "query_s": t / queries})
+            print(f"[run] n={n:>8} | {op:9s} | {name:13s} -> {t / queries * 1e6:10.2f} µs/запит")
+    return rows
+
+
+def bench_bulk(n: int, repeats: int) -> List[dict]:
+    #Побудова з n ключів і злиття пакета з n/10 та n ключів у дерево з n ключів
+    rows: List[dict] = []
+    for order, keys in key_sets(n).items():
+        timings = [
+            ("AVL insert×n", bench_call(lambda: AVLTree(keys), repeats)),
+            ("bulk_load", bench_call(lambda: bulk_load(keys, presorted=order == "sorted"), repeats)),
+        ]
+        if order == "random" or n <= BST_SORTED_LIMIT:
+            timings.insert(0, ("BST insert×n", bench_call(lambda: build_bst(keys), repeats)))
+        for name, t in timings:
+            rows.append({"n": n, "keys": order, "tree": name, "op": "build", "build_s": t})
+            print(f"[run] n={n:>8} | {order:6s} | build | {name:13s} -> {t:.6f} s")
+
+    #базове дерево будується в обох варіантах однаково — різниця лише у вставці пакета
+    rnd = random.Random(2)
+    for frac in (0.1, 1.0):
+        batch = [rnd.randrange(n) for _ in range(max(1, int(n * frac)))]
+
+        def insert_each() -> None:
+            tree = AVLTree.bulk_load(range(n), presorted=True)
+            for v in batch:
+                tree.insert(v)
+
+        def merge_batch() -> None:
+            tree = AVLTree.bulk_load(range(n), presorted=True)
+            tree.merge(batch)
+
+        for name, fn in (("AVL insert×k", insert_each), ("merge", merge_batch)):
+            t = bench_call(fn, repeats)
+            rows.append({"n": n, "keys": "batch", "tree": name, "op": "merge", "build_s": t, "batch": len(batch)})
+            print(f"[run] n={n:>8} | k={len(batch):<5}| merge | {name:13s} -> {t:.6f} s")
+    return rows
+
+
+def bench_pages(n: int, page: int, pages: int, repeats: int) -> List[dict]:
+    #Читання `pages` сторінок по `page` значень, починаючи з випадкових ключів
+    tree = AVLTree.bulk_load(range(n), presorted=True)
+    rnd = random.Random(3)
+    starts = [rnd.randrange(n) for _ in range(pages)]
+
+    def lazy() -> List[List[int]]:
+        out = []
+        for s in starts:
+            it = tree.range_iter(s)
+            out.append([v for _, v in zip(range(page), it)])
+        return out
+
+    def materialized() -> List[List[int]]:
+        out = []
+        for s in starts:
+            values = list(tree)
+            i = bisect.bisect_left(values, s)
+            out.append(values[i:i + page])
+        return out
+
+    assert lazy() == materialized()
+    rows: List[dict] = []
+    for name, fn in (("range_iter", lazy), ("in-order list", materialized)):
+        t = bench_call(fn, repeats)
+        rows.append({"n": n, "keys": "sorted", "tree": name, "op": "page", "query_s": t / pages, "page": page})
+        print(f"[run] n={n:>8} | page={page:<5} | {name:13s} -> {t / pages * 1e6:12.2f} µs/сторінка")
+    return rows
+
+
+def bench_bplus(n: int, fanout: int | None, cache_pages: int, span: int) -> List[dict]:
+    #Вставка n випадкових ключів у файл, далі запити; AVL (у пам'яті) — для порівняння обходів
+    rnd = random.Random(0)
+    keys = [rnd.getrandbits(40) for _ in range(n)]
+    starts = sorted(keys)[:: max(1, n // 20)]
+    rows: List[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "keys.bpt")
+        t0 = time.perf_counter()
+        with BPlusTree(path, fanout=fanout, cache_pages=cache_pages) as tree:
+            for k in keys:
+                tree.insert(k)
+        t_build = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        with BPlusTree(path, cache_pages=cache_pages) as tree:   # повторне відкриття: холодний кеш сторінок
+            t_open = time.perf_counter() - t0
+            assert tree.min() == min(keys) and tree.sum() == sum(keys)
+            t0 = time.perf_counter()
+            scanned = sum(1 for _ in tree)
+            t_scan = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            for s in starts:
+                for _, _k in zip(range(span), tree.range(s)):
+                    pass
+            t_range = (time.perf_counter() - t0) / len(starts)
+            info = f"fanout={tree.fanout}, висота {tree.height()}, {tree.pages} сторінок"
+            fan = tree.fanout
+        size = os.path.getsize(path)
+
+    avl = AVLTree.bulk_load(keys)
+    t0 = time.perf_counter()
+    for _ in avl:
+        pass
+    t_avl_scan = time.perf_counter() - t0
+
+    assert scanned == n
+    rows.append({
+        "n": n, "keys": "random", "tree": "B+ (mmap)", "fanout": fan, "build_s": t_build, "open_s": t_open,
+        "scan_s": t_scan, "range_s": t_range, "file_bytes": size,
+    })
+    rows.append({"n": n, "keys": "random", "tree": "AVL (in-memory)", "scan_s": t_avl_scan})
+    print(f"[info] {info}, файл {size / 2**20:.1f} МБ")
+    print(f"[run] n={n:>9} | B+ вставка      -> {n / t_build:12,.0f} ключів/с")
+    print(f"[run] n={n:>9} | B+ відкриття    -> {t_open * 1e3:10.3f} ms")
+    print(f"[run] n={n:>9} | B+ повний обхід -> {n / t_scan:12,.0f} ключів/с (AVL у пам'яті: {n / t_avl_scan:,.0f})")
+    print(f"[run] n={n:>9} | B+ range×{span:<6} -> {t_range * 1e3:10.3f} ms на діапазон")
+    return rows
+
+
+def _run_threads(read: Callable[[random.Random], object], write: Callable[[int], object],
+                 readers: int, seconds: float) -> Dict[str, int]:
+    #readers потоків викликають read(), один потік — write(); повертає кількість операцій
+    stop = threading.Event()
+    counts = [0] * readers
+    writes = [0]
+
+    def reader(i: int) -> None:
+        rnd = random.Random(i)
+        c = 0
+        while not stop.is_set():
+            read(rnd)
+            c += 1
+        counts[i] = c
+
+    def writer() -> None:
+        rnd = random.Random(-1)
+        c = 0
+        while not stop.is_set():
+            write(rnd.getrandbits(32))
+            c += 1
+        writes[0] = c
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(seconds)
+    stop.set()
+    for t in threads:
+        t.join()
+    return {"reads": sum(counts), "writes": writes[0]}
+
+
+def bench_concurrent(n: int, readers: int, seconds: float) -> List[dict]:
+    #Читання = пошук ключа + range_sum по знімку; запис = вставка нового ключа
+    keys = key_sets(n)["random"]
+    rows: List[dict] = []
+
+    ptree = PersistentTree(keys)
+
+    def p_read(rnd: random.Random) -> None:
+        snap = ptree.snapshot()              # незмінна версія — замок не потрібен
+        avl_search(snap, rnd.randrange(n))
+        range_sum(snap, 0, rnd.randrange(n))
+
+    locked = AVLTree.bulk_load(keys)
+    lock = threading.Lock()
+
+    def l_read(rnd: random.Random) -> None:
+        with lock:
+            avl_search(locked.root, rnd.randrange(n))
+            range_sum(locked.root, 0, rnd.randrange(n))
+
+    def l_write(v: int) -> None:
+        with lock:
+            locked.insert(v)
+
+    for name, read, write in (
+        ("PersistentTree (snapshots)", p_read, ptree.insert),
+        ("AVLTree + Lock", l_read, l_write),
+    ):
+        res = _run_threads(read, write, readers, seconds)
+        rows.append({"n": n, "tree": name, "readers": readers, "seconds": seconds,
+                     "reads_per_s": res["reads"] / seconds, "writes_per_s": res["writes"] / seconds})
+        print(f"[run] n={n:>8} | {name:26s} -> {res['reads'] / seconds:12,.0f} читань/с, "
+              f"{res['writes'] / seconds:10,.0f} записів/с ({readers} читачів)")
+    return rows
+
+
+def traced_peak(fn: Callable[[], object]) -> int:
+    #Пікова пам'ять Python-алокацій під час fn() (результат живий до кінця заміру)
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+
+def bench_engine(n: int, lookups: int) -> List[dict]:
+    #Випадкові 40-бітні ключі: побудова, пошук, пам'ять на ключ
+    rnd = random.Random(0)
+    keys = [rnd.getrandbits(40) for _ in range(n)]
+    probes = [rnd.choice(keys) for _ in range(lookups)]
+    engines = {
+        "BSTNode": (lambda: build_bst(keys), lambda t, v: avl_search(t, v) is not None),
+        "ArrayBST": (lambda: bst_array.build_bst(keys), lambda t, v: v in t),
+    }
+    rows: List[dict] = []
+    for name, (build, contains) in engines.items():
+        t0 = time.perf_counter()
+        tree = build()
+        t_build = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        assert all(contains(tree, v) for v in probes)
+        t_find = time.perf_counter() - t0
+        del tree
+        peak = traced_peak(build)
+        rows.append({
+            "n": n, "keys": "random", "tree": name, "build_s": t_build,
+            "inserts_per_s": n / t_build, "lookups_per_s": lookups / t_find, "bytes_per_key": peak / n,
+        })
+        print(f"[run] n={n:>9} | {name:8s} -> {n / t_build:12,.0f} вставок/с, "
+              f"{lookups / t_find:12,.0f} пошуків/с, {peak / n:7.1f} Б/ключ ({peak / 2**20:,.0f} МБ)")
+    return rows
+
+
+def write_csv(rows: List[dict], path: Path) -> None:
+    fieldnames: List[str] = []
+    for r in rows:
+        fieldnames.extend(k for k in r if k not in fieldnames)
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fieldnames)
+        w.writeheader()
+        w.writerows(rows)
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="BST vs AVL: sorted and random inserts")
+    ap.add_argument("--n", nargs="*", type=int, default=[1000, 5000], help="Кількість ключів (можна кілька)")
+    ap.add_argument("--repeats", type=int, default=3, help="Повтори timeit (беремо мінімум)")
+    ap.add_argument("--aggregates", action="store_true", help="sum/range_sum/rank/select: AVL проти обходу BST")
+    ap.add_argument("--queries", type=int, default=20, help="Кількість запитів для --aggregates")
+    ap.add_argument("--bulk", action="store_true", help="bulk_load і merge проти поелементних вставок")
+    ap.add_argument("--pages", action="store_true", help="Пагінація: range_iter проти повного in-order списку")
+    ap.add_argument("--page-size", type=int, default=100, help="Розмір сторінки для --pages")
+    ap.add_argument("--bplus", type=int, default=0, help="B+ дерево у файлі на N випадкових ключах (0 — вимкнено)")
+    ap.add_argument("--fanout", type=int, help="Fanout для --bplus (за замовчуванням — максимум для сторінки 4 КБ)")
+    ap.add_argument("--cache-pages", type=int, default=256, help="Розмір кешу сторінок для --bplus")
+    ap.add_argument("--concurrent", type=float, default=0, help="Секунд на прогін читачі+письменник (0 — вимкнено)")
+    ap.add_argument("--readers", type=int, default=4, help="Кількість потоків-читачів для --concurrent")
+    ap.add_argument("--engine", type=int, default=0, help="BSTNode проти ArrayBST на N випадкових ключах (0 — вимкнено)")
+    ap.add_argument("--lookups", type=int, default=100_000, help="Кількість пошуків для --engine")
+    ap.add_argument("--csv", type=str, help="Зберегти результати у CSV")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    repeats = max(1, args.repeats)
+    rows: List[dict] = []
+    print("=== Побудова: BST vs AVL ===")
+    for n in args.n:
+        rows += bench_build(n, repeats)
+    if args.aggregates:
+        print("\n=== Агрегатні запити ===")
+        for n in args.n:
+            rows += bench_aggregates(n, max(1, args.queries), repeats)
+    if args.bulk:
+        print("\n=== Масова побудова і злиття ===")
+        for n in args.n:
+            rows += bench_bulk(n, repeats)
+    if args.pages:
+        print("\n=== Пагінація ===")
+        for n in args.n:
+            rows += bench_pages(n, max(1, args.page_size), 20, repeats)
+    if args.bplus > 0:
+        print("\n=== B+ дерево на диску ===")
+        rows += bench_bplus(args.bplus, args.fanout, args.cache_pages, 1000)
+    if args.concurrent > 0:
+        print("\n=== Конкурентні читачі: знімки проти замка ===")
+        for n in args.n:
+            rows += bench_concurrent(n, max(1, args.readers), args.concurrent)
+    if args.engine > 0:
+        print("\n=== Рушії: BSTNode проти ArrayBST ===")
+        rows += bench_engine(args.engine, max(1, args.lookups))
+    if args.csv:
+        write_csv(rows, Path(args.csv))
+        print(f"\nSaved CSV -> {Path(args.csv).resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#Бенчмарк Завдання 3: купа (min_total_cost_cables) проти двох черг
+#(min_total_cost_cables_linear) на N кабелях трьох видів:
+#- narrow : цілі 1..1000 (сортування підрахунком)
+#- wide   : цілі до 2^32 (sorted())
+#- sorted : уже відсортовані (presorted=True, без сортування)
+#
+#  python3 bench_cables.py --n 100000 1000000
+#  python3 bench_cables.py --n 100000000 --kinds narrow --no-heap --no-steps
+
+from __future__ import annotations
+import argparse
+import random
+import time
+from array import array
+from typing import Callable, Dict, List
+
+from heap_cables import min_total_cost_cables, min_total_cost_cables_linear
+
+
+def make_lengths(kind: str, n: int, seed: int = 0) -> array:
+    #array('q') — 8 байт на кабель замість об'єкта int у списку (важливо для 10^8)
+    rnd = random.Random(seed)
+    if kind == "wide":
+        return array("q", (rnd.getrandbits(32) for _ in range(n)))
+    lengths = array("q", (rnd.randint(1, 1000) for _ in range(n)))
+    if kind == "sorted":
+        lengths = array("q", sorted(lengths))
+    return lengths
+
+
+def timed(fn: Callable[[], object]) -> tuple:
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def bench(n: int, kind: str, heap: bool, steps: bool) -> List[dict]:
+    lengths = make_lengths(kind, n)
+    presorted = kind == "sorted"
+    variants: Dict[str, Callable[[], object]] = {}
+    if heap:
+        variants["heap"] = lambda: min_total_cost_cables(lengths)
+    variants["two queues"] = lambda: min_total_cost_cables_linear(lengths, presorted=presorted, with_steps=steps)
+    rows: List[dict] = []
+    totals = set()
+    for name, fn in variants.items():
+        t, (total, _) = timed(fn)
+        totals.add(total)
+        rows.append({"n": n, "kind": kind, "algo": name, "time_s": t})
+        print(f"[run] n={n:>11,} | {kind:6s} | {name:10s} -> {t:9.3f} s ({n / t:12,.0f} кабелів/с)")
+    assert len(totals) == 1, "результати не збігаються"
+    return rows
+
+
+def parse_args() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Cables: heap vs linear two-queue merge")
+    ap.add_argument("--n", nargs="*", type=int, default=[100_000, 1_000_000], help="Кількість кабелів (можна кілька)")
+    ap.add_argument("--kinds", nargs="*", choices=["narrow", "wide", "sorted"], default=["narrow", "wide", "sorted"])
+    ap.add_argument("--no-heap", action="store_true", help="Не запускати версію з купою (для дуже великих N)")
+    ap.add_argument("--no-steps", action="store_true", help="Не зберігати кроки у двочерговій версії")
+    return ap.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    for n in args.n:
+        for kind in args.kinds:
+            bench(n, kind, not args.no_heap, not args.no_steps)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#B+ дерево на диску: сторінки фіксованого розміру у файлі, відображеному через mmap.
+#- внутрішні сторінки: ключі-розділювачі + номери дочірніх сторінок (fanout ключів);
+#- листки: відсортовані ключі int64 + номер наступного листка (зв'язаний список),
+#  тож діапазонний обхід — послідовне читання листків без підйому до кореня;
+#- невеликий LRU-кеш розкодованих сторінок; змінені сторінки записуються
+#  в mmap при витісненні та flush()/close().
+#Дублікати дозволені (мультимножина, як у bst.py).
+
+#Використання:
+#  with BPlusTree("keys.bpt", fanout=256) as t:
+#      t.insert(42); t.min(); t.sum(); list(t.range(10, 100))
+
+from __future__ import annotations
+import bisect
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from typing import Iterator, List, Optional
+
+PAGE_SIZE = 4096
+CACHE_PAGES = 256
+GROW_PAGES = 1024          # файл росте щонайменше на стільки сторінок за раз
+
+_MAGIC = b"BPT1"
+_META = struct.Struct("<4sIIiiIQ16s")  # magic, page_size, fanout, root, first_leaf, pages, count, total
+_PAGE = struct.Struct("<BxHi")         # тип (1 — листок, 2 — внутрішня), кількість ключів, наступний листок
+_LEAF, _INNER = 1, 2
+NIL = -1
+
+
+def max_fanout(page_size: int = PAGE_SIZE) -> int:
+    #Найбільше ключів на сторінці: внутрішня сторінка тримає F ключів int64 і F+1 дітей int32
+    return (page_size - _PAGE.size - 4) // 12
+
+
+class _Node:
+    __slots__ = ("pno", "leaf", "keys", "children", "next")
+
+    def __init__(self, pno: int, leaf: bool, keys: List[int], children: List[int], nxt: int = NIL) -> None:
+        self.pno = pno
+        self.leaf = leaf
+        self.keys = keys
+        self.children = children
+        self.next = nxt
+
+
+class BPlusTree:
+
+    def __init__(self, path, fanout: Optional[int] = None, page_size: int = PAGE_SIZE,
+                 cache_pages: int = CACHE_PAGES) -> None:
+        self.path = os.fspath(path)
+        exists = os.path.exists(self.path) and os.path.getsize(self.path) > 0
+        self._f = open(self.path, "r+b" if exists else "w+b")
+        self._mm = None
+        self._cache: "OrderedDict[int, _Node]" = OrderedDict()
+        self._dirty: set = set()
+        self.cache_pages = max(4, cache_pages)
+        try:
+            if exists:
+                self._open_existing()
+            else:
+                self._create(fanout, page_size)
+        except BaseException:
+            # поганий заголовок / fanout / помилка mmap — не лишаємо відкритих файла й mmap
+            if self._mm is not None:
+                self._mm.close()
+            self._f.close()
+            raise
+
+    def _open_existing(self) -> None:
+        self._f.seek(0)
+        head = self._f.read(_META.size)
+        magic, self.page_size, self.fanout, self.root, self.first_leaf, self.pages, self.count, total = _META.unpack(head)
+        if magic != _MAGIC:
+            raise ValueError(f"{self.path}: не файл B+ дерева")
+        self.total = int.from_bytes(total, "little", signed=True)
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+
+    def _create(self, fanout: Optional[int], page_size: int) -> None:
+        limit = max_fanout(page_size)
+        if fanout is None:
+            fanout = limit
+        if not 3 <= fanout <= limit:
+            raise ValueError(f"fanout має бути в [3, {limit}] для page_size={page_size}")
+        self.page_size, self.fanout = page_size, fanout
+        self.pages, self.count, self.total = 1, 0, 0   # сторінка 0 — метадані
+        self._f.truncate(page_size * GROW_PAGES)
+        self._mm = mmap.mmap(self._f.fileno(), 0)
+        leaf = self._new_node(True)
+        self.root = self.first_leaf = leaf.pno
+        self._write_meta()
+
+    # ------------------------------ сторінки ------------------------------ #
+
+    def _write_meta(self) -> None:
+        _META.pack_into(self._mm, 0, _MAGIC, self.page_size, self.fanout, self.root, self.first_leaf,
+                        self.pages, self.count, self.total.to_bytes(16, "little", signed=True))
+
+    def _read_page(self, pno: int) -> _Node:
+        off = pno * self.page_size
+        kind, n, nxt = _PAGE.unpack_from(self._mm, off)
+        off += _PAGE.size
+        keys = list(struct.unpack_from(f"<{n}q", self._mm, off))
+        if kind == _LEAF:
+            return _Node(pno, True, keys, [], nxt)
+        off += 8 * self.fanout
+        children = list(struct.unpack_from(f"<{n + 1}i", self._mm, off))
+        return _Node(pno, False, keys, children)
+
+    def _write_page(self, node: _Node) -> None:
+        off = node.pno * self.page_size
+        n = len(node.keys)
+        _PAGE.pack_into(self._mm, off, _LEAF if node.leaf else _INNER, n, node.next)
+        off += _PAGE.size
+        struct.pack_into(f"<{n}q", self._mm, off, *node.keys)
+        if not node.leaf:
+            struct.pack_into(f"<{n + 1}i", self._mm, off + 8 * self.fanout, *node.children)
+
+    def _get(self, pno: int) -> _Node:
+        node = self._cache.get(pno)
+        if node is not None:
+            self._cache.move_to_end(pno)
+            return node
+        node = self._read_page(pno)
+        self._put(node)
+        return node
+
+    def _put(self, node: _Node) -> None:
+        self._cache[node.pno] = node
+        self._cache.move_to_end(node.pno)
+        while len(self._cache) > self.cache_pages:
+            pno, old = self._cache.popitem(last=False)
+            if pno in self._dirty:
+                self._write_page(old)
+                self._dirty.discard(pno)
+
+    def _touch(self, node: _Node) -> None:
+        #Позначає вузол зміненим; викликати ПІСЛЯ змін. Якщо вузол тим часом витіснили
+        #(його старий стан уже записано), він повертається в кеш
+        self._dirty.add(node.pno)
+        if node.pno in self._cache:
+            self._cache.move_to_end(node.pno)
+        else:
+            self._put(node)
+
+    def _new_node(self, leaf: bool) -> _Node:
+        pno = self.pages
+        self.pages += 1
+        need = self.pages * self.page_size
+        if need > len(self._mm):
+            #файл росте: або вдвічі, або на GROW_PAGES сторінок; розкодовані вузли в кеші
+            #не посилаються на mmap, тож перевідображення безпечне
+            size = max(need, min(2 * len(self._mm), len(self._mm) + 64 * GROW_PAGES * self.page_size),
+                       len(self._mm) + GROW_PAGES * self.page_size)
+            self._mm.close()
+            self._f.truncate(size)
+            self._mm = mmap.mmap(self._f.fileno(), 0)
+        node = _Node(pno, leaf, [], [])
+        self._touch(node)
+        return node
+
+    # ------------------------------ операції ------------------------------ #
+
+    def __len__(self) -> int:
+        return self.count
+
+    def insert(self, key: int) -> None:
+        key = int(key)
+        path: List[tuple] = []  # (внутрішній вузол, індекс дитини)
+        node = self._get(self.root)
+        while not node.leaf:
+            i = bisect.bisect_right(node.keys, key)
+            path.append((node, i))
+            node = self._get(node.children[i])
+        #нову сторінку виділяємо ДО зміни вузла: виділення може витіснити (записати)
+        #сторінки з кешу, а переповнений вузол не вміщається у сторінку
+        right = self._new_node(True) if len(node.keys) >= self.fanout else None
+        bisect.insort_right(node.keys, key)
+        self.count += 1
+        self.total += key
+        if right is None:
+            self._touch(node)
+            return
+        #розщеплення листка: права половина — у новий листок, розділювач = її перший ключ
+        mid = len(node.keys) // 2
+        right.keys, node.keys = node.keys[mid:], node.keys[:mid]
+        right.next, node.next = node.next, right.pno
+        self._touch(node)
+        self._touch(right)
+        sep, new_child = right.keys[0], right.pno
+
+        while path:
+            parent, i = path.pop()
+            right = self._new_node(False) if len(parent.keys) >= self.fanout else None
+            parent.keys.insert(i, sep)
+            parent.children.insert(i + 1, new_child)
+            if right is None:
+                self._touch(parent)
+                return
+            #розщеплення внутрішньої сторінки: середній ключ піднімається вгору
+            mid = len(parent.keys) // 2
+            sep = parent.keys[mid]
+            right.keys, right.children = parent.keys[mid + 1:], parent.children[mid + 1:]
+            parent.keys, parent.children = parent.keys[:mid], parent.children[:mid + 1]
+            self._touch(parent)
+            self._touch(right)
+            new_child = right.pno
+
+        #розщепився корінь — дерево росте на рівень
+        root = self._new_node(False)
+        root.keys = [sep]
+        root.children = [self.root, new_child]
+        self._touch(root)
+        self.root = root.pno
+
+    def min(self) -> int:
+        if self.count == 0:
+            raise ValueError("Дерево порожнє — немає мінімального значення.")
+        return self._get(self.first_leaf).keys[0]
+
+    def sum(self) -> int:
+        #Сума підтримується при вставці — O(1)
+        return self.total
+
+    def range(self, lo: Optional[int] = None, hi: Optional[int] = None) -> Iterator[int]:
+        #Ключі з [lo, hi] за зростанням (None — межі немає): спуск до першого листка,
+        #далі — послідовно по зв'язаних листках
+        if lo is None:
+            pno = self.first_leaf
+        else:
+            node = self._get(self.root)
+            while not node.leaf:
+                node = self._get(node.children[bisect.bisect_left(node.keys, lo)])
+            pno = node.pno
+        while pno != NIL:
+            node = self._get(pno)
+            keys = node.keys
+            start = bisect.bisect_left(keys, lo) if lo is not None else 0
+            for k in keys[start:]:
+                if hi is not None and k > hi:
+                    return
+                yield k
+            pno = node.next
+
+    def __iter__(self) -> Iterator[int]:
+        return self.range()
+
+    def height(self) -> int:
+        h = 1
+        node = self._get(self.root)
+        while not node.leaf:
+            node = self._get(node.children[0])
+            h += 1
+        return h
+
+    # ------------------------------ файл ------------------------------ #
+
+    def flush(self) -> None:
+        for pno in list(self._dirty):
+            self._write_page(self._cache[pno])
+        self._dirty.clear()
+        self._write_meta()
+        self._mm.flush()
+
+    def close(self) -> None:
+        if self._f.closed:
+            return
+        self.flush()
+        self._mm.close()
+        self._f.close()
+
+    def __enter__(self) -> "BPlusTree":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
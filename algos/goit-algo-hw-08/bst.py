@@ -10,9 +10,39 @@
 #- find_min_value(root) -> int        : мінімум у дереві
 #- sum_values(root) -> int            : сума всіх значень
 
+#AVL: самобалансне дерево (висота O(log n) навіть для відсортованого входу).
+#- AVLTree(values) : insert / delete / search (in), len, min(), sum(), height()
+#- avl_insert / avl_delete / avl_search — те саме на рівні вузлів (повертають корінь)
+#AVLNode успадковує BSTNode, тож find_min_value і sum_values працюють без змін.
+
+#Вузли AVL доповнені розміром і сумою піддерева (оновлюються при вставці/видаленні):
+#- sum_values(avl_root) — O(1); для звичайного BST — ітеративний обхід без рекурсії
+#- range_sum(root, lo, hi) : сума значень у [lo, hi]      — O(log n)
+#- rank(root, x)           : кількість значень < x         — O(log n)
+#- select(root, k)         : k-те найменше (з 0)          — O(log n)
+
+#Масова побудова (без поелементних вставок і рекурсії):
+#- bulk_load(values, presorted=False) -> AVLNode : ідеально збалансоване дерево за O(n)
+#  (+ одне сортування, якщо вхід не відсортований)
+#- merge_sorted(root, batch) -> AVLNode : злиття пакета з деревом через in-order і перебудову
+
+#Ліниві обходи (стек O(висоти), без побудови повного списку; для будь-якого BST):
+#- iter_inorder(root) / iter_reverse(root) : значення за зростанням / спаданням
+#- range_iter(root, lo, hi)                 : значення з [lo, hi], лише потрібні піддерева
+#- successor(root, x) / predecessor(root, x): найближче значення > x / < x (або None)
+
+#Персистентне (copy-on-write) AVL: вузли PNode незмінні, p_insert / p_delete копіюють
+#лише шлях від кореня (O(log n) нових вузлів) і повертають новий корінь; решта
+#піддерев спільна зі старою версією. PersistentTree публікує нові версії одним
+#присвоєнням кореня — читачі працюють зі знімком snapshot() без блокувань.
+#Усі функції читання вище (find_min_value, sum_values, range_sum, iter_inorder, …)
+#приймають і корінь PNode.
+
 from __future__ import annotations
+import heapq
+import threading
 from dataclasses import dataclass
-from typing import Optional, Iterable
+from typing import Optional, Iterable, Iterator, List, Tuple
 
 @dataclass
 class BSTNode:
@@ -66,7 +96,489 @@ def find_min_value(root: Optional[BSTNode]) -> int:
 # Завдання 2: сума всіх значень
 
 def sum_values(root: Optional[BSTNode]) -> int:
-    #Повертає суму всіх значень у дерево (рекурсивний DFS)
+    #Повертає суму всіх значень у дереві.
+    #AVL-вузол зберігає суму піддерева — O(1); інакше DFS з явним стеком
+    #(рекурсія впирається в ліміт на виродженому дереві з відсортованого входу)
     if root is None:
         return 0
-    return root.value + sum_values(root.left) + sum_values(root.right)
\ No newline at end of file
+    if isinstance(root, (AVLNode, PNode)):
+        return root.total
+    total = 0
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        total += node.value
+        if node.left is not None:
+            stack.append(node.left)
+        if node.right is not None:
+            stack.append(node.right)
+    return total
+
+
+def tree_height(root: Optional[BSTNode]) -> int:
+    #Висота дерева (кількість рівнів), ітеративно — без ризику переповнити стек
+    height = 0
+    level = [root] if root is not None else []
+    while level:
+        height += 1
+        level = [c for n in level for c in (n.left, n.right) if c is not None]
+    return height
+
+
+# AVL-дерево
+
+@dataclass
+class AVLNode(BSTNode):
+    left: Optional["AVLNode"] = None
+    right: Optional["AVLNode"] = None
+    height: int = 1
+    size: int = 1     # кількість вузлів у піддереві
+    total: int = 0    # сума значень у піддереві
+
+    def __post_init__(self) -> None:
+        self.total = self.value
+
+
+def _height(node: Optional[AVLNode]) -> int:
+    return node.height if node is not None else 0
+
+
+def _size(node: Optional[AVLNode]) -> int:
+    return node.size if node is not None else 0
+
+
+def _total(node: Optional[AVLNode]) -> int:
+    return node.total if node is not None else 0
+
+
+def _update(node: AVLNode) -> None:
+    left, right = node.left, node.right
+    node.height = 1 + max(_height(left), _height(right))
+    node.size = 1 + _size(left) + _size(right)
+    node.total = node.value + _total(left) + _total(right)
+
+
+def _rotate_right(y: AVLNode) -> AVLNode:
+    x = y.left
+    y.left = x.right
+    x.right = y
+    _update(y)
+    _update(x)
+    return x
+
+
+def _rotate_left(x: AVLNode) -> AVLNode:
+    y = x.right
+    x.right = y.left
+    y.left = x
+    _update(x)
+    _update(y)
+    return y
+
+
+def _rebalance(node: AVLNode) -> AVLNode:
+    #Відновлює |баланс| <= 1 одним або двома поворотами; повертає новий корінь піддерева
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+def avl_insert(root: Optional[AVLNode], value: int) -> AVLNode:
+    #Вставка як у insert_bst (рівні — вправо) + балансування на шляху вгору
+    if root is None:
+        return AVLNode(value)
+    if value < root.value:
+        root.left = avl_insert(root.left, value)
+    else:
+        root.right = avl_insert(root.right, value)
+    return _rebalance(root)
+
+
+def _delete_min(node: AVLNode) -> Tuple[Optional[AVLNode], int]:
+    #Вирізає мінімальний вузол піддерева; повертає (новий корінь, його значення)
+    if node.left is None:
+        return node.right, node.value
+    node.left, value = _delete_min(node.left)
+    return _rebalance(node), value
+
+
+def avl_delete(root: Optional[AVLNode], value: int) -> Optional[AVLNode]:
+    #Видаляє одне входження value (якщо його немає — дерево не змінюється)
+    if root is None:
+        return None
+    if value < root.value:
+        root.left = avl_delete(root.left, value)
+    elif value > root.value:
+        root.right = avl_delete(root.right, value)
+    else:
+        if root.left is None:
+            return root.right
+        if root.right is None:
+            return root.left
+        #два нащадки: на місце вузла — наступник (мінімум правого піддерева)
+        root.right, root.value = _delete_min(root.right)
+    return _rebalance(root)
+
+
+def avl_search(root: Optional[BSTNode], value: int) -> Optional[BSTNode]:
+    #Пошук вузла зі значенням value (підходить для будь-якого BST)
+    node = root
+    while node is not None:
+        if value == node.value:
+            return node
+        node = node.left if value < node.value else node.right
+    return None
+
+
+# Порядкові статистики та діапазонні суми (для доповнених AVL-вузлів)
+
+def _sum_below(root: Optional[AVLNode], x: int, inclusive: bool) -> int:
+    #Сума значень < x (або <= x при inclusive) — один спуск від кореня
+    total = 0
+    node = root
+    while node is not None:
+        if node.value < x or (inclusive and node.value == x):
+            total += _total(node.left) + node.value
+            node = node.right
+        else:
+            node = node.left
+    return total
+
+
+def range_sum(root: Optional[AVLNode], lo: int, hi: int) -> int:
+    #Сума значень v з lo <= v <= hi
+    if lo > hi:
+        return 0
+    return _sum_below(root, hi, True) - _sum_below(root, lo, False)
+
+
+def rank(root: Optional[AVLNode], x: int) -> int:
+    #Кількість значень, строго менших за x (= індекс x у відсортованому списку)
+    count = 0
+    node = root
+    while node is not None:
+        if node.value < x:
+            count += _size(node.left) + 1
+            node = node.right
+        else:
+            node = node.left
+    return count
+
+
+def select(root: Optional[AVLNode], k: int) -> int:
+    #k-те найменше значення (k з 0), як sorted(values)[k]
+    if not 0 <= k < _size(root):
+        raise IndexError(f"select: k={k} поза межами [0, {_size(root)})")
+    node = root
+    while True:
+        left = _size(node.left)
+        if k < left:
+            node = node.left
+        elif k == left:
+            return node.value
+        else:
+            k -= left + 1
+            node = node.right
+
+
+# Ліниві впорядковані обходи
+
+def iter_inorder(root: Optional[BSTNode]) -> Iterator[int]:
+    #Значення за зростанням; у стеку лише шлях до поточного вузла
+    stack: List[BSTNode] = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node.value
+        node = node.right
+
+
+def iter_reverse(root: Optional[BSTNode]) -> Iterator[int]:
+    #Значення за спаданням — дзеркальний обхід (праве піддерево першим)
+    stack: List[BSTNode] = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.right
+        node = stack.pop()
+        yield node.value
+        node = node.left
+
+
+def range_iter(root: Optional[BSTNode], lo: Optional[int] = None, hi: Optional[int] = None) -> Iterator[int]:
+    #Значення v з lo <= v <= hi за зростанням (None — межі немає).
+    #Ліві піддерева вузлів < lo не відвідуються; обхід зупиняється на першому v > hi
+    stack: List[BSTNode] = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            if lo is not None and node.value < lo:
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+        if not stack:
+            return
+        node = stack.pop()
+        if hi is not None and node.value > hi:
+            return
+        yield node.value
+        node = node.right
+
+
+def successor(root: Optional[BSTNode], x: int) -> Optional[int]:
+    #Найменше значення > x (наступна сторінка при пагінації) або None
+    best = None
+    node = root
+    while node is not None:
+        if node.value > x:
+            best = node.value
+            node = node.left
+        else:
+            node = node.right
+    return best
+
+
+def predecessor(root: Optional[BSTNode], x: int) -> Optional[int]:
+    #Найбільше значення < x або None
+    best = None
+    node = root
+    while node is not None:
+        if node.value < x:
+            best = node.value
+            node = node.right
+        else:
+            node = node.left
+    return best
+
+
+# Масова побудова і злиття
+
+def bulk_load(values: Iterable[int], presorted: bool = False) -> Optional[AVLNode]:
+    #Корінь — середина відрізка, піддерева — середини половин; стек замість рекурсії.
+    #Дерево ідеально збалансоване, отже й коректне AVL (висоти, розміри, суми заповнені).
+    vals = [int(v) for v in values]
+    if not presorted:
+        vals.sort()
+    if not vals:
+        return None
+    nodes = [AVLNode(v) for v in vals]
+    order: List[int] = []  # порядок створення: батько раніше за нащадків
+    root_i = (len(vals) - 1) // 2
+    stack = [(0, len(vals) - 1, root_i)]
+    while stack:
+        lo, hi, mid = stack.pop()
+        order.append(mid)
+        node = nodes[mid]
+        if lo < mid:
+            left = (lo + mid - 1) // 2
+            node.left = nodes[left]
+            stack.append((lo, mid - 1, left))
+        if mid < hi:
+            right = (mid + 1 + hi) // 2
+            node.right = nodes[right]
+            stack.append((mid + 1, hi, right))
+    for i in reversed(order):  # нащадки раніше за батька — висоти/розміри/суми знизу вгору
+        _update(nodes[i])
+    return nodes[root_i]
+
+
+def merge_sorted(root: Optional[BSTNode], batch: Iterable[int], presorted: bool = False) -> Optional[AVLNode]:
+    #Злиття пакета з деревом: in-order дерева + (відсортований) пакет -> bulk_load, O(n + k)
+    extra = [int(v) for v in batch]
+    if not presorted:
+        extra.sort()
+    return bulk_load(heapq.merge(iter_inorder(root), extra), presorted=True)
+
+
+# Персистентне AVL-дерево (копіювання шляху)
+
+@dataclass(frozen=True)
+class PNode:
+    value: int
+    left: Optional["PNode"] = None
+    right: Optional["PNode"] = None
+    height: int = 1
+    size: int = 1
+    total: int = 0
+
+
+def _pnode(value: int, left: Optional[PNode], right: Optional[PNode]) -> PNode:
+    return PNode(
+        value, left, right,
+        1 + max(_height(left), _height(right)),
+        1 + _size(left) + _size(right),
+        value + _total(left) + _total(right),
+    )
+
+
+def _pbalance(value: int, left: Optional[PNode], right: Optional[PNode]) -> PNode:
+    #Як _rebalance, але повороти створюють нові вузли замість зміни старих
+    hl, hr = _height(left), _height(right)
+    if hl > hr + 1:
+        if _height(left.left) >= _height(left.right):
+            return _pnode(left.value, left.left, _pnode(value, left.right, right))
+        lr = left.right
+        return _pnode(lr.value, _pnode(left.value, left.left, lr.left), _pnode(value, lr.right, right))
+    if hr > hl + 1:
+        if _height(right.right) >= _height(right.left):
+            return _pnode(right.value, _pnode(value, left, right.left), right.right)
+        rl = right.left
+        return _pnode(rl.value, _pnode(value, left, rl.left), _pnode(right.value, rl.right, right.right))
+    return _pnode(value, left, right)
+
+
+def p_insert(root: Optional[PNode], value: int) -> PNode:
+    #Нова версія з value; root не змінюється (рівні значення — вправо, як в insert_bst)
+    if root is None:
+        return _pnode(value, None, None)
+    if value < root.value:
+        return _pbalance(root.value, p_insert(root.left, value), root.right)
+    return _pbalance(root.value, root.left, p_insert(root.right, value))
+
+
+def _p_delete_min(node: PNode) -> Tuple[Optional[PNode], int]:
+    if node.left is None:
+        return node.right, node.value
+    left, value = _p_delete_min(node.left)
+    return _pbalance(node.value, left, node.right), value
+
+
+def p_delete(root: Optional[PNode], value: int) -> Optional[PNode]:
+    #Нова версія без одного входження value (якщо його немає — той самий root)
+    if root is None:
+        return None
+    if value < root.value:
+        left = p_delete(root.left, value)
+        return root if left is root.left else _pbalance(root.value, left, root.right)
+    if value > root.value:
+        right = p_delete(root.right, value)
+        return root if right is root.right else _pbalance(root.value, root.left, right)
+    if root.left is None:
+        return root.right
+    if root.right is None:
+        return root.left
+    right, succ = _p_delete_min(root.right)
+    return _pbalance(succ, root.left, right)
+
+
+class PersistentTree:
+    #Один письменник за раз (внутрішній замок лише для записів), читачі — без замків:
+    #snapshot() повертає незмінний корінь, який ніхто вже не змінить
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self.root: Optional[PNode] = None
+        self._write_lock = threading.Lock()
+        for v in values:
+            self.insert(v)
+
+    def snapshot(self) -> Optional[PNode]:
+        return self.root
+
+    def insert(self, value: int) -> Optional[PNode]:
+        with self._write_lock:
+            self.root = p_insert(self.root, int(value))
+            return self.root
+
+    def delete(self, value: int) -> Optional[PNode]:
+        with self._write_lock:
+            self.root = p_delete(self.root, value)
+            return self.root
+
+    def __len__(self) -> int:
+        return _size(self.root)
+
+    def __contains__(self, value: int) -> bool:
+        return avl_search(self.root, value) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_inorder(self.root)
+
+
+class AVLTree:
+    #Обгортка над коренем AVL: зберігає розмір і дає зручні методи
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self.root: Optional[AVLNode] = None
+        self._len = 0
+        for v in values:
+            self.insert(v)
+
+    @classmethod
+    def bulk_load(cls, values: Iterable[int], presorted: bool = False) -> "AVLTree":
+        tree = cls()
+        tree.root = bulk_load(values, presorted)
+        tree._len = _size(tree.root)
+        return tree
+
+    def merge(self, batch: Iterable[int], presorted: bool = False) -> None:
+        #Вигідніше за поелементні insert, коли пакет порівнянний з розміром дерева
+        self.root = merge_sorted(self.root, batch, presorted)
+        self._len = _size(self.root)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[int]:
+        return iter_inorder(self.root)
+
+    def __reversed__(self) -> Iterator[int]:
+        return iter_reverse(self.root)
+
+    def range_iter(self, lo: Optional[int] = None, hi: Optional[int] = None) -> Iterator[int]:
+        return range_iter(self.root, lo, hi)
+
+    def successor(self, x: int) -> Optional[int]:
+        return successor(self.root, x)
+
+    def predecessor(self, x: int) -> Optional[int]:
+        return predecessor(self.root, x)
+
+    def __contains__(self, value: int) -> bool:
+        return self.search(value)
+
+    def insert(self, value: int) -> None:
+        self.root = avl_insert(self.root, int(value))
+        self._len += 1
+
+    def delete(self, value: int) -> bool:
+        #True, якщо значення було і його видалено
+        if not self.search(value):
+            return False
+        self.root = avl_delete(self.root, value)
+        self._len -= 1
+        return True
+
+    def search(self, value: int) -> bool:
+        return avl_search(self.root, value) is not None
+
+    def min(self) -> int:
+        return find_min_value(self.root)
+
+    def sum(self) -> int:
+        return sum_values(self.root)
+
+    def height(self) -> int:
+        return _height(self.root)
+
+    def range_sum(self, lo: int, hi: int) -> int:
+        return range_sum(self.root, lo, hi)
+
+    def rank(self, x: int) -> int:
+        return rank(self.root, x)
+
+    def select(self, k: int) -> int:
+        return select(self.root, k)
+
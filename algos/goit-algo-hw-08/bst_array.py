@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#Компактний BST на масивах: замість об'єкта BSTNode на кожен ключ —
+#три паралельні колонки (array('q') для значень, array('i') для лівих/правих
+#нащадків), вузол = індекс. ~16 байт на ключ проти >100 байт у BSTNode.
+#Видалені слоти йдуть у free-list (зв'язаний через колонку left) і
+#перевикористовуються наступними вставками.
+
+#Той самий API, що й у bst.py (дерево — ArrayBST замість кореня BSTNode):
+#- insert_bst(tree, value) -> ArrayBST : вставка (tree=None — нове дерево)
+#- build_bst(values) -> ArrayBST      : побудова зі списку
+#- find_min_value(tree) -> int        : мінімум
+#- sum_values(tree) -> int            : сума (підтримується при вставці/видаленні — O(1))
+
+from __future__ import annotations
+from array import array
+from typing import Iterable, Optional
+
+NIL = -1
+
+
+class ArrayBST:
+    __slots__ = ("keys", "left", "right", "root", "free", "count", "total")
+
+    def __init__(self) -> None:
+        self.keys = array("q")
+        self.left = array("i")
+        self.right = array("i")
+        self.root = NIL
+        self.free = NIL     # голова free-list; наступний вільний — у left[i]
+        self.count = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, value: int) -> bool:
+        return self._find(value)[0] != NIL
+
+    def _alloc(self, value: int) -> int:
+        i = self.free
+        if i != NIL:
+            self.keys[i] = value        #спершу запис: OverflowError/TypeError не має загубити слот
+            self.free = self.left[i]
+            self.left[i] = NIL
+            self.right[i] = NIL
+            return i
+        self.keys.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        return len(self.keys) - 1
+
+    def _release(self, i: int) -> None:
+        self.left[i] = self.free
+        self.right[i] = NIL
+        self.free = i
+
+    def insert(self, value: int) -> None:
+        #Як insert_bst: без балансування, рівні значення — вправо
+        keys, left, right = self.keys, self.left, self.right
+        node = self._alloc(value)
+        self.count += 1
+        self.total += value
+        if self.root == NIL:
+            self.root = node
+            return
+        cur = self.root
+        while True:
+            if value < keys[cur]:
+                nxt = left[cur]
+                if nxt == NIL:
+                    left[cur] = node
+                    return
+            else:
+                nxt = right[cur]
+                if nxt == NIL:
+                    right[cur] = node
+                    return
+            cur = nxt
+
+    def _find(self, value: int):
+        #(індекс вузла або NIL, індекс батька або NIL)
+        keys, left, right = self.keys, self.left, self.right
+        parent, cur = NIL, self.root
+        while cur != NIL:
+            k = keys[cur]
+            if value == k:
+                return cur, parent
+            parent, cur = cur, (left[cur] if value < k else right[cur])
+        return NIL, NIL
+
+    def _replace_child(self, parent: int, old: int, new: int) -> None:
+        if parent == NIL:
+            self.root = new
+        elif self.left[parent] == old:
+            self.left[parent] = new
+        else:
+            self.right[parent] = new
+
+    def delete(self, value: int) -> bool:
+        #Видаляє одне входження value; True, якщо воно було
+        node, parent = self._find(value)
+        if node == NIL:
+            return False
+        keys, left, right = self.keys, self.left, self.right
+        if left[node] != NIL and right[node] != NIL:
+            #два нащадки: значення наступника переносимо сюди, видаляємо наступника
+            sparent, succ = node, right[node]
+            while left[succ] != NIL:
+                sparent, succ = succ, left[succ]
+            keys[node] = keys[succ]
+            self._replace_child(sparent, succ, right[succ])
+            node = succ
+        else:
+            child = left[node] if left[node] != NIL else right[node]
+            self._replace_child(parent, node, child)
+        self._release(node)
+        self.count -= 1
+        self.total -= value
+        return True
+
+    def min(self) -> int:
+        if self.root == NIL:
+            raise ValueError("Дерево порожнє — немає мінімального значення.")
+        left = self.left
+        cur = self.root
+        while left[cur] != NIL:
+            cur = left[cur]
+        return self.keys[cur]
+
+    def nbytes(self) -> int:
+        #Пам'ять під колонки (без накладних витрат самих об'єктів array)
+        return sum(a.itemsize * len(a) for a in (self.keys, self.left, self.right))
+
+
+def insert_bst(tree: Optional[ArrayBST], value: int) -> ArrayBST:
+    if tree is None:
+        tree = ArrayBST()
+    tree.insert(int(value))
+    return tree
+
+
+def build_bst(values: Iterable[int]) -> ArrayBST:
+    tree = ArrayBST()
+    for v in values:
+        tree.insert(int(v))
+    return tree
+
+
+def find_min_value(tree: Optional[ArrayBST]) -> int:
+    if tree is None:
+        raise ValueError("Дерево порожнє — немає мінімального значення.")
+    return tree.min()
+
+
+def sum_values(tree: Optional[ArrayBST]) -> int:
+    return tree.total if tree is not None else 0
@@ -13,9 +13,21 @@
 #- min_total_cost_cables(lengths) -> (total_cost, steps)
 #де steps — список кроків [(a, b, a+b), ...] у порядку з'єднань
 
+#Лінійний режим (дві черги, як у класичному алгоритмі Хаффмана для відсортованих ваг):
+#- min_total_cost_cables_linear(lengths, presorted=False, with_steps=True)
+#  черга 1 — відсортовані довжини, черга 2 — результати з'єднань; вони з'являються
+#  в неспадному порядку, тож мінімум завжди на початку однієї з черг — O(n) після сортування.
+#  Цілі довжини з невеликим діапазоном сортуються підрахунком (O(n + діапазон)),
+#  інші — sorted(). with_steps=False не зберігає кроки (для 10^8 кабелів).
+
 from __future__ import annotations
 import heapq
-from typing import Iterable, List, Tuple
+from array import array
+from itertools import chain, repeat
+from typing import Iterable, Iterator, List, Tuple
+
+#підрахунок вигідний, поки масив лічильників не більший за max(n, цього порогу)
+COUNTING_MIN_RANGE = 1 << 16
 
 def min_total_cost_cables(lengths: Iterable[int]) -> Tuple[int, List[Tuple[int, int, int]]]:
     # підготуємо мін-купу
@@ -40,4 +52,89 @@ def min_total_cost_cables(lengths: Iterable[int]) -> Tuple[int, List[Tuple[int,
         steps.append((a, b, cost))
         heapq.heappush(heap, cost)
 
-    return total_cost, steps
\ No newline at end of file
+    return total_cost, steps
+
+
+def _sorted_lengths(lengths: Iterable[int]) -> Tuple[Iterator[int], int, int]:
+    #(ітератор довжин за зростанням, кількість, максимум). Цілі з вузьким діапазоном —
+    #сортування підрахунком: лічильники, а видача — repeat(v, k) без розгортання в список
+    vals = lengths if isinstance(lengths, (list, tuple, array)) else list(lengths)
+    n = len(vals)
+    if n == 0:
+        return iter(()), 0, 0
+    lo, hi = min(vals), max(vals)
+    if lo < 0:
+        raise ValueError("Довжини кабелів мають бути невід'ємні.")
+    if isinstance(lo, int) and isinstance(hi, int) and hi - lo < max(n, COUNTING_MIN_RANGE):
+        counts = [0] * (hi - lo + 1)
+        try:
+            if lo == 0:
+                for x in vals:
+                    counts[x] += 1
+            else:
+                for x in vals:
+                    counts[x - lo] += 1
+        except TypeError:
+            pass  # не всі довжини цілі — звичайне сортування
+        else:
+            return chain.from_iterable(repeat(v + lo, k) for v, k in enumerate(counts) if k), n, hi
+    return iter(sorted(int(x) for x in vals)), n, int(hi)
+
+
+def min_total_cost_cables_linear(
+    lengths: Iterable[int],
+    presorted: bool = False,
+    with_steps: bool = True,
+) -> Tuple[int, List[Tuple[int, int, int]]]:
+    #Та сама відповідь, що й min_total_cost_cables, але без купи: дві черги.
+    #presorted=True — довжини вже за зростанням (перевіряється по ходу)
+    if presorted:
+        vals = lengths if isinstance(lengths, (list, tuple, array)) else list(lengths)
+        n = len(vals)
+        if n and vals[0] < 0:
+            raise ValueError("Довжини кабелів мають бути невід'ємні.")
+        # int() — як у версії з купою і в _sorted_lengths (array('q') не приймає float)
+        leaves = vals if isinstance(vals, array) and vals.typecode in "bBhHiIlLqQ" else map(int, vals)
+        leaves, hi = iter(leaves), (int(vals[-1]) if n else 0)
+    else:
+        leaves, n, hi = _sorted_lengths(lengths)
+    if n <= 1:
+        return 0, []
+
+    #черга з'єднань: результати додаються в кінець у неспадному порядку, читаються з
+    #голови; прочитаний префікс періодично відрізається. Будь-яка сума <= n * max,
+    #тож якщо це влазить у int64 — компактний array('q'), інакше список
+    merged = array("q") if n * hi < 1 << 63 else []
+    head = 0
+    leaf = next(leaves)
+    leaves_left = n
+    total_cost = 0
+    steps: List[Tuple[int, int, int]] = []
+
+    def take() -> int:
+        nonlocal leaf, leaves_left, head
+        #мінімум — голова однієї з черг (при рівності — довжина з черги 1)
+        if leaves_left and (head == len(merged) or leaf <= merged[head]):
+            x = leaf
+            leaves_left -= 1
+            if leaves_left:
+                leaf = next(leaves)
+                if leaf < x:
+                    raise ValueError("presorted=True, але довжини не відсортовані.")
+            return x
+        x = merged[head]
+        head += 1
+        return x
+
+    for _ in range(n - 1):
+        a = take()
+        b = take()
+        cost = a + b
+        total_cost += cost
+        if with_steps:
+            steps.append((a, b, cost))
+        merged.append(cost)
+        if head > 4096 and head * 2 > len(merged):
+            del merged[:head]
+            head = 0
+    return total_cost, steps
@@ -10,8 +10,8 @@ from __future__ import annotations
 import argparse
 from typing import List
 
-from bst import build_bst, find_min_value, sum_values
-from heap_cables import min_total_cost_cables
+from bst import AVLTree, build_bst, find_min_value, sum_values, tree_height
+from heap_cables import min_total_cost_cables, min_total_cost_cables_linear
 
 
 def parse_args() -> argparse.Namespace:
@@ -32,7 +32,11 @@ def demo_bst(values: List[int]) -> None:
 
     #Завдання 2: сума значень
     total = sum_values(root)
-    print(f"[sum] Сума всіх значень у BST: {total}\n")
+    print(f"[sum] Сума всіх значень у BST: {total}")
+
+    #Те саме на AVL: мінімум і сума збігаються, висота — O(log n)
+    avl = AVLTree(values)
+    print(f"[avl] min={avl.min()}, sum={avl.sum()}, висота AVL {avl.height()} проти BST {tree_height(root)}\n")
 
 
 def demo_heap_cables(lengths: List[int]) -> None:
@@ -42,7 +46,11 @@ def demo_heap_cables(lengths: List[int]) -> None:
     print("[кроки] порядок з'єднання (a + b -> cost):")
     for i, (a, b, c) in enumerate(steps, 1):
         print(f"  {i:>2}: {a} + {b} -> {c}")
-    print(f"[result] Мінімальна сумарна вартість: {total_cost}\n")
+    print(f"[result] Мінімальна сумарна вартість: {total_cost}")
+
+    #Той самий результат без купи — дві черги за O(n) після сортування
+    linear_cost, _ = min_total_cost_cables_linear(lengths, with_steps=False)
+    print(f"[linear] Дві черги: {linear_cost}\n")
 
 def main() -> None:
     args = parse_args()
@@ -0,0 +1,128 @@
+# tests/test_bplustree.py
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import bplustree  # noqa: E402
+from bplustree import BPlusTree, max_fanout  # noqa: E402
+
+
+def check_ranges(tree, model, rnd, queries=100):
+    model = sorted(model)
+    assert list(tree) == model
+    for _ in range(queries):
+        lo, hi = sorted((rnd.randint(-10, 1010), rnd.randint(-10, 1010)))
+        assert list(tree.range(lo, hi)) == [v for v in model if lo <= v <= hi]
+    assert list(tree.range(None, 100)) == [v for v in model if v <= 100]
+    assert list(tree.range(900)) == [v for v in model if v >= 900]
+
+
+# --------------------------------- B+ дерево (user-048) --------------------------------- #
+
+@pytest.mark.parametrize("fanout", [3, 4, 7])
+def test_splits_with_tiny_cache(tmp_path, fanout):
+    rnd = random.Random(fanout)
+    model = [rnd.randint(0, 1000) for _ in range(3000)]
+    with BPlusTree(tmp_path / "t.bpt", fanout=fanout, cache_pages=4) as tree:
+        for v in model:
+            tree.insert(v)
+        assert len(tree) == len(model) and tree.sum() == sum(model) and tree.min() == min(model)
+        assert tree.height() >= 4  # кілька рівнів внутрішніх сторінок
+        check_ranges(tree, model, rnd)
+
+
+def test_duplicates_spanning_many_leaves(tmp_path):
+    model = [5] * 200 + [3] * 50 + [7] * 50
+    random.Random(481).shuffle(model)
+    with BPlusTree(tmp_path / "dup.bpt", fanout=3, cache_pages=4) as tree:
+        for v in model:
+            tree.insert(v)
+        assert list(tree.range(5, 5)) == [5] * 200  # 200 ключів на десятках листків
+        assert list(tree.range(4, 6)) == [5] * 200
+        assert list(tree.range(3, 3)) == [3] * 50 and list(tree.range(7)) == [7] * 50
+
+
+def test_reopen_after_close_and_keep_inserting(tmp_path):
+    path = tmp_path / "persist.bpt"
+    rnd = random.Random(482)
+    model = [rnd.randint(0, 1000) for _ in range(2000)]
+    tree = BPlusTree(path, fanout=5, cache_pages=8)
+    for v in model[:1000]:
+        tree.insert(v)
+    tree.close()
+    tree.close()  # повторне закриття — без помилки
+
+    with BPlusTree(path, cache_pages=4) as tree:  # fanout читається з файлу
+        assert tree.fanout == 5 and len(tree) == 1000 and tree.sum() == sum(model[:1000])
+        check_ranges(tree, model[:1000], rnd, queries=20)
+        for v in model[1000:]:
+            tree.insert(v)
+    with BPlusTree(path) as tree:
+        check_ranges(tree, model, rnd)
+        assert tree.sum() == sum(model) and tree.min() == min(model)
+
+
+def test_large_values_grow_file_and_default_fanout(tmp_path):
+    rnd = random.Random(483)
+    model = [rnd.randint(-(2**63), 2**63 - 1) for _ in range(20_000)]
+    with BPlusTree(tmp_path / "big.bpt", cache_pages=4) as tree:
+        assert tree.fanout == max_fanout()
+        for v in model:
+            tree.insert(v)
+        assert list(tree) == sorted(model)
+        assert tree.sum() == sum(model)  # сума ширша за int64 — зберігається в 16 байтах
+    with BPlusTree(tmp_path / "big.bpt") as tree:
+        assert tree.sum() == sum(model)
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        BPlusTree(tmp_path / "a.bpt", fanout=2)
+    with pytest.raises(ValueError):
+        BPlusTree(tmp_path / "b.bpt", fanout=max_fanout() + 1)
+    foreign = tmp_path / "c.bpt"
+    foreign.write_bytes(b"not a tree" * 100)
+    with pytest.raises(ValueError):
+        BPlusTree(foreign)
+    with BPlusTree(tmp_path / "d.bpt") as tree:
+        assert list(tree) == [] and tree.sum() == 0 and tree.height() == 1
+        with pytest.raises(ValueError):
+            tree.min()
+
+
+def test_failed_open_closes_file_and_mmap(tmp_path, monkeypatch):
+    opened, maps = [], []
+    real_open, real_mmap = open, bplustree.mmap.mmap
+
+    def tracking_open(*args, **kwargs):
+        opened.append(real_open(*args, **kwargs))
+        return opened[-1]
+
+    def tracking_mmap(*args, **kwargs):
+        maps.append(real_mmap(*args, **kwargs))
+        return maps[-1]
+
+    monkeypatch.setattr(bplustree, "open", tracking_open, raising=False)
+    monkeypatch.setattr(bplustree.mmap, "mmap", tracking_mmap)
+    short = tmp_path / "short.bpt"
+    short.write_bytes(b"x")  # заголовок обірвано — struct.error
+    foreign = tmp_path / "foreign.bpt"
+    foreign.write_bytes(b"not a tree" * 100)
+    for path, kwargs, exc in [(short, {}, Exception), (foreign, {}, ValueError),
+                              (tmp_path / "new.bpt", {"fanout": 2}, ValueError)]:
+        with pytest.raises(exc):
+            BPlusTree(path, **kwargs)
+    assert len(opened) == 3 and all(f.closed for f in opened)
+    assert all(m.closed for m in maps)
+    # mmap уже створено, а падає запис першої сторінки
+    monkeypatch.setattr(BPlusTree, "_write_meta", lambda self: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        BPlusTree(tmp_path / "late.bpt")
+    assert opened[-1].closed and maps and maps[-1].closed
@@ -0,0 +1,228 @@
+# tests/test_bst.py
+import math
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import bst  # noqa: E402
+from bst import AVLTree  # noqa: E402
+
+
+def inorder(node):
+    return inorder(node.left) + [node.value] + inorder(node.right) if node is not None else []
+
+
+def check_avl(node):
+    """Перевіряє баланс і доповнення (height/size/total) кожного вузла; повертає висоту."""
+    if node is None:
+        return 0
+    hl, hr = check_avl(node.left), check_avl(node.right)
+    assert abs(hl - hr) <= 1
+    assert node.height == 1 + max(hl, hr)
+    assert node.size == 1 + bst._size(node.left) + bst._size(node.right)
+    assert node.total == node.value + bst._total(node.left) + bst._total(node.right)
+    return node.height
+
+
+def check_tree(tree, expected):
+    expected = sorted(expected)
+    assert inorder(tree.root) == expected
+    check_avl(tree.root)
+    assert len(tree) == len(expected)
+    # висота AVL <= 1.44·log2(n + 2)
+    assert tree.height() <= 1.45 * math.log2(len(expected) + 2)
+
+
+# ------------------------------------ AVL (user-043) ------------------------------------ #
+
+def test_sorted_input_stays_logarithmic():
+    tree = AVLTree(range(10_000))
+    check_tree(tree, range(10_000))
+    assert bst.tree_height(bst.build_bst(range(300))) == 300  # звичайний BST вироджується
+
+
+def test_random_inserts_and_deletes_with_duplicates():
+    rnd = random.Random(43)
+    tree, model = AVLTree(), []
+    for _ in range(3000):
+        v = rnd.randint(0, 60)
+        if rnd.random() < 0.6:
+            tree.insert(v)
+            model.append(v)
+        else:
+            assert tree.delete(v) == (v in model)
+            if v in model:
+                model.remove(v)
+        assert (v in tree) == (v in model)
+    check_tree(tree, model)
+    assert tree.min() == min(model) and tree.sum() == sum(model)
+
+
+def test_empty_tree():
+    tree = AVLTree()
+    assert len(tree) == 0 and tree.height() == 0 and tree.sum() == 0
+    assert not tree.delete(1) and 1 not in tree
+    with pytest.raises(ValueError):
+        tree.min()
+
+
+# ------------------------- range_sum / rank / select (user-044) ------------------------- #
+
+def test_order_statistics_match_sorted_list():
+    rnd = random.Random(44)
+    values = [rnd.randint(-50, 50) for _ in range(500)]
+    tree = AVLTree(values)
+    for v in values[:200]:  # видалення теж мають підтримувати size/total
+        tree.delete(v)
+    model = sorted(values[200:])
+    check_tree(tree, model)
+    for _ in range(300):
+        lo, hi = sorted((rnd.randint(-60, 60), rnd.randint(-60, 60)))
+        assert tree.range_sum(lo, hi) == sum(v for v in model if lo <= v <= hi)
+        assert tree.range_sum(hi, lo) == (sum(v for v in model if v == lo) if lo == hi else 0)
+        x = rnd.randint(-60, 60)
+        assert tree.rank(x) == sum(1 for v in model if v < x)
+    assert [tree.select(k) for k in range(len(model))] == model
+    for k in (-1, len(model)):
+        with pytest.raises(IndexError):
+            tree.select(k)
+
+
+def test_sum_values_on_plain_and_augmented_trees():
+    values = list(range(5000))  # вироджений BST — без рекурсії
+    assert bst.sum_values(bst.build_bst(values)) == sum(values)
+    assert bst.sum_values(AVLTree(values).root) == sum(values)
+    assert bst.sum_values(None) == 0
+
+
+# ------------------------------ bulk_load / merge (user-046) ------------------------------ #
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 8, 100, 1023, 5000])
+def test_bulk_load_is_balanced_and_augmented(n):
+    rnd = random.Random(n)
+    values = [rnd.randint(0, n) for _ in range(n)]
+    tree = AVLTree.bulk_load(values)
+    check_tree(tree, values)
+    assert tree.height() == (n.bit_length() if n else 0)  # ідеальний баланс
+    assert list(AVLTree.bulk_load(sorted(values), presorted=True)) == sorted(values)
+
+
+def test_merge_then_update_keeps_invariants():
+    rnd = random.Random(46)
+    base = [rnd.randint(0, 1000) for _ in range(800)]
+    batch = [rnd.randint(0, 1000) for _ in range(500)]
+    tree = AVLTree(base)
+    tree.merge(batch)
+    check_tree(tree, base + batch)
+    tree.merge(sorted(batch), presorted=True)
+    tree.insert(-1)
+    tree.delete(base[0])
+    model = sorted(base + batch + batch + [-1])
+    model.remove(base[0])
+    check_tree(tree, model)
+    assert bst.merge_sorted(None, []) is None
+
+
+# --------------------------- ліниві обходи і сусіди (user-047) --------------------------- #
+
+@pytest.mark.parametrize("make", [AVLTree, lambda vs: bst.build_bst(vs)], ids=["avl", "plain"])
+def test_lazy_iteration_ranges_and_neighbours(make):
+    rnd = random.Random(47)
+    values = [rnd.randint(0, 100) for _ in range(400)]
+    tree = make(values)
+    root = tree.root if isinstance(tree, AVLTree) else tree
+    model = sorted(values)
+    assert list(bst.iter_inorder(root)) == model
+    assert list(bst.iter_reverse(root)) == model[::-1]
+    for _ in range(200):
+        lo, hi = sorted((rnd.randint(-5, 105), rnd.randint(-5, 105)))
+        assert list(bst.range_iter(root, lo, hi)) == [v for v in model if lo <= v <= hi]
+        x = rnd.randint(-5, 105)
+        assert bst.successor(root, x) == min((v for v in model if v > x), default=None)
+        assert bst.predecessor(root, x) == max((v for v in model if v < x), default=None)
+    assert list(bst.range_iter(root, None, 10)) == [v for v in model if v <= 10]
+    assert list(bst.range_iter(root, 90)) == [v for v in model if v >= 90]
+
+
+def test_iterators_are_lazy_on_deep_trees():
+    plain = bst.build_bst(range(3000))  # вироджене дерево глибше за ліміт рекурсії
+    it = bst.iter_inorder(plain)
+    assert next(it) == 0 and next(it) == 1
+    tree = AVLTree(range(1000))
+    assert list(tree) == list(range(1000)) and list(reversed(tree)) == list(range(999, -1, -1))
+    assert tree.successor(999) is None and tree.predecessor(0) is None
+    assert list(tree.range_iter(10, 12)) == [10, 11, 12]
+
+
+# ------------------------- персистентне дерево (user-049) ------------------------- #
+
+def test_old_versions_never_change():
+    rnd = random.Random(49)
+    versions, models = [None], [[]]
+    for _ in range(600):
+        root, model = versions[-1], list(models[-1])
+        v = rnd.randint(0, 50)
+        if rnd.random() < 0.65:
+            root = bst.p_insert(root, v)
+            model.append(v)
+        else:
+            new = bst.p_delete(root, v)
+            if v in model:
+                model.remove(v)
+            else:
+                assert new is root  # нічого не видалено — та сама версія
+            root = new
+        versions.append(root)
+        models.append(model)
+    for root, model in zip(versions, models):
+        assert inorder(root) == sorted(model)
+        check_avl(root)
+    last = versions[-1]
+    assert bst.sum_values(last) == sum(models[-1])
+    assert bst.range_sum(last, 10, 20) == sum(v for v in models[-1] if 10 <= v <= 20)
+    with pytest.raises(Exception):
+        last.value = 1  # frozen
+
+
+def test_path_copying_shares_untouched_subtrees():
+    tree = bst.PersistentTree(range(1023))
+    before = tree.snapshot()
+    after = tree.insert(2000)
+    assert before.left is after.left  # вставка праворуч не чіпає ліве піддерево
+    assert list(bst.iter_inorder(before)) == list(range(1023))
+    assert len(tree) == 1024 and 2000 in tree and bst.successor(before, 1022) is None
+
+
+def test_readers_see_consistent_snapshots_during_writes():
+    import threading
+
+    tree = bst.PersistentTree(range(0, 2000, 2))
+    errors = []
+    stop = threading.Event()
+
+    def reader():
+        while not stop.is_set():
+            snap = tree.snapshot()
+            values = list(bst.iter_inorder(snap))
+            if values != sorted(values) or len(values) != bst._size(snap) or sum(values) != bst.sum_values(snap):
+                errors.append(len(values))
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    for t in readers:
+        t.start()
+    for v in range(1, 2000, 2):
+        tree.insert(v)
+    for v in range(0, 2000, 4):
+        tree.delete(v)
+    stop.set()
+    for t in readers:
+        t.join()
+    assert errors == []
+    assert list(tree) == sorted(set(range(2000)) - set(range(0, 2000, 4)))
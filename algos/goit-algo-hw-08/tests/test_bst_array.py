@@ -0,0 +1,90 @@
+# tests/test_bst_array.py
+import os
+import random
+import sys
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import bst_array  # noqa: E402
+from bst_array import NIL, ArrayBST  # noqa: E402
+
+
+def inorder(tree):
+    out, stack, cur = [], [], tree.root
+    while stack or cur != NIL:
+        while cur != NIL:
+            stack.append(cur)
+            cur = tree.left[cur]
+        cur = stack.pop()
+        out.append(tree.keys[cur])
+        cur = tree.right[cur]
+    return out
+
+
+# ------------------------------ ArrayBST (user-045) ------------------------------ #
+
+def test_matches_model_under_random_inserts_and_deletes():
+    rnd = random.Random(45)
+    tree, model = ArrayBST(), []
+    for _ in range(3000):
+        v = rnd.randint(0, 80)
+        if rnd.random() < 0.55:
+            tree.insert(v)
+            model.append(v)
+        else:
+            assert tree.delete(v) == (v in model)
+            if v in model:
+                model.remove(v)
+        assert (v in tree) == (v in model)
+    assert inorder(tree) == sorted(model)
+    assert len(tree) == len(model) and tree.total == sum(model)
+    if model:
+        assert tree.min() == min(model)
+
+
+def test_free_list_reuses_slots():
+    tree = bst_array.build_bst(range(100))
+    capacity = len(tree.keys)
+    for v in range(0, 100, 2):
+        tree.delete(v)
+    for v in range(1000, 1050):
+        tree.insert(v)
+    assert len(tree.keys) == capacity  # нові вузли — у звільнених слотах
+    assert inorder(tree) == list(range(1, 100, 2)) + list(range(1000, 1050))
+    assert tree.nbytes() == capacity * (8 + 4 + 4)
+
+
+def test_rejected_value_keeps_free_list_intact():
+    tree = bst_array.build_bst(range(10))
+    for v in range(0, 10, 2):
+        tree.delete(v)
+    for bad in (2**63, -2**63 - 1, 1.5):
+        with pytest.raises((OverflowError, TypeError)):
+            tree.insert(bad)
+    assert len(tree) == 5 and bst_array.sum_values(tree) == 1 + 3 + 5 + 7 + 9
+    capacity = len(tree.keys)
+    for v in range(100, 105):  # усі 5 звільнених слотів досі доступні
+        tree.insert(v)
+    assert len(tree.keys) == capacity
+    assert inorder(tree) == [1, 3, 5, 7, 9, 100, 101, 102, 103, 104]
+    with pytest.raises(OverflowError):
+        tree.insert(2**63)  # free-list порожній — падає append, колонки не розходяться
+    assert len(tree.keys) == len(tree.left) == len(tree.right) == capacity
+
+
+def test_module_api_mirrors_bst():
+    tree = None
+    for v in (5, 3, 8, 3):
+        tree = bst_array.insert_bst(tree, v)
+    assert bst_array.find_min_value(tree) == 3
+    assert bst_array.sum_values(tree) == 19
+    assert bst_array.sum_values(None) == 0
+    with pytest.raises(ValueError):
+        bst_array.find_min_value(None)
+    with pytest.raises(ValueError):
+        ArrayBST().min()
@@ -0,0 +1,65 @@
+# tests/test_heap_cables.py
+import os
+import random
+import sys
+from array import array
+
+import pytest
+
+# Додати теку завдання у шлях імпортів
+ROOT = os.path.dirname(os.path.dirname(__file__))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from heap_cables import min_total_cost_cables, min_total_cost_cables_linear  # noqa: E402
+
+
+def check_steps(lengths, steps):
+    """Кроки — коректна послідовність з'єднань: кожен бере два наявні кабелі."""
+    pool = sorted(int(x) for x in lengths)
+    for a, b, c in steps:
+        pool.remove(a)
+        pool.remove(b)
+        assert c == a + b
+        pool.append(c)
+    assert len(pool) <= 1
+
+
+# ------------------------- дві черги замість купи (user-050) ------------------------- #
+
+@pytest.mark.parametrize("hi", [1, 10, 1000, 2**40])
+def test_linear_matches_heap(hi):
+    rnd = random.Random(hi)
+    for n in list(range(0, 8)) + [100, 5000]:
+        lengths = [rnd.randint(0, hi) for _ in range(n)]
+        expected, _ = min_total_cost_cables(lengths)
+        total, steps = min_total_cost_cables_linear(lengths)
+        assert total == expected
+        check_steps(lengths, steps)
+        assert min_total_cost_cables_linear(sorted(lengths), presorted=True)[0] == expected
+        assert min_total_cost_cables_linear(array("q", lengths), with_steps=False) == (expected, [])
+
+
+def test_overflowing_sums_and_generators():
+    lengths = [2**62, 2**62, 2**62, 3]  # суми не влазять в int64 — черга стає списком
+    assert min_total_cost_cables_linear(lengths)[0] == min_total_cost_cables(lengths)[0]
+    assert min_total_cost_cables_linear(iter([4, 3, 2, 6]))[0] == 29
+
+
+def test_float_lengths_in_every_mode():
+    lengths = [1.5, 2.5, 3.7]
+    expected = min_total_cost_cables(lengths)
+    assert min_total_cost_cables_linear(lengths) == expected
+    assert min_total_cost_cables_linear(sorted(lengths), presorted=True) == expected
+    assert min_total_cost_cables_linear([1.5, 2.5], presorted=True) == (3, [(1, 2, 3)])
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        min_total_cost_cables_linear([3, -1])
+    with pytest.raises(ValueError):
+        min_total_cost_cables_linear([-1, 3], presorted=True)
+    with pytest.raises(ValueError):
+        min_total_cost_cables_linear([1, 5, 2, 8], presorted=True)  # не відсортовано
+    assert min_total_cost_cables_linear([]) == (0, [])
+    assert min_total_cost_cables_linear([7]) == (0, [])